@@ -1,15 +1,24 @@
 from typing import List
 from camel.agents import ChatAgent
-from camel.toolkits import FunctionTool, GithubToolkit, CodeExecutionToolkit
+from camel.toolkits import FunctionTool, CodeExecutionToolkit
 from tools.jira_tools import JiraTools
 from prompts.dev_agent_prompt import DEV_AGENT_PROMPT
 from config.model_config import get_model
 from config.settings import settings
+from tools.telemetry import instrument_tools
 import logging
 
 logger = logging.getLogger(__name__)
 
 from tools.progress_tracker import progress_tracker
+from tools.repo_mirror import repo_mirror
+from tools.github_tools import get_github_toolkit
+from tools.github_budget import budgeted_tools
+from tools.batch_reader import BatchFileReader
+from tools.code_search import code_search
+from tools.dependency_graph import dependency_graph
+from tools.symbol_index import symbol_index
+from tools.github_client import github_client
 import os
 import uuid
 from camel.interpreters import DockerInterpreter
@@ -155,11 +164,16 @@ def log_command_progress(command: str) -> str:
         wrapped_command = f'/bin/sh -c "{escaped_command}"'
         
         result = orig_tool.func(wrapped_command)
+        # The command may have created, changed or deleted workspace files
+        code_search.invalidate_workspace()
         
         # Log result
         progress_tracker.add_log("dev", f"Output: {str(result)[:500]}")
         if milestone:
             progress_tracker.update_step("dev", milestone, "completed")
+        if milestone == "Commit & Push":
+            # Branches and commits changed upstream
+            github_client.invalidate("/repos/")
             
         return result
     except Exception as e:
@@ -185,17 +199,28 @@ code_tools.extend([
 
 # Initialize GitHub Tools
 github_tools_list = []
-# Force use the hardcoded token
-gh_token = settings.GITHUB_ACCESS_TOKEN
 try:
-    gh_toolkit = GithubToolkit(access_token=gh_token)
-    github_tools_list = gh_toolkit.get_tools()
+    github_tools_list = budgeted_tools(get_github_toolkit())
     logger.info(f"GitHub tools hardcoded for Developer Agent.")
 except Exception as e:
     logger.warning(f"Failed to initialize GitHub tools for Dev Agent: {e}")
 
+# Local mirror tools (repo reads and workspace checkouts without re-cloning from GitHub)
+mirror_tools_list = [
+    FunctionTool(repo_mirror.checkout_repo),
+    FunctionTool(repo_mirror.list_repo_files),
+    FunctionTool(repo_mirror.read_repo_file),
+    FunctionTool(BatchFileReader("dev").read_files),
+    FunctionTool(repo_mirror.diff_repo_refs),
+    FunctionTool(symbol_index.find_symbol),
+    FunctionTool(symbol_index.who_imports),
+    FunctionTool(symbol_index.files_for_route),
+    FunctionTool(code_search.search_code),
+    FunctionTool(dependency_graph.get_dependents),
+]
+
 # Retrieve the model
-model = get_model()
+model = get_model("dev")
 
 # Initialize Figma tools
 from tools.figma_tools import FigmaTools
@@ -212,7 +237,7 @@ if settings.FIGMA_ACCESS_TOKEN:
 dev_agent = ChatAgent(
     system_message=DEV_AGENT_PROMPT,
     model=model,
-    tools=jira_dev_tools + code_tools + github_tools_list + figma_dev_tools,
+    tools=instrument_tools(jira_dev_tools + code_tools + mirror_tools_list + github_tools_list + figma_dev_tools, "dev"),
     step_timeout=600  # 10 minutes to handle npm install, git operations, etc.
 )
 
@@ -1,12 +1,19 @@
 from typing import List
 from camel.agents import ChatAgent
-from camel.toolkits import FunctionTool, GithubToolkit, CodeExecutionToolkit
+from camel.toolkits import FunctionTool, CodeExecutionToolkit
 from tools.jira_tools import JiraTools
 from prompts.qa_agent_prompt import QA_AGENT_PROMPT
 from config.model_config import get_model
 from config.settings import settings
+from tools.telemetry import instrument_tools
 import logging
 from tools.progress_tracker import progress_tracker
+from tools.repo_mirror import repo_mirror
+from tools.github_tools import get_github_toolkit
+from tools.github_budget import budgeted_tools
+from tools.batch_reader import BatchFileReader
+from tools.code_search import code_search
+from tools.dependency_graph import dependency_graph
 import os
 import uuid
 from camel.interpreters import DockerInterpreter
@@ -56,6 +63,7 @@ jira_tools = JiraTools()
 jira_qa_tools = [
     FunctionTool(jira_tools.get_ticket),
     FunctionTool(jira_tools.create_ticket),  # QA needs to create bugs/subtasks
+    FunctionTool(jira_tools.create_tickets_bulk),
     FunctionTool(jira_tools.add_comment),
     FunctionTool(jira_tools.update_ticket_status),
     FunctionTool(report_task_progress),
@@ -152,6 +160,8 @@ def execute_command(command: str) -> str:
         wrapped_command = f'/bin/sh -c "{escaped_command}"'
         
         result = orig_tool.func(wrapped_command)
+        # The command may have created, changed or deleted workspace files
+        code_search.invalidate_workspace()
         
         # Log result
         progress_tracker.add_log("qa", f"Output: {str(result)[:500]}")
@@ -178,20 +188,30 @@ for tool in code_toolkit.get_tools():
 
 # --- GitHub Tools ---
 github_tools_list = []
-gh_token = settings.GITHUB_ACCESS_TOKEN
 try:
-    gh_toolkit = GithubToolkit(access_token=gh_token)
-    github_tools_list = gh_toolkit.get_tools()
+    github_tools_list = budgeted_tools(get_github_toolkit())
 except Exception as e:
     logger.warning(f"Failed to initialize GitHub tools for QA Agent: {e}")
 
+# Local mirror tools (repo reads and workspace checkouts without re-cloning from GitHub)
+mirror_tools_list = [
+    FunctionTool(repo_mirror.checkout_repo),
+    FunctionTool(repo_mirror.list_repo_files),
+    FunctionTool(repo_mirror.read_repo_file),
+    FunctionTool(BatchFileReader("qa").read_files),
+    FunctionTool(repo_mirror.diff_repo_refs),
+    FunctionTool(code_search.search_code),
+    FunctionTool(dependency_graph.get_dependents),
+    FunctionTool(dependency_graph.get_change_impact),
+]
+
 # Retrieve the model
-model = get_model()
+model = get_model("qa")
 
 # Create QA Agent
 qa_agent = ChatAgent(
     system_message=QA_AGENT_PROMPT,
     model=model,
-    tools=jira_qa_tools + code_tools + github_tools_list,
+    tools=instrument_tools(jira_qa_tools + code_tools + mirror_tools_list + github_tools_list, "qa"),
     step_timeout=600  # 10 minutes for long running tests
 )
@@ -1,10 +1,18 @@
 from camel.agents import ChatAgent
-from camel.toolkits import FunctionTool, GithubToolkit
+from camel.toolkits import FunctionTool
 from tools.jira_tools import JiraTools
 from tools.figma_tools import FigmaTools
+from tools.repo_mirror import repo_mirror
+from tools.github_tools import get_github_toolkit
+from tools.github_budget import budgeted_tools
+from tools.batch_reader import BatchFileReader
+from tools.code_search import code_search
+from tools.dependency_graph import dependency_graph
+from tools.symbol_index import symbol_index
 from prompts.specs_agent_prompt import SPECS_AGENT_PROMPT
 from config.model_config import get_model
 from config.settings import settings
+from tools.telemetry import instrument_tools
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,6 +23,8 @@ jira_tools = JiraTools()
 # Wrap Jira methods as CAMEL FunctionTools
 jira_tools_list = [
     FunctionTool(jira_tools.propose_ticket),
+    FunctionTool(jira_tools.find_similar_tickets),
+    FunctionTool(jira_tools.create_tickets_bulk),
     FunctionTool(jira_tools.get_ticket),
     FunctionTool(jira_tools.update_ticket_status),
     FunctionTool(jira_tools.update_ticket),
@@ -40,20 +50,31 @@ else:
 github_tools_list = []
 if settings.GITHUB_ACCESS_TOKEN:
     try:
-        gh_toolkit = GithubToolkit(access_token=settings.GITHUB_ACCESS_TOKEN)
-        github_tools_list = gh_toolkit.get_tools()
+        github_tools_list = budgeted_tools(get_github_toolkit())
         logger.info("GitHub tools enabled for Specs Agent.")
     except Exception as e:
         logger.warning(f"Failed to initialize GitHub tools for agent: {e}")
 else:
     logger.info("GitHub tools disabled (no token provided).")
 
+# Local mirror tools (repository reads without GitHub API round trips)
+mirror_tools_list = [
+    FunctionTool(repo_mirror.list_repo_files),
+    FunctionTool(repo_mirror.read_repo_file),
+    FunctionTool(BatchFileReader("specs").read_files),
+    FunctionTool(symbol_index.find_symbol),
+    FunctionTool(symbol_index.who_imports),
+    FunctionTool(symbol_index.files_for_route),
+    FunctionTool(code_search.search_code),
+    FunctionTool(dependency_graph.get_dependents),
+]
+
 # Get centralized model configuration (always uses Azure 5.1 as per requirements)
-model = get_model()
+model = get_model("specs")
 
 # Create Specs Agent with all tools
 specs_agent = ChatAgent(
     system_message=SPECS_AGENT_PROMPT,
     model=model,
-    tools=jira_tools_list + github_tools_list + figma_tools_list
+    tools=instrument_tools(jira_tools_list + mirror_tools_list + github_tools_list + figma_tools_list, "specs")
 )
@@ -1,22 +1,338 @@
-from camel.models import ModelFactory
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+from openai import AzureOpenAI
+from camel.models import ModelFactory, BaseModelBackend
 from camel.types import ModelPlatformType
 from camel.configs import ChatGPTConfig
 from config.settings import settings
+from logging_config.logger import logger
+from tools.llm_governor import llm_governor
+from tools.telemetry import record_model_call
+
+# Value types for the per-agent overlays read from the environment
+_OVERLAY_TYPES = {"temperature": float, "max_tokens": int}
+
+# "agent:turn_type" -> tier. Lookup order: exact, "*:turn", "agent:*", then heavy.
+DEFAULT_MODEL_ROUTES = {
+    "*:chat": "heavy",
+    "*:tool_followup": "heavy",
+    "*:plan": "light",
+}
+
+# Tool results after which the next turn is a planning turn (e.g. choosing a checklist)
+PLANNING_TOOLS = {"get_ticket"}
+
+
+class ModelRouter:
+    """
+    Maps (agent, turn type) to a model tier via configuration, escalating to the
+    heavy tier on tool-heavy turns and retrying truncated or empty light answers
+    on heavy. Keeps per-tier latency, token and cost accounting.
+    """
+
+    def __init__(self, routes: Dict[str, str], costs: Dict[str, List[float]],
+                 escalate_tool_calls: int):
+        self.routes = {**DEFAULT_MODEL_ROUTES, **routes}
+        self.costs = costs
+        self.escalate_tool_calls = escalate_tool_calls
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+        # agent name -> cached vs uncached prompt tokens and prefix stability
+        self._cache_stats: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def _turn_tool_calls(messages: List[Dict[str, Any]]) -> List[List[str]]:
+        """Tool-call batches (by name) issued since the last user message, oldest first."""
+        batches = []
+        for message in reversed(messages):
+            if message.get("role") == "user":
+                break
+            if message.get("role") == "assistant" and message.get("tool_calls"):
+                batches.append([tc.get("function", {}).get("name") for tc in message["tool_calls"]])
+        return list(reversed(batches))
+
+    def classify(self, messages: List[Dict[str, Any]]) -> str:
+        batches = self._turn_tool_calls(messages)
+        if not batches:
+            return "chat"
+        if all(name in PLANNING_TOOLS for name in batches[-1]):
+            return "plan"
+        return "tool_followup"
+
+    def route(self, agent_name: str, turn_type: str, tool_calls: int = 0) -> str:
+        tier = (self.routes.get(f"{agent_name}:{turn_type}")
+                or self.routes.get(f"*:{turn_type}")
+                or self.routes.get(f"{agent_name}:*")
+                or "heavy")
+        if tier != "heavy" and tool_calls >= self.escalate_tool_calls:
+            return "heavy"
+        return tier
+
+    @staticmethod
+    def _is_low_confidence(result: Any) -> bool:
+        """A light-tier answer that was cut off or came back empty is retried on heavy."""
+        choices = getattr(result, "choices", None)
+        if not choices:
+            return False
+        choice = choices[0]
+        if getattr(choice, "finish_reason", None) == "length":
+            return True
+        message = getattr(choice, "message", None)
+        return message is not None and not message.content and not getattr(message, "tool_calls", None)
+
+    @staticmethod
+    def _prefix_fingerprint(messages: List[Dict[str, Any]], tools: Optional[List[Dict[str, Any]]]) -> str:
+        """Hash of the system prompt + tool schemas, i.e. the part provider caching can reuse."""
+        system = [m.get("content") for m in messages if m.get("role") == "system"]
+        payload = json.dumps([system, tools or []], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def record_prompt_cache(self, agent_name: str, fingerprint: str, result: Any):
+        """Tracks cached vs uncached prompt tokens per call and flags prefix changes."""
+        usage = getattr(result, "usage", None)
+        prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", 0) or 0
+        with self._lock:
+            stats = self._cache_stats.setdefault(agent_name, {
+                "calls": 0, "prompt_tokens": 0, "cached_tokens": 0, "prefix_changes": 0, "prefix": fingerprint,
+            })
+            if stats["prefix"] != fingerprint:
+                stats["prefix_changes"] += 1
+                stats["prefix"] = fingerprint
+                logger.warning(f"Static prompt prefix changed for '{agent_name}' agent; provider cache will miss.")
+            stats["calls"] += 1
+            stats["prompt_tokens"] += prompt_tokens
+            stats["cached_tokens"] += cached_tokens
+        logger.debug(f"[{agent_name}] prompt tokens: {prompt_tokens} ({cached_tokens} cached, "
+                     f"{prompt_tokens - cached_tokens} uncached)")
+
+    def record(self, tier: str, latency: float, result: Any, escalated: bool = False):
+        usage = getattr(result, "usage", None)
+        prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+        completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+        prompt_cost, completion_cost = self.costs.get(tier, [0.0, 0.0])
+        with self._lock:
+            stats = self._stats.setdefault(tier, {
+                "calls": 0, "escalations": 0, "total_latency": 0.0,
+                "prompt_tokens": 0, "completion_tokens": 0, "cost_usd": 0.0,
+            })
+            stats["calls"] += 1
+            stats["escalations"] += int(escalated)
+            stats["total_latency"] += latency
+            stats["prompt_tokens"] += prompt_tokens
+            stats["completion_tokens"] += completion_tokens
+            stats["cost_usd"] += (prompt_tokens * prompt_cost + completion_tokens * completion_cost) / 1000.0
+
+    def dispatch(self, agent_name: str, runners: Dict[str, Callable], messages: List[Dict[str, Any]],
+                 response_format=None, tools=None):
+        """Runs one model call on the routed tier. `runners` maps tier -> backend run()."""
+        turn_type = self.classify(messages)
+        tool_calls = sum(len(batch) for batch in self._turn_tool_calls(messages))
+        tier = self.route(agent_name, turn_type, tool_calls)
+        if tier not in runners:
+            tier = "heavy"
+
+        fingerprint = self._prefix_fingerprint(messages, tools)
+
+        start = time.perf_counter()
+        result = runners[tier](messages, response_format, tools)
+        self.record(tier, time.perf_counter() - start, result)
+        self.record_prompt_cache(agent_name, fingerprint, result)
+
+        if tier != "heavy" and self._is_low_confidence(result):
+            logger.info(f"Escalating {agent_name}:{turn_type} from {tier} to heavy (low confidence).")
+            start = time.perf_counter()
+            result = runners["heavy"](messages, response_format, tools)
+            self.record("heavy", time.perf_counter() - start, result, escalated=True)
+            self.record_prompt_cache(agent_name, fingerprint, result)
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "tiers": {
+                    tier: {**stats, "avg_latency": stats["total_latency"] / stats["calls"] if stats["calls"] else 0.0}
+                    for tier, stats in self._stats.items()
+                },
+                "prompt_cache": {
+                    agent: {
+                        **{k: v for k, v in stats.items() if k != "prefix"},
+                        "uncached_tokens": stats["prompt_tokens"] - stats["cached_tokens"],
+                        "hit_rate": stats["cached_tokens"] / stats["prompt_tokens"] if stats["prompt_tokens"] else 0.0,
+                    }
+                    for agent, stats in self._cache_stats.items()
+                },
+            }
+
+
+# Global router instance
+model_router = ModelRouter(
+    routes=settings.MODEL_ROUTES,
+    costs=settings.MODEL_TIER_COSTS,
+    escalate_tool_calls=settings.MODEL_ESCALATE_TOOL_CALLS,
+)
+
+
+class ModelRegistry:
+    """
+    Process-wide registry of CAMEL model backends for Azure OpenAI.
+    All agents share one pooled HTTP client (keep-alive, optional HTTP/2), so
+    connection setup to the Azure endpoint happens once per process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._http_client: Optional[httpx.Client] = None
+        # deployment name -> AzureOpenAI client bound to the shared pool
+        self._clients: Dict[str, AzureOpenAI] = {}
+        # agent name -> model backend (runs are dispatched through the router)
+        self._models: Dict[str, BaseModelBackend] = {}
+
+    @property
+    def endpoint(self) -> str:
+        return f"https://{settings.AZURE_OPENAI_RESOURCE}.openai.azure.com"
+
+    def _get_http_client(self) -> httpx.Client:
+        if self._http_client is None:
+            http2 = settings.AZURE_OPENAI_HTTP2
+            if http2:
+                try:
+                    import h2  # noqa: F401
+                except ImportError:
+                    logger.warning("HTTP/2 requested for model client but 'h2' is not installed. Using HTTP/1.1 keep-alive.")
+                    http2 = False
+
+            self._http_client = httpx.Client(
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=settings.AZURE_OPENAI_POOL_SIZE,
+                    max_keepalive_connections=settings.AZURE_OPENAI_POOL_SIZE,
+                    keepalive_expiry=settings.AZURE_OPENAI_KEEPALIVE_SECONDS,
+                ),
+                timeout=httpx.Timeout(settings.AZURE_OPENAI_TIMEOUT, connect=10.0),
+            )
+            logger.info(f"Model HTTP pool created (size={settings.AZURE_OPENAI_POOL_SIZE}, http2={http2}).")
+        return self._http_client
+
+    def _get_client(self, deployment: str) -> AzureOpenAI:
+        """Returns the AzureOpenAI client for a deployment, sharing the HTTP pool."""
+        if deployment not in self._clients:
+            self._clients[deployment] = AzureOpenAI(
+                azure_endpoint=self.endpoint,
+                azure_deployment=deployment,
+                api_version=settings.AZURE_OPENAI_API_VERSION,
+                api_key=settings.AZURE_OPENAI_API_KEY,
+                timeout=settings.AZURE_OPENAI_TIMEOUT,
+                max_retries=0,  # Retries are owned by the rate governor
+                http_client=self._get_http_client(),
+            )
+        return self._clients[deployment]
+
+    def _build_config(self, agent_name: str) -> Dict[str, Any]:
+        config: Dict[str, Any] = {
+            "temperature": 0.0,
+            "max_tokens": settings.AZURE_OPENAI_MAX_TOKENS,
+        }
+        for key, value in settings.AGENT_MODEL_OVERLAYS.get(agent_name, {}).items():
+            config[key] = _OVERLAY_TYPES.get(key, str)(value)
+        return ChatGPTConfig(**config).as_dict()
+
+    def _govern(self, model: BaseModelBackend, agent_name: str):
+        """Routes every model call of this backend through the shared rate governor."""
+        lane = "interactive" if agent_name in settings.LLM_INTERACTIVE_AGENTS else "background"
+        run = model.run
+        max_tokens = model.model_config_dict.get("max_tokens") or 0
+
+        def governed_run(messages, response_format=None, tools=None):
+            # Azure counts prompt + max_tokens against TPM; ~4 characters per token
+            estimate = sum(len(str(m.get("content") or "")) for m in messages) // 4 + max_tokens
+            return llm_governor.call(run, messages, response_format, tools, lane=lane, tokens=estimate)
+
+        model.run = governed_run
+
+    def _create(self, agent_name: str, tier: str) -> BaseModelBackend:
+        """Creates a governed backend for one agent on one tier's deployment."""
+        deployment = settings.MODEL_TIERS.get(tier) or settings.AZURE_OPENAI_MODEL
+        model = ModelFactory.create(
+            model_platform=ModelPlatformType.AZURE,
+            model_type=deployment,  # Deployment name
+            model_config_dict=self._build_config(agent_name),
+            url=self.endpoint,
+            api_key=settings.AZURE_OPENAI_API_KEY,
+            api_version=settings.AZURE_OPENAI_API_VERSION,
+            client=self._get_client(deployment),
+        )
+        self._govern(model, agent_name)
+        return model
+
+    def get(self, agent_name: str = "default") -> BaseModelBackend:
+        """
+        Returns the model backend for an agent, creating it on first use.
+        Agent overlays (temperature, max tokens) are applied on top of the defaults,
+        and each call is routed to a tier by `model_router`.
+        """
+        with self._lock:
+            if agent_name not in self._models:
+                model = self._create(agent_name, "heavy")
+                runners = {"heavy": model.run}
+                for tier, deployment in settings.MODEL_TIERS.items():
+                    if tier == "heavy":
+                        continue
+                    # Tiers sharing the heavy deployment reuse its backend
+                    same = deployment == settings.MODEL_TIERS.get("heavy")
+                    runners[tier] = model.run if same else self._create(agent_name, tier).run
+
+                def routed_run(messages, response_format=None, tools=None):
+                    started_at, start = time.time(), time.perf_counter()
+                    result, error = None, None
+                    try:
+                        result = model_router.dispatch(agent_name, runners, messages, response_format, tools)
+                        return result
+                    except Exception as e:
+                        error = str(e)
+                        raise
+                    finally:
+                        # Agent names double as ProgressTracker task ids ("specs", "dev", "qa")
+                        record_model_call(agent_name, str(model.model_type), started_at,
+                                          time.perf_counter() - start, result,
+                                          llm_governor.last_call_retries(), error)
+
+                model.run = routed_run
+                self._models[agent_name] = model
+                logger.info(f"Model backend registered for '{agent_name}' agent (tiers: {settings.MODEL_TIERS}).")
+            return self._models[agent_name]
+
+    def warm_up(self) -> bool:
+        """
+        Opens a pooled connection (DNS, TCP, TLS) to the Azure endpoint so the first
+        agent call doesn't pay for it. Any HTTP response counts as warm.
+        """
+        if not settings.AZURE_OPENAI_RESOURCE:
+            return False
+        try:
+            self._get_http_client().get(self.endpoint, timeout=10.0)
+            logger.info("Model HTTP pool warmed up.")
+            return True
+        except httpx.HTTPError as e:
+            logger.warning(f"Model endpoint warm-up failed: {e}")
+            return False
+
+    def close(self):
+        """Closes the shared HTTP pool on shutdown."""
+        if self._http_client is not None:
+            self._http_client.close()
+
+
+# Global registry instance
+model_registry = ModelRegistry()
+
 
-def get_model():
-    """Returns a configured CAMEL model instance for Azure OpenAI 5.1."""
-
-    model_config = ChatGPTConfig(
-        temperature=0.0,
-    )
-
-    model = ModelFactory.create(
-        model_platform=ModelPlatformType.AZURE,
-        model_type=settings.AZURE_OPENAI_MODEL,  # Deployment name
-        model_config_dict=model_config.as_dict(),
-        url=f"https://{settings.AZURE_OPENAI_RESOURCE}.openai.azure.com",
-        api_key=settings.AZURE_OPENAI_API_KEY,
-        api_version=settings.AZURE_OPENAI_API_VERSION,
-    )
-    
-    return model
+def get_model(agent_name: str = "default") -> BaseModelBackend:
+    """Returns the shared, configured CAMEL model instance for Azure OpenAI 5.1."""
+    return model_registry.get(agent_name)
@@ -1,8 +1,22 @@
 import os
+import json
 from dotenv import load_dotenv
+from logging_config.logger import logger
 
 load_dotenv()
 
+
+def _json_env(name: str, default):
+    """Parses a JSON setting; a malformed value is logged and the default used instead."""
+    raw = os.getenv(name)
+    if not raw:
+        return default
+    try:
+        return json.loads(raw)
+    except ValueError as e:
+        logger.warning(f"Ignoring malformed {name} ({e}); using the default.")
+        return default
+
 class Settings:
     # Azure OpenAI GPT-5.1 Settings
     AZURE_OPENAI_API_KEY = os.getenv("GPT51_AZURE_OPENAI_API_KEY")
@@ -10,16 +24,83 @@ class Settings:
     AZURE_OPENAI_MODEL = os.getenv("GPT51_OPENAI_MODEL")
     AZURE_OPENAI_API_VERSION = os.getenv("GPT51_OPENAI_API_VERSION")
     AZURE_OPENAI_MAX_TOKENS = int(os.getenv("GPT51_MAX_TOKENS", 8000))
+    AZURE_OPENAI_TIMEOUT = float(os.getenv("GPT51_TIMEOUT", 180))
+    # Retries of a failed model call; applied by the LLM rate governor, not the OpenAI client
+    AZURE_OPENAI_MAX_RETRIES = int(os.getenv("GPT51_MAX_RETRIES", 2))
+
+    # Shared HTTP connection pool for all model clients
+    AZURE_OPENAI_POOL_SIZE = int(os.getenv("GPT51_POOL_SIZE", 10))
+    AZURE_OPENAI_KEEPALIVE_SECONDS = float(os.getenv("GPT51_KEEPALIVE_SECONDS", 120))
+    AZURE_OPENAI_HTTP2 = os.getenv("GPT51_HTTP2", "true").lower() == "true"
+
+    # Per-agent model overlays, e.g. GPT51_DEV_MAX_TOKENS=16000 or GPT51_SPECS_TEMPERATURE=0.2
+    AGENT_MODEL_OVERLAYS = {
+        agent: {
+            key: value for key, value in {
+                "temperature": os.getenv(f"GPT51_{agent.upper()}_TEMPERATURE"),
+                "max_tokens": os.getenv(f"GPT51_{agent.upper()}_MAX_TOKENS"),
+            }.items() if value is not None
+        }
+        for agent in ("specs", "dev", "qa")
+    }
+
+    # LLM rate governor (shared by all agents; match the deployment's quota)
+    LLM_REQUESTS_PER_MINUTE = int(os.getenv("LLM_REQUESTS_PER_MINUTE", 60))
+    LLM_TOKENS_PER_MINUTE = int(os.getenv("LLM_TOKENS_PER_MINUTE", 150000))
+    LLM_INTERACTIVE_AGENTS = os.getenv("LLM_INTERACTIVE_AGENTS", "specs").split(",")
+
+    # Model tiers (deployment names). The light tier falls back to the main deployment.
+    MODEL_TIERS = {
+        "heavy": AZURE_OPENAI_MODEL,
+        "light": os.getenv("GPT51_LIGHT_MODEL") or AZURE_OPENAI_MODEL,
+    }
+    # USD per 1K (prompt, completion) tokens per tier, for cost accounting
+    MODEL_TIER_COSTS = _json_env("MODEL_TIER_COSTS", {"heavy": [0.00125, 0.01], "light": [0.00025, 0.002]})
+    # Routing overrides as JSON, e.g. {"dev:plan": "heavy", "specs:chat": "light"}
+    MODEL_ROUTES = _json_env("MODEL_ROUTES", {})
+    MODEL_ESCALATE_TOOL_CALLS = int(os.getenv("MODEL_ESCALATE_TOOL_CALLS", 4))
     
     # Jira Settings
     JIRA_API_TOKEN = os.getenv("JIRA_API_TOKEN")
     JIRA_BASE_URL = os.getenv("JIRA_BASE_URL")
     JIRA_EMAIL = os.getenv("JIRA_EMAIL")
     JIRA_PROJECT_KEY = os.getenv("JIRA_PROJECT_KEY")
+    JIRA_TIMEOUT = float(os.getenv("JIRA_TIMEOUT", 30))
+    JIRA_MAX_RETRIES = int(os.getenv("JIRA_MAX_RETRIES", 3))
+    JIRA_POOL_SIZE = int(os.getenv("JIRA_POOL_SIZE", 10))
+    # Seconds between serverInfo health checks
+    JIRA_HEALTH_TTL = float(os.getenv("JIRA_HEALTH_TTL", 60))
+    # Seconds a fetched ticket is served from the shared cache
+    JIRA_TICKET_CACHE_TTL = float(os.getenv("JIRA_TICKET_CACHE_TTL", 30))
+    # Seconds a project's workflow transitions are reused before being re-read
+    JIRA_TRANSITION_CACHE_TTL = float(os.getenv("JIRA_TRANSITION_CACHE_TTL", 3600))
+    # Local SQLite mirror of the project's issues: seconds between incremental syncs (0 disables)
+    # and between passes that drop issues deleted in Jira
+    JIRA_MIRROR_PATH = os.getenv("JIRA_MIRROR_PATH", ".cache/jira_mirror.db")
+    JIRA_MIRROR_INTERVAL = float(os.getenv("JIRA_MIRROR_INTERVAL", 60))
+    JIRA_MIRROR_RECONCILE_INTERVAL = float(os.getenv("JIRA_MIRROR_RECONCILE_INTERVAL", 3600))
+    # Agent comments on a ticket within this many quiet seconds are posted as one comment;
+    # posts are spaced by JIRA_COMMENT_MIN_INTERVAL and retried JIRA_COMMENT_MAX_RETRIES times
+    JIRA_COMMENT_WINDOW = float(os.getenv("JIRA_COMMENT_WINDOW", 3))
+    JIRA_COMMENT_MIN_INTERVAL = float(os.getenv("JIRA_COMMENT_MIN_INTERVAL", 1))
+    JIRA_COMMENT_MAX_RETRIES = int(os.getenv("JIRA_COMMENT_MAX_RETRIES", 3))
 
     # GitHub Settings
     GITHUB_ACCESS_TOKEN = os.getenv("GITHUB_ACCESS_TOKEN")
     GITHUB_DEFAULT_REPO = os.getenv("GITHUB_DEFAULT_REPO", "SyedQasimGardezi/Agentic_E2E_Developement")
+    GITHUB_API_URL = os.getenv("GITHUB_API_URL", "https://api.github.com")
+    # TTL (seconds) before cached GitHub metadata is revalidated with a conditional request
+    GITHUB_CACHE_TTL = float(os.getenv("GITHUB_CACHE_TTL", 60))
+    GITHUB_CACHE_MAX_ENTRIES = int(os.getenv("GITHUB_CACHE_MAX_ENTRIES", 1000))
+    # Seconds before a GitHub REST call gives up (connect and read)
+    GITHUB_TIMEOUT = float(os.getenv("GITHUB_TIMEOUT", 30))
+    # REST calls kept for interactive routes; agent calls are paced once the budget drops below GITHUB_THROTTLE_BELOW
+    GITHUB_RATE_RESERVE = int(os.getenv("GITHUB_RATE_RESERVE", 200))
+    GITHUB_THROTTLE_BELOW = float(os.getenv("GITHUB_THROTTLE_BELOW", 0.3))
+    # Local bare mirrors of connected repositories
+    REPO_MIRROR_DIR = os.getenv("REPO_MIRROR_DIR", ".cache/mirrors")
+    # Persisted code indexes (symbols, imports, routes) built from the mirrors
+    REPO_INDEX_DIR = os.getenv("REPO_INDEX_DIR", ".cache/index")
     
     # Git User Settings (for commits)
     GIT_USER_EMAIL = os.getenv("GIT_USER_EMAIL", JIRA_EMAIL)
@@ -29,5 +110,12 @@ class Settings:
     FIGMA_ACCESS_TOKEN = os.getenv("FIGMA_ACCESS_TOKEN")
     FIGMA_TEAM_ID = os.getenv("FIGMA_TEAM_ID")
     FIGMA_PROJECT_ID = os.getenv("FIGMA_PROJECT_ID")
+    # Override to point the Figma tools at another endpoint (e.g. tests/fake_services.py)
+    FIGMA_API_URL = os.getenv("FIGMA_API_URL", "https://api.figma.com/v1")
+
+    # Route handlers run integration calls in worker threads; at most this many at once per integration
+    JIRA_CONCURRENCY = int(os.getenv("JIRA_CONCURRENCY", 8))
+    GITHUB_CONCURRENCY = int(os.getenv("GITHUB_CONCURRENCY", 8))
+    FIGMA_CONCURRENCY = int(os.getenv("FIGMA_CONCURRENCY", 4))
 
 settings = Settings()
@@ -56,6 +56,17 @@ const ProposalCard = ({ data, onApprove, onCancel }) => {
             </div>
 
             <div className="modal-body">
+                {data.similar_tickets?.length > 0 && (
+                  <div style={{background: '#fffbeb', border: '1px solid #fde68a', borderRadius: 8, padding: '10px 12px', fontSize: '0.8rem'}}>
+                    <div style={{fontWeight: 700, color: '#b45309', marginBottom: 4}}>Possible duplicates</div>
+                    {data.similar_tickets.map(t => (
+                      <div key={t.key} style={{color: 'var(--text-secondary)'}}>
+                        <strong>{t.key}</strong> {t.summary} <span style={{opacity: 0.7}}>({t.status}, {Math.round(t.score * 100)}%)</span>
+                      </div>
+                    ))}
+                  </div>
+                )}
+
                 <div style={{display: 'flex', flexDirection: 'column', gap: 6}}>
                   <label style={{fontSize: '0.75rem', fontWeight: 700, color: 'var(--text-secondary)', textTransform: 'uppercase'}}>Summary</label>
                   <input 
@@ -92,26 +92,42 @@ export const fetchGithubDetails = async () => {
     }
 };
 
-export const fetchGithubRepos = async () => {
+export const fetchGithubRepos = async (q = '') => {
+    // Repos come in pages; follow X-Next-Cursor so every repo (matching q) can be picked
+    const repos = [];
+    let cursor = null;
     try {
-        const res = await fetch(`${API_BASE}/github/repos`);
-        if (!res.ok) return [];
-        return await res.json();
+        do {
+            const params = new URLSearchParams({ limit: '100' });
+            if (q) params.set('q', q);
+            if (cursor) params.set('cursor', cursor);
+            const res = await fetch(`${API_BASE}/github/repos?${params}`);
+            if (!res.ok) break;
+            repos.push(...await res.json());
+            cursor = res.headers.get('X-Next-Cursor');
+        } while (cursor);
     } catch (err) {
         console.error("Failed to fetch github repos", err);
-        return [];
     }
+    return repos;
 };
 
 export const fetchGithubBranches = async () => {
+    // Branches come in pages; follow X-Next-Cursor so every branch can be picked
+    const branches = [];
+    let cursor = null;
     try {
-        const res = await fetch(`${API_BASE}/github/branches`);
-        if (!res.ok) return [];
-        return await res.json();
+        do {
+            const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : '';
+            const res = await fetch(`${API_BASE}/github/branches${query}`);
+            if (!res.ok) break;
+            branches.push(...await res.json());
+            cursor = res.headers.get('X-Next-Cursor');
+        } while (cursor);
     } catch (err) {
         console.error("Failed to fetch github branches", err);
-        return [];
     }
+    return branches;
 };
 
 export const createGithubRepo = async (name, description, isPrivate) => {
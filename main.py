@@ -8,13 +8,27 @@ from logging_config.logger import logger
 from fastapi import WebSocket, WebSocketDisconnect
 from fastapi.staticfiles import StaticFiles
 import os
+import anyio
 from tools.websocket_manager import manager
+from tools.integration_executor import integration_executor
+from tools.jira_mirror import jira_mirror
+from tools.comment_writer import comment_writer
+from config.settings import settings
+from config.model_config import model_registry
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("🚀 Agentic E2E Backend is starting...")
+    # Open the shared model connection pool before the first agent call
+    await anyio.to_thread.run_sync(model_registry.warm_up)
     logger.info("📡 Swagger UI available at http://localhost:8000/docs")
+    # Keep the local Jira mirror that serves the board and the agents' ticket reads in sync
+    if settings.JIRA_MIRROR_INTERVAL > 0 and settings.JIRA_API_TOKEN:
+        jira_mirror.start(jira.jira_tools)
     yield
+    comment_writer.flush()
+    jira_mirror.stop()
+    model_registry.close()
 
 app = FastAPI(title="Agentic E2E Backend", lifespan=lifespan)
 
@@ -25,6 +39,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Include routers
@@ -67,7 +82,8 @@ async def health_check():
             "agent": "active",
             "jira": "active",
             "github": "active"
-        }
+        },
+        "integrations": integration_executor.get_stats()
     }
 
 if __name__ == "__main__":
@@ -1,6 +1,6 @@
 from .ticket import JiraTicket
 from .github import GitHubRepo, GitHubBranch
-from .agent_state import AgentStep, AgentTaskProgress
+from .agent_state import AgentStep, AgentTaskProgress, AgentTiming
 from .proposal import TicketProposal
 
-__all__ = ["JiraTicket", "GitHubRepo", "GitHubBranch", "AgentStep", "AgentTaskProgress", "TicketProposal"]
+__all__ = ["JiraTicket", "GitHubRepo", "GitHubBranch", "AgentStep", "AgentTaskProgress", "AgentTiming", "TicketProposal"]
@@ -1,5 +1,9 @@
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Optional, Literal
+from typing import Deque, List, Optional, Literal
+
+# Timings kept per task; long-lived tasks such as the specs chat keep only the most recent calls
+MAX_TIMINGS = 2000
 
 @dataclass
 class AgentStep:
@@ -25,6 +29,34 @@ class AgentStep:
             "failed_tests": self.failed_tests
         }
 
+@dataclass
+class AgentTiming:
+    """
+    Represents one instrumented model call or tool call within an agent task.
+    """
+    kind: Literal["model", "tool"]
+    name: str
+    started_at: float
+    duration: float
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    retries: int = 0
+    result_size: Optional[int] = None
+    error: Optional[str] = None
+
+    def to_dict(self):
+        return {
+            "kind": self.kind,
+            "name": self.name,
+            "started_at": self.started_at,
+            "duration": self.duration,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "retries": self.retries,
+            "result_size": self.result_size,
+            "error": self.error
+        }
+
 @dataclass
 class AgentTaskProgress:
     """
@@ -34,11 +66,13 @@ class AgentTaskProgress:
     steps: List[AgentStep] = field(default_factory=list)
     logs: List[str] = field(default_factory=list)
     final_response: Optional[str] = None
+    timings: Deque[AgentTiming] = field(default_factory=lambda: deque(maxlen=MAX_TIMINGS))
 
     def to_dict(self):
         return {
             "task_id": self.task_id,
             "steps": [s.to_dict() for s in self.steps],
             "logs": self.logs,
-            "final_response": self.final_response
+            "final_response": self.final_response,
+            "timings": [t.to_dict() for t in self.timings]
         }
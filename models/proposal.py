@@ -12,6 +12,8 @@ class TicketProposal:
     story_points: Optional[int] = None
     labels: List[str] = field(default_factory=lambda: ["agent-core"])
     parent_key: Optional[str] = None
+    # Existing tickets that look like duplicates: [{"key", "summary", "status", "score"}]
+    similar_tickets: List[dict] = field(default_factory=list)
 
     def to_dict(self):
         return {
@@ -21,5 +23,6 @@ class TicketProposal:
             "issue_type": self.issue_type,
             "story_points": self.story_points,
             "labels": self.labels,
-            "parent_key": self.parent_key
+            "parent_key": self.parent_key,
+            "similar_tickets": self.similar_tickets
         }
@@ -9,6 +9,9 @@ from routes.github import github_tools
 from routes.figma import figma_tools as figma_service
 from config.settings import settings
 from tools.progress_tracker import progress_tracker
+from tools.llm_governor import llm_governor
+from tools.comment_writer import comment_writer
+from config.model_config import model_router
 from logging_config.logger import logger
 import anyio
 
@@ -22,6 +25,15 @@ session_state = AgentSessionState()
 def _sync_agent_step(agent, message):
     return agent.step(message)
 
+def _with_context(message: str, context: str) -> str:
+    """
+    Appends the dynamic [CONTEXT] block after the user's text, so the system prompt
+    and tool schemas stay a byte-identical prefix that provider caching can reuse.
+    """
+    if not context:
+        return message
+    return f"{message}\n\n{context.strip()}"
+
 import asyncio
 
 async def run_agent_task(agent, message: str, task_id: str, metadata: dict = None):
@@ -31,8 +43,13 @@ async def run_agent_task(agent, message: str, task_id: str, metadata: dict = Non
     try:
         # Run the blocking agent.step in a separate thread
         response = await anyio.to_thread.run_sync(_sync_agent_step, agent, message)
+        # Post buffered Jira comments before the task is reported done or handed off
+        await anyio.to_thread.run_sync(comment_writer.flush)
         final_text = response.msg.content if response.msg else "Task processed."
         progress_tracker.set_final_response(task_id, final_text)
+        timings = progress_tracker.get_timings(task_id)
+        progress_tracker.add_log(task_id, f"⏱️ Model time {timings['model_time']:.1f}s ({timings['model']['calls']} calls), "
+                                          f"tool time {timings['tool_time']:.1f}s.")
         
         # --- CHAINING LOGIC ---
         # 1. If DEV agent finishes successfully, Trigger QA
@@ -84,6 +101,16 @@ async def run_agent_task(agent, message: str, task_id: str, metadata: dict = Non
 async def get_agent_progress(task_id: str = "dev"):
     return progress_tracker.get_progress(task_id)
 
+@router.get("/progress/timings")
+async def get_agent_timings(task_id: str = "dev"):
+    """Per-task timing breakdown of every model call and tool call."""
+    return progress_tracker.get_timings(task_id)
+
+@router.get("/llm/stats")
+async def get_llm_stats():
+    """Rate governor state, per-tier latency/cost and cached vs uncached prompt tokens."""
+    return {**llm_governor.get_stats(), **model_router.get_stats()}
+
 @router.post("/chat", response_model=ChatResponse)
 async def chat_with_agent(request: ChatRequest, background_tasks: BackgroundTasks):
     """
@@ -119,7 +146,7 @@ async def chat_with_agent(request: ChatRequest, background_tasks: BackgroundTask
             
             # Enhanced context for Dev Agent
             context_msg = ""
-            # Only add context preamble if memory was just reset or it's the first message
+            # Only add context if memory was just reset or it's the first message
             if len(dev_agent.memory.get_context()) == 0: 
                  context_msg = f"[CONTEXT] Active Repository: {repo}. Jira Project: {jira_project}. Figma Context: {active_figma}. "
                  if ticket_key:
@@ -128,7 +155,7 @@ async def chat_with_agent(request: ChatRequest, background_tasks: BackgroundTask
                  if repo == "NOT_CONNECTED":
                      context_msg += "Warning: No repository linked. "
             
-            full_message = context_msg + request.message
+            full_message = _with_context(request.message, context_msg)
             
             # Start implementation in background
             background_tasks.add_task(run_agent_task, dev_agent, full_message, "dev", request.metadata)
@@ -148,7 +175,7 @@ async def chat_with_agent(request: ChatRequest, background_tasks: BackgroundTask
             if ticket_key:
                 context_msg += f"Verify Ticket: {ticket_key}. "
             
-            request.message = context_msg + request.message
+            request.message = _with_context(request.message, context_msg)
             
             # Start QA in background
             background_tasks.add_task(run_agent_task, qa_agent, request.message, "qa", request.metadata)
@@ -164,10 +191,11 @@ async def chat_with_agent(request: ChatRequest, background_tasks: BackgroundTask
             if repo == "NOT_CONNECTED":
                 context_msg += "Note: No repository is currently linked. "
             
-            request.message = context_msg + request.message
+            request.message = _with_context(request.message, context_msg)
             
-            # Specs Agent remains synchronous as it is usually fast
-            response = specs_agent.step(request.message)
+            # Specs replies inline, but the step runs in a worker thread: model calls may wait out rate-limit backoff
+            response = await anyio.to_thread.run_sync(_sync_agent_step, specs_agent, request.message)
+            await anyio.to_thread.run_sync(comment_writer.flush)
             final_text = response.msg.content if response.msg else "Task processed."
             return ChatResponse(
                 response=final_text,
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException, Depends
 from tools.figma_tools import FigmaTools
+from tools.integration_executor import integration_executor
 from logging_config.logger import logger
 from pydantic import BaseModel
 from typing import Optional
@@ -47,7 +48,7 @@ async def connect_file(request: ConnectFileRequest):
             figma_tools.access_token = request.access_token
         
         # Use depth=1 to avoid huge payloads when just verifying connection
-        result = figma_tools.get_file(request.file_key, depth=1)
+        result = await integration_executor.run("figma", figma_tools.get_file, request.file_key, depth=1)
         if result.get("success"):
             # Persist current file context for agents
             figma_tools.current_file = result.get("key")
@@ -66,7 +67,7 @@ async def get_file_details(file_key: str):
     Returns details about a specific Figma file.
     """
     try:
-        details = figma_tools.get_file(file_key)
+        details = await integration_executor.run("figma", figma_tools.get_file, file_key)
         return details
     except Exception as e:
         logger.error(f"Failed to get file details: {e}")
@@ -78,7 +79,7 @@ async def get_file_comments(file_key: str):
     Returns comments for a Figma file.
     """
     try:
-        comments = figma_tools.get_file_comments(file_key)
+        comments = await integration_executor.run("figma", figma_tools.get_file_comments, file_key)
         return {"comments": comments}
     except Exception as e:
         logger.error(f"Failed to get comments: {e}")
@@ -90,7 +91,7 @@ async def list_team_projects():
     Lists projects for the default configured team.
     """
     try:
-        projects = figma_tools.get_team_projects()
+        projects = await integration_executor.run("figma", figma_tools.get_team_projects)
         return {"projects": projects}
     except Exception as e:
         logger.error(f"Failed to list team projects: {e}")
@@ -102,7 +103,7 @@ async def list_project_files(project_id: str):
     Lists files for a specific project.
     """
     try:
-        files = figma_tools.get_project_files(project_id)
+        files = await integration_executor.run("figma", figma_tools.get_project_files, project_id)
         return {"files": files}
     except Exception as e:
         logger.error(f"Failed to list project files: {e}")
@@ -1,5 +1,12 @@
-from fastapi import APIRouter, HTTPException, Depends
-from tools.github_tools import GitHubTools
+import anyio
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Response, Query
+from tools.github_tools import GitHubTools, get_github_toolkit
+from tools.repo_mirror import repo_mirror
+from tools.symbol_index import symbol_index
+from tools.code_search import code_search
+from tools.dependency_graph import dependency_graph
+from tools.github_client import github_client
+from tools.integration_executor import integration_executor
 from logging_config.logger import logger
 from pydantic import BaseModel
 from typing import Optional
@@ -7,6 +14,17 @@ from typing import Optional
 router = APIRouter(prefix="/github", tags=["github"])
 github_tools = GitHubTools()
 
+def sync_repo(repo_name: str):
+    """Refreshes the local mirror, then brings the symbol and search indexes up to date with it."""
+    result = repo_mirror.ensure(repo_name)
+    if not result.get("success"):
+        return
+    try:
+        symbol_index.update(repo_name)
+        code_search.update_repo(repo_name)
+    except Exception as e:
+        logger.error(f"Failed to index {repo_name}: {e}")
+
 class ConnectRepoRequest(BaseModel):
     repo_name: str
     access_token: Optional[str] = None
@@ -23,7 +41,8 @@ async def create_repo(request: CreateRepoRequest):
     """
     logger.info(f"Creating new GitHub repo: {request.name}")
     try:
-        result = github_tools.create_repository(request.name, request.description, request.private)
+        result = await integration_executor.run(
+            "github", github_tools.create_repository, request.name, request.description, request.private)
         if result.get("success"):
             return result
         else:
@@ -53,29 +72,43 @@ async def disconnect_github():
     return {"success": True, "message": "Disconnected from GitHub"}
 
 @router.get("/repos")
-async def list_repos():
+async def list_repos(response: Response, q: Optional[str] = None, cursor: Optional[str] = None,
+                     limit: int = Query(20, ge=1, le=100)):
     """
-    Lists updated repositories for the user.
+    Lists updated repositories for the user, filtered by name. The cursor for the
+    next page is returned in the X-Next-Cursor header.
     """
     try:
-        return github_tools.list_user_repos()
+        result = await integration_executor.run("github", github_tools.list_user_repos, q, cursor, limit)
+        if result["next_cursor"]:
+            response.headers["X-Next-Cursor"] = result["next_cursor"]
+        return result["items"]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to list repos: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/branches")
-async def list_branches():
+async def list_branches(response: Response, q: Optional[str] = None, cursor: Optional[str] = None,
+                        limit: int = Query(100, ge=1, le=100)):
     """
-    Lists branches for the connected repository.
+    Lists branches for the connected repository, filtered by name. The cursor for
+    the next page is returned in the X-Next-Cursor header.
     """
     try:
-        return github_tools.list_branches()
+        result = await integration_executor.run("github", github_tools.list_branches, q, cursor, limit)
+        if result["next_cursor"]:
+            response.headers["X-Next-Cursor"] = result["next_cursor"]
+        return result["items"]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to list branches: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/connect")
-async def connect_repo(request: ConnectRepoRequest):
+async def connect_repo(request: ConnectRepoRequest, background_tasks: BackgroundTasks):
     """
     Connects to a specified GitHub repository.
     """
@@ -84,15 +117,19 @@ async def connect_repo(request: ConnectRepoRequest):
         # Update token if provided
         if request.access_token:
             github_tools.access_token = request.access_token
-            # Re-initialize toolkit with new token
-            from camel.toolkits.github_toolkit import GithubToolkit
+            github_client.set_token(request.access_token)
+            # Re-authenticate the toolkit shared with the agents
             try:
-                github_tools.toolkit = GithubToolkit(access_token=request.access_token)
+                github_tools.toolkit = await integration_executor.run("github", get_github_toolkit, request.access_token)
             except Exception as e:
                  raise HTTPException(status_code=400, detail=f"Invalid token: {e}")
         
-        result = github_tools.connect_repo(request.repo_name)
+        result = await integration_executor.run("github", github_tools.connect_repo, request.repo_name)
         if result.get("success"):
+            # Create or refresh the local mirror (trees, files, checkouts) and its indexes
+            if request.access_token:
+                repo_mirror.access_token = request.access_token
+            background_tasks.add_task(sync_repo, result["full_name"])
             return result
         else:
             raise HTTPException(status_code=400, detail=result.get("error", "Failed to connect"))
@@ -111,7 +148,7 @@ async def get_repo_details():
         if not github_tools.current_repo:
             raise HTTPException(status_code=400, detail="No repository connected")
         
-        details = github_tools.get_repo_details()
+        details = await integration_executor.run("github", github_tools.get_repo_details)
         return details
     except HTTPException as e:
         raise e
@@ -120,18 +157,44 @@ async def get_repo_details():
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/files")
-async def get_repo_files(path: str = ""):
+async def get_repo_files(path: str = "", ref: Optional[str] = None, cursor: Optional[str] = None, limit: int = 1000):
     """
-    Returns the file tree of the connected repository.
+    Returns the file tree of the connected repository (path-prefix filtered, paginated).
     """
     try:
         if not github_tools.current_repo:
              raise HTTPException(status_code=400, detail="No repository connected")
         
-        files = github_tools.get_file_tree(path)
-        return {"files": files}
+        return await integration_executor.run("github", github_tools.get_file_tree, path, ref=ref, cursor=cursor, limit=limit)
     except HTTPException as e:
         raise e
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to get repo files: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/dependencies")
+async def get_dependencies(path: str, direction: str = "dependents", transitive: bool = True,
+                           max_depth: Optional[int] = None):
+    """
+    Returns the files that depend on `path` (direction=dependents) or that `path`
+    imports (direction=dependencies) in the connected repository.
+    """
+    try:
+        if not github_tools.current_repo:
+            raise HTTPException(status_code=400, detail="No repository connected")
+        if direction not in ("dependents", "dependencies"):
+            raise HTTPException(status_code=400, detail="direction must be 'dependents' or 'dependencies'")
+
+        result = await anyio.to_thread.run_sync(
+            dependency_graph.query, github_tools.current_repo, path, direction, transitive, max_depth
+        )
+        if not result.get("success"):
+            raise HTTPException(status_code=404, detail=result.get("error"))
+        return result
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logger.error(f"Failed to query dependencies: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,18 +1,74 @@
-from fastapi import APIRouter, HTTPException
-from typing import List
+import json
+from itertools import islice
+import anyio
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
 from tools.jira_tools import JiraTools
-from schemas.jira import TicketRequest
+from tools.integration_executor import integration_executor
+from tools.jira_mirror import jira_mirror
+from tools.comment_writer import comment_writer
+from schemas.jira import TicketRequest, BulkTicketRequest
 from logging_config.logger import logger
 
 router = APIRouter(prefix="/jira", tags=["jira"])
 jira_tools = JiraTools()
 
+@router.get("/health")
+async def jira_health():
+    return await integration_executor.run("jira", jira_tools.health_check)
+
+@router.get("/cache/stats")
+async def jira_cache_stats():
+    return jira_tools.cache_stats()
+
+@router.get("/comments/stats")
+async def jira_comment_stats():
+    return comment_writer.get_stats()
+
+@router.get("/mirror/stats")
+async def jira_mirror_stats():
+    return await anyio.to_thread.run_sync(jira_mirror.get_stats, jira_tools.project_key)
+
+@router.post("/mirror/sync")
+async def sync_jira_mirror(full: bool = False):
+    try:
+        return await integration_executor.run("jira", jira_mirror.sync, jira_tools, full)
+    except Exception as e:
+        logger.error(f"❌ Jira mirror sync failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/tickets")
-async def list_jira_tickets(max_results: int = 10):
+async def list_jira_tickets(response: Response, max_results: int = 10, cursor: Optional[str] = None,
+                            status: Optional[str] = None, label: Optional[str] = None,
+                            issue_type: Optional[str] = None, fields: Optional[str] = None,
+                            stream: bool = False):
+    """
+    Lists tickets, newest first. `fields` is a comma-separated projection. The next page's
+    cursor is returned in the X-Next-Cursor header; stream=true sends every match as NDJSON.
+    """
+    field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+    if stream:
+        async def lines():
+            tickets = jira_tools.iter_tickets(status, label, issue_type, field_list)
+            try:
+                # Pull a page at a time through the Jira limiter rather than the default threadpool
+                while batch := await integration_executor.run("jira", lambda: list(islice(tickets, 100))):
+                    yield "".join(json.dumps(ticket) + "\n" for ticket in batch)
+            except Exception as e:
+                logger.error(f"❌ Ticket stream failed: {str(e)}")
+                yield json.dumps({"error": str(e)}) + "\n"
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
     logger.info(f"📋 Fetching {max_results} Jira tickets...")
     try:
-        tickets = jira_tools.list_tickets(max_results=max_results)
-        return tickets
+        result = await integration_executor.run(
+            "jira", jira_tools.list_tickets, max_results, cursor, status, label, issue_type, field_list)
+        if result["next_cursor"]:
+            response.headers["X-Next-Cursor"] = result["next_cursor"]
+        return result["items"]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"❌ Failed to fetch tickets: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -20,7 +76,9 @@ async def list_jira_tickets(max_results: int = 10):
 @router.post("/tickets")
 async def create_jira_ticket(ticket: TicketRequest):
     try:
-        result = jira_tools.create_ticket(
+        result = await integration_executor.run(
+            "jira",
+            jira_tools.create_ticket,
             summary=ticket.summary,
             description=ticket.description,
             issue_type=ticket.issue_type,
@@ -31,3 +89,13 @@ async def create_jira_ticket(ticket: TicketRequest):
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/tickets/bulk")
+async def create_jira_tickets_bulk(request: BulkTicketRequest):
+    if not request.tickets:
+        raise HTTPException(status_code=400, detail="No tickets provided")
+    try:
+        tickets = [t.model_dump(exclude_none=True) for t in request.tickets]
+        return await integration_executor.run("jira", jira_tools.create_tickets_bulk, tickets, request.parent_key)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -8,3 +8,16 @@ class TicketRequest(BaseModel):
     story_points: Optional[int] = None
     labels: Optional[List[str]] = None
     parent_key: Optional[str] = None
+
+class BulkTicketItem(BaseModel):
+    summary: str
+    description: str = ""
+    issue_type: Optional[str] = None
+    story_points: Optional[int] = None
+    labels: Optional[List[str]] = None
+    parent_key: Optional[str] = None
+    parent_index: Optional[int] = None
+
+class BulkTicketRequest(BaseModel):
+    tickets: List[BulkTicketItem]
+    parent_key: Optional[str] = None
@@ -0,0 +1,71 @@
+"""
+Benchmark for the dependency graph on a synthetic monorepo.
+
+    python tests/bench_dependency_graph.py --files 50000 --imports 8
+
+Generates a layered package tree (each module imports a few modules from lower
+layers plus its package __init__), then times parsing, import resolution, graph
+packing and reverse/transitive queries.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.dependency_graph import DependencyGraph  # noqa: E402
+from tools.symbol_index import SymbolIndex  # noqa: E402
+
+
+def synthetic_repo(files: int, imports: int, seed: int = 7):
+    rng = random.Random(seed)
+    layers = 10
+    per_package = 50
+    paths = [f"pkg{(i // per_package) % layers}/mod{i // per_package}/m{i}.py" for i in range(files)]
+    sources = {}
+    for i, path in enumerate(paths):
+        lower = [p for p in rng.sample(paths, min(imports * 4, files))
+                 if p.split("/")[0] <= path.split("/")[0] and p != path][:imports]
+        lines = [f"import {p[:-3].replace('/', '.')}" for p in lower]
+        lines.append(f"from . import m{(i // per_package) * per_package}")
+        lines.append(f"def handler_{i}():\n    return {i}\n")
+        sources[path] = "\n".join(lines)
+    return sources
+
+
+def timed(label, fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    print(f"{label:<32} {(time.perf_counter() - start) * 1000:10.1f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=20000)
+    parser.add_argument("--imports", type=int, default=6)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    sources = timed("generate sources", synthetic_repo, args.files, args.imports)
+    index = SymbolIndex(root="/tmp/bench-index")
+    built = timed("parse + resolve (full)", index.index_sources, sources, "c1")
+    graph = timed("pack CSR graph", DependencyGraph, built["resolved"], "c1")
+    print(f"{'nodes / edges':<32} {len(graph.nodes):>10} / {graph.edge_count}")
+
+    changed = dict(list(sources.items())[:50])
+    updated = timed("parse + resolve (50 changed)", index.index_sources, changed, "c2", base=built)
+    timed("re-pack CSR graph", DependencyGraph, updated["resolved"], "c2")
+
+    rng = random.Random(1)
+    targets = rng.sample(graph.nodes, min(args.queries, len(graph.nodes)))
+    timed(f"{len(targets)} direct dependents", lambda: [graph.dependents(t) for t in targets])
+    closures = timed(f"{len(targets)} transitive dependents",
+                     lambda: [graph.dependents(t, transitive=True) for t in targets])
+    print(f"{'avg transitive closure size':<32} {sum(map(len, closures)) / len(closures):10.1f}")
+
+
+if __name__ == "__main__":
+    main()
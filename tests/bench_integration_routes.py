@@ -0,0 +1,99 @@
+"""
+Benchmark for route latency while an integration is slow.
+
+    python tests/bench_integration_routes.py --slow 32 --delay 0.5
+
+Fires `--slow` concurrent requests at a route whose upstream call takes `--delay`
+seconds, and meanwhile probes a cheap route and a fast GitHub-backed route. Runs
+once with the upstream call made inline in the async handler (the old pattern)
+and once through the per-integration executor.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import anyio
+import httpx
+from fastapi import FastAPI
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.integration_executor import IntegrationExecutor  # noqa: E402
+
+
+def build_app(delay: float, executor: IntegrationExecutor) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/jira/inline")
+    async def jira_inline():
+        time.sleep(delay)  # sync client call inside an async handler
+        return {"ok": True}
+
+    @app.get("/jira/executor")
+    async def jira_executor():
+        await executor.run("jira", time.sleep, delay)
+        return {"ok": True}
+
+    @app.get("/github/fast")
+    async def github_fast():
+        return await executor.run("github", lambda: {"ok": True})
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    return app
+
+
+async def scenario(app: FastAPI, slow_route: str, slow: int, probes: int, delay: float):
+    latencies = {"/health": [], "/github/fast": []}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def probe(route):
+            # Latency is measured from when the probe was due, so time spent
+            # waiting for a blocked event loop counts against the route
+            interval = delay * 2 / probes
+            for i in range(probes):
+                due = start + 0.01 + i * interval
+                await anyio.sleep(max(0.0, due - time.perf_counter()))
+                await client.get(route)
+                latencies[route].append(time.perf_counter() - due)
+
+        start = time.perf_counter()
+        async with anyio.create_task_group() as tg:
+            for _ in range(slow):
+                tg.start_soon(client.get, slow_route)
+            for route in latencies:
+                tg.start_soon(probe, route)
+        total = time.perf_counter() - start
+    return total, latencies
+
+
+def report(label, total, latencies):
+    print(f"{label} - slow requests finished in {total:.2f}s")
+    for route, samples in latencies.items():
+        samples = sorted(samples)
+        p95 = samples[max(0, int(len(samples) * 0.95) - 1)]
+        print(f"  {route:<14} p50 {statistics.median(samples) * 1000:9.1f} ms   p95 {p95 * 1000:9.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--slow", type=int, default=32, help="concurrent slow Jira requests")
+    parser.add_argument("--delay", type=float, default=0.5, help="seconds per upstream call")
+    parser.add_argument("--probes", type=int, default=20, help="requests per probed route")
+    parser.add_argument("--jira-limit", type=int, default=8)
+    args = parser.parse_args()
+
+    executor = IntegrationExecutor({"jira": args.jira_limit, "github": 8})
+    app = build_app(args.delay, executor)
+    for label, route in (("inline sync call", "/jira/inline"), ("integration executor", "/jira/executor")):
+        total, latencies = anyio.run(scenario, app, route, args.slow, args.probes, args.delay)
+        report(label, total, latencies)
+    print(executor.get_stats())
+
+
+if __name__ == "__main__":
+    main()
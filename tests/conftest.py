@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+
+import pytest
+from jira.exceptions import JIRAError
+
+import tools.jira_tools as jira_tools_module
+from tools.jira_client import JiraClientFactory
+from tools.jira_mirror import JiraMirror
+from tools.jira_tools import JiraTools
+
+
+class FakeJira:
+    """In-memory stand-in for the python-jira client, for tests that call JiraTools directly.
+
+    tests/fake_services.py serves the same API over HTTP; this one skips the server and
+    records what was asked of it (searches, single-issue reads, bulk creates).
+    """
+    deploymentType = "Cloud"
+
+    def __init__(self):
+        self.issues = {}
+        self.searches = []
+        self.reads = []
+        self.created = []
+
+    def add_issue(self, n, status="To Do", labels=(), updated="2026-01-01"):
+        self.issues[f"KAN-{n}"] = {
+            "key": f"KAN-{n}",
+            "fields": {"summary": f"Ticket {n}", "status": {"name": status}, "issuetype": {"name": "Story"},
+                       "labels": list(labels), "created": f"2026-01-{n:02d}", "updated": updated,
+                       "assignee": None},
+        }
+
+    def enhanced_search_issues(self, jql, nextPageToken=None, maxResults=50, fields=None, json_result=False):
+        self.searches.append({"jql": jql, "token": nextPageToken, "fields": fields})
+        # Incremental syncs only see issues a test marked as updated="new"
+        issues = [i for i in self.issues.values() if "updated >=" not in jql or i["fields"]["updated"] == "new"]
+        start = int(nextPageToken or 0)
+        end = start + maxResults
+        last = end >= len(issues)
+        return {"issues": issues[start:end], "isLast": last, **({} if last else {"nextPageToken": str(end)})}
+
+    def issue(self, key, fields=None):
+        self.reads.append(key)
+        if key not in self.issues:
+            raise JIRAError(status_code=404, text="Issue Does Not Exist")
+        return SimpleNamespace(key=key, raw=self.issues[key])
+
+    def fields(self):
+        return [{"id": "summary", "name": "Summary"}, {"id": "customfield_10026", "name": "Story Points"}]
+
+    def create_issues(self, field_list, prefetch=True):
+        self.created.append(field_list)
+        results = []
+        for fields in field_list:
+            if fields["summary"] == "bad":
+                results.append({"status": "Error", "error": {"summary": "rejected"}, "issue": None})
+            elif fields["issuetype"]["name"] == "Subtask" and "customfield_10026" in fields:
+                results.append({"status": "Error", "error": {"customfield_10026": "not on screen"}, "issue": None})
+            else:
+                key = f"KAN-{len(self.issues) + 1}"
+                self.issues[key] = {"key": key, "fields": fields}
+                results.append({"status": "Success", "error": None, "issue": SimpleNamespace(key=key)})
+        return results
+
+    def tools(self):
+        tools = JiraTools()
+        tools.project_key = "KAN"
+        return tools
+
+
+@pytest.fixture
+def fake_jira(monkeypatch, tmp_path):
+    """Points the shared Jira client at a FakeJira and the mirror at an empty tmp database."""
+    fake = FakeJira()
+    factory = JiraClientFactory()
+    factory._client = fake
+    monkeypatch.setattr(jira_tools_module, "jira_client", factory)
+    # Not the process-wide mirror, so a local settings.JIRA_MIRROR_PATH can't leak into results
+    fake.mirror = JiraMirror(str(tmp_path / "mirror.db"), reconcile_interval=3600)
+    monkeypatch.setattr(jira_tools_module, "jira_mirror", fake.mirror)
+    return fake
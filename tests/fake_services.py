@@ -0,0 +1,602 @@
+"""
+In-process stand-in for the Jira, GitHub and Figma APIs this project calls.
+
+    with FakeServices(seed=1, issues=200).start() as fake, fake.use():
+        JiraTools().list_tickets()            # served by the fake
+        fake.configure("jira", latency=0.2)   # slow Jira down
+        fake.configure("figma", rate_limit_every=3, retry_after=0)
+
+`use()` points settings (and the shared Jira/GitHub clients) at the fake until it
+exits. Fixtures are generated from `seed`, so runs are deterministic. Latency,
+error and 429 injection are configured per service.
+
+It can also run standalone for load runs; it prints the env vars to export:
+
+    python tests/fake_services.py --port 8900 --issues 500 --jira-latency 0.2
+
+Covered: Jira REST v2 (search, search/jql, issue CRUD, bulk create, transitions,
+comments, fields, serverInfo, user search), GitHub REST (repo, user repos with
+Link paging, branches, commits, git trees, contents, create repo; ETags and rate
+limit headers) and Figma v1 (files, comments, team projects, project files).
+Git clones (the local mirror) and the PyGithub-based agent toolkit still talk to github.com.
+"""
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+STATUSES = ["To Do", "In Progress", "In Review", "Done"]
+# (id, name, target status)
+WORKFLOW = [("11", "Start Progress", "In Progress"), ("21", "Request Review", "In Review"),
+            ("31", "Done", "Done"), ("41", "Reopen", "To Do")]
+ISSUE_TYPES = ["Story", "Task", "Bug", "Epic", "Subtask"]
+STORY_POINTS_FIELD = "customfield_10026"
+WORDS = ["login", "password", "reset", "dashboard", "export", "csv", "theme", "search", "filter", "api",
+         "cache", "modal", "button", "profile", "upload", "avatar", "billing", "invoice", "webhook", "sync",
+         "notification", "email", "board", "ticket", "comment", "report", "chart", "settings", "oauth", "token"]
+
+JQL_CLAUSE = re.compile(r'(\w+)\s*(>=|=|\bin\b)\s*(\((?:[^()"]|"(?:[^"\\]|\\.)*")*\)|"(?:[^"\\]|\\.)*"|[\w-]+)', re.I)
+JQL_VALUE = re.compile(r'"((?:[^"\\]|\\.)*)"|([\w-]+)')
+
+
+@dataclass
+class Faults:
+    latency: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    rate_limit_every: int = 0   # every Nth request gets a 429
+    retry_after: int = 1
+
+
+def _timestamp(epoch: float) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S.000+0000", time.gmtime(epoch))
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+class FakeServices:
+    def __init__(self, seed: int = 0, project: str = "KAN", issues: int = 50, repos: int = 30,
+                 repo_files: int = 200, figma_files: int = 5):
+        self.project = project
+        self.faults = {name: Faults() for name in ("jira", "github", "figma")}
+        self.requests = {name: 0 for name in self.faults}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[uvicorn.Server] = None
+        self._thread: Optional[threading.Thread] = None
+        self.port: Optional[int] = None
+        self.seed(seed, issues, repos, repo_files, figma_files)
+        self.app = self._build_app()
+
+    # --- Fixtures ---
+
+    def seed(self, seed: int, issues: int = 50, repos: int = 30, repo_files: int = 200, figma_files: int = 5):
+        rng = random.Random(seed)
+        start = 1_767_225_600  # 2026-01-01
+        self.issues: Dict[str, Dict[str, Any]] = {}
+        self.comments: Dict[str, List[dict]] = {}
+        self._next_issue = 1
+        for i in range(issues):
+            issue_type = rng.choice(["Story", "Task", "Bug"])
+            self._add_issue({
+                "summary": _sentence(rng, 5).capitalize(),
+                "description": _sentence(rng, 40),
+                "issuetype": {"name": issue_type},
+                "labels": rng.sample(["agent-core", "ui", "backend", "qa"], rng.randint(0, 2)),
+                STORY_POINTS_FIELD: rng.choice([1, 2, 3, 5, 8]),
+            }, status=rng.choice(STATUSES), at=start + i * 3600)
+        self.users = [{"accountId": f"user-{i}", "displayName": f"Dev {i}", "emailAddress": f"dev{i}@example.com"}
+                      for i in range(5)]
+
+        self.repos: Dict[str, Dict[str, Any]] = {}
+        self.files: Dict[str, Dict[str, str]] = {}
+        for i in range(repos):
+            self._add_repo(f"acme/repo-{i:03d}", f"Service {i}", updated=start + i * 60)
+        main_repo = self._add_repo("acme/webapp", "Main web application", updated=start + repos * 60)
+        for i in range(repo_files):
+            folder = rng.choice(["src/components", "src/pages", "src/api", "tests", "docs"])
+            self.files[main_repo][f"{folder}/file_{i}.{'jsx' if folder.startswith('src') else 'md'}"] = \
+                f"// {_sentence(rng, 8)}\nexport default function F{i}() {{ return null }}\n"
+
+        self.figma_files = {
+            f"FIG{i}KEY": {"name": f"Design {i}", "lastModified": _timestamp(start + i * 86400),
+                           "pages": [f"Page {p}" for p in range(3)],
+                           "comments": [{"id": f"c{i}-{c}", "message": _sentence(rng, 6),
+                                         "user": {"handle": f"designer{c}"}, "created_at": _timestamp(start),
+                                         "resolved_at": None} for c in range(rng.randint(0, 4))]}
+            for i in range(figma_files)
+        }
+
+    def _add_issue(self, fields: dict, status: str = "To Do", at: Optional[float] = None) -> dict:
+        number = self._next_issue
+        self._next_issue += 1
+        at = at or time.time()
+        key = f"{self.project}-{number}"
+        issue = {"id": str(10000 + number), "key": key, "status": status, "created": at, "updated": at,
+                 "fields": {k: v for k, v in fields.items() if k not in ("project", "status")}}
+        self.issues[key] = issue
+        self.comments[key] = []
+        return issue
+
+    def _add_repo(self, full_name: str, description: str, updated: float) -> str:
+        owner, name = full_name.split("/")
+        self.repos[full_name] = {
+            "id": len(self.repos) + 1, "name": name, "full_name": full_name, "owner": {"login": owner},
+            "description": description, "private": False, "default_branch": "main", "language": "JavaScript",
+            "stargazers_count": 0, "forks_count": 0, "open_issues_count": 0,
+            "html_url": f"https://github.com/{full_name}", "updated_at": _timestamp(updated),
+        }
+        self.files[full_name] = {"README.md": f"# {name}\n"}
+        return full_name
+
+    # --- Server ---
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    @property
+    def github_url(self) -> str:
+        return f"{self.url}/github"
+
+    @property
+    def figma_url(self) -> str:
+        return f"{self.url}/figma/v1"
+
+    def configure(self, service: str, **faults) -> "FakeServices":
+        """configure("jira", latency=0.2, error_rate=0.1, rate_limit_every=5, retry_after=0)"""
+        for name, value in faults.items():
+            setattr(self.faults[service], name, value)
+        return self
+
+    def start(self, port: int = 0) -> "FakeServices":
+        config = uvicorn.Config(self.app, host="127.0.0.1", port=port, log_level="warning", lifespan="off")
+        self._server = uvicorn.Server(config)
+        self._server.install_signal_handlers = lambda: None
+        self._thread = threading.Thread(target=self._server.run, name="fake-services", daemon=True)
+        self._thread.start()
+        deadline = time.monotonic() + 10
+        while not self._server.started:
+            if time.monotonic() > deadline or not self._thread.is_alive():
+                raise RuntimeError("Fake services failed to start")
+            time.sleep(0.01)
+        self.port = self._server.servers[0].sockets[0].getsockname()[1]
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.should_exit = True
+            self._thread.join(timeout=5)
+            self._server = None
+
+    def __enter__(self):
+        return self if self._server else self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @contextmanager
+    def use(self):
+        """Points settings and the shared clients at this server."""
+        from config.settings import settings
+        from tools.github_client import github_client
+        from tools.jira_client import jira_client
+
+        overrides = {
+            "JIRA_BASE_URL": self.url, "JIRA_EMAIL": "fake@example.com", "JIRA_API_TOKEN": "fake-token",
+            "JIRA_PROJECT_KEY": self.project, "GITHUB_API_URL": self.github_url,
+            "FIGMA_API_URL": self.figma_url, "FIGMA_ACCESS_TOKEN": "fake-token",
+        }
+        saved = {name: getattr(settings, name) for name in overrides}
+        saved_github = github_client.base_url
+        for name, value in overrides.items():
+            setattr(settings, name, value)
+        jira_client.reset()
+        github_client.base_url = self.github_url
+        github_client.invalidate()
+        try:
+            yield self
+        finally:
+            for name, value in saved.items():
+                setattr(settings, name, value)
+            jira_client.reset()
+            github_client.base_url = saved_github
+            github_client.invalidate()
+
+    # --- Jira helpers ---
+
+    def _issue_json(self, issue: dict, fields: Optional[List[str]] = None) -> dict:
+        key = issue["key"]
+        parent = issue["fields"].get("parent")
+        all_fields = {
+            **issue["fields"],
+            "status": {"name": issue["status"], "id": str(STATUSES.index(issue["status"]) + 1),
+                       "self": f"{self.url}/rest/api/2/status/{issue['status']}"},
+            "issuetype": {**issue["fields"]["issuetype"],
+                          "subtask": issue["fields"]["issuetype"]["name"] == "Subtask"},
+            "assignee": issue["fields"].get("assignee"),
+            "labels": issue["fields"].get("labels", []),
+            "created": _timestamp(issue["created"]),
+            "updated": _timestamp(issue["updated"]),
+            "project": {"key": self.project},
+        }
+        if parent:
+            parent_issue = self.issues.get(parent["key"], {})
+            all_fields["parent"] = {"key": parent["key"], "id": parent_issue.get("id"),
+                                    "fields": {"summary": parent_issue.get("fields", {}).get("summary")}}
+        wanted = [f for f in (fields or []) if f and f != "*all"]
+        if wanted:
+            all_fields = {k: v for k, v in all_fields.items() if k in wanted}
+        return {"id": issue["id"], "key": key, "self": f"{self.url}/rest/api/2/issue/{issue['id']}",
+                "fields": all_fields}
+
+    def _find_issue(self, key_or_id: str) -> Optional[dict]:
+        if key_or_id.upper() in self.issues:
+            return self.issues[key_or_id.upper()]
+        return next((i for i in self.issues.values() if i["id"] == key_or_id), None)
+
+    def _jql(self, jql: str) -> List[dict]:
+        query, order = (re.split(r"\s*ORDER\s+BY\s+", jql, maxsplit=1, flags=re.I) + [""])[:2]
+        results = list(self.issues.values())
+        for field, op, raw in JQL_CLAUSE.findall(query):
+            values = [(q or w).replace('\\"', '"').replace("\\\\", "\\").lower() for q, w in JQL_VALUE.findall(raw)]
+            field = field.lower()
+            if field == "project":
+                results = [i for i in results if i["key"].split("-")[0].lower() in values]
+            elif field == "status":
+                results = [i for i in results if i["status"].lower() in values]
+            elif field == "issuetype":
+                results = [i for i in results if i["fields"]["issuetype"]["name"].lower() in values]
+            elif field == "labels":
+                results = [i for i in results if {l.lower() for l in i["fields"].get("labels", [])} & set(values)]
+            elif field == "updated" and op == ">=":
+                match = re.match(r"-(\d+)([mhd])", values[0])
+                if match:
+                    seconds = int(match.group(1)) * {"m": 60, "h": 3600, "d": 86400}[match.group(2)]
+                    results = [i for i in results if i["updated"] >= time.time() - seconds]
+        if "created desc" in order.lower() or not order:
+            results.sort(key=lambda i: (i["created"], int(i["key"].split("-")[1])), reverse=True)
+        return results
+
+    @staticmethod
+    def _fields_param(request: Request) -> List[str]:
+        return [f for value in request.query_params.getlist("fields") for f in value.split(",") if f]
+
+    def _validate(self, fields: dict) -> Dict[str, str]:
+        errors = {}
+        if not fields.get("summary"):
+            errors["summary"] = "You must specify a summary of the issue."
+        issue_type = (fields.get("issuetype") or {}).get("name")
+        if issue_type not in ISSUE_TYPES:
+            errors["issuetype"] = "Specify a valid issue type"
+        parent = (fields.get("parent") or {}).get("key")
+        if issue_type == "Subtask" and not parent:
+            errors["parent"] = "Subtasks must have a parent"
+        if parent and parent.upper() not in self.issues:
+            errors["parent"] = f"Issue '{parent}' does not exist"
+        if issue_type == "Subtask" and STORY_POINTS_FIELD in fields:
+            errors[STORY_POINTS_FIELD] = (f"Field '{STORY_POINTS_FIELD}' cannot be set. It is not on the "
+                                          "appropriate screen, or unknown.")
+        return errors
+
+    def _create(self, fields: dict) -> dict:
+        if fields.get("parent"):
+            fields = {**fields, "parent": {"key": fields["parent"]["key"].upper()}}
+        issue = self._add_issue(fields)
+        return {"id": issue["id"], "key": issue["key"], "self": f"{self.url}/rest/api/2/issue/{issue['id']}"}
+
+    # --- GitHub helpers ---
+
+    def _github(self, request: Request, data: Any, status: int = 200, headers: Optional[dict] = None) -> Response:
+        body = json.dumps(data)
+        etag = '"' + hashlib.sha1(body.encode()).hexdigest() + '"'
+        base = {"ETag": etag, "X-RateLimit-Limit": "5000", "X-RateLimit-Reset": str(int(time.time()) + 3600)}
+        if request.headers.get("If-None-Match") == etag:
+            return Response(status_code=304, headers={**base, "X-RateLimit-Remaining": str(self._github_remaining)})
+        self._github_remaining = max(0, self._github_remaining - 1)
+        return Response(body, status_code=status, media_type="application/json",
+                        headers={**base, "X-RateLimit-Remaining": str(self._github_remaining), **(headers or {})})
+
+    def _tree_sha(self, repo: str) -> str:
+        return hashlib.sha1(json.dumps(sorted(self.files[repo].items())).encode()).hexdigest()
+
+    # --- App ---
+
+    def _service_for(self, path: str) -> str:
+        if path.startswith("/github"):
+            return "github"
+        if path.startswith("/figma"):
+            return "figma"
+        return "jira"
+
+    def _build_app(self) -> FastAPI:
+        app = FastAPI(title="Fake Jira / GitHub / Figma")
+        self._github_remaining = 5000
+        self._handler_lock = asyncio.Lock()
+
+        @app.middleware("http")
+        async def inject_faults(request: Request, call_next):
+            service = self._service_for(request.url.path)
+            faults = self.faults[service]
+            with self._lock:
+                self.requests[service] += 1
+                count = self.requests[service]
+                fail = faults.error_rate and self._rng.random() < faults.error_rate
+            if faults.latency:
+                await asyncio.sleep(faults.latency)
+            if faults.rate_limit_every and count % faults.rate_limit_every == 0:
+                return JSONResponse({"message": "rate limited"}, status_code=429,
+                                    headers={"Retry-After": str(faults.retry_after)})
+            if fail:
+                return JSONResponse({"message": "injected failure"}, status_code=faults.error_status)
+            # Handlers mutate the fixtures from the threadpool; serialize them
+            async with self._handler_lock:
+                return await call_next(request)
+
+        # Jira
+
+        @app.get("/rest/api/2/serverInfo")
+        def server_info():
+            return {"baseUrl": self.url, "version": "9.12.0", "versionNumbers": [9, 12, 0],
+                    "deploymentType": "Server", "serverTitle": "Fake Jira"}
+
+        @app.get("/rest/api/2/field")
+        def fields():
+            names = {"summary": "Summary", "description": "Description", "status": "Status",
+                     "issuetype": "Issue Type", "assignee": "Assignee", "labels": "Labels", "parent": "Parent",
+                     "created": "Created", "updated": "Updated", STORY_POINTS_FIELD: "Story Points"}
+            return [{"id": k, "name": v, "custom": k.startswith("customfield")} for k, v in names.items()]
+
+        @app.get("/rest/api/2/search")
+        def search(request: Request, jql: str = "", startAt: int = 0, maxResults: int = 50):
+            issues = self._jql(jql)
+            page = issues[startAt:startAt + maxResults]
+            return {"startAt": startAt, "maxResults": maxResults, "total": len(issues),
+                    "issues": [self._issue_json(i, self._fields_param(request)) for i in page]}
+
+        @app.get("/rest/api/2/search/jql")
+        def search_jql(request: Request, jql: str = "", nextPageToken: Optional[str] = None, maxResults: int = 50):
+            issues = self._jql(jql)
+            start = int(nextPageToken or 0)
+            page = issues[start:start + maxResults]
+            end = start + len(page)
+            result = {"issues": [self._issue_json(i, self._fields_param(request)) for i in page],
+                      "isLast": end >= len(issues)}
+            if end < len(issues):
+                result["nextPageToken"] = str(end)
+            return result
+
+        @app.get("/rest/api/2/issue/{key}")
+        def get_issue(key: str, request: Request):
+            issue = self._find_issue(key)
+            if not issue:
+                return JSONResponse({"errorMessages": ["Issue does not exist"], "errors": {}}, status_code=404)
+            return self._issue_json(issue, self._fields_param(request))
+
+        @app.post("/rest/api/2/issue")
+        async def create_issue(request: Request):
+            fields = (await request.json()).get("fields", {})
+            errors = self._validate(fields)
+            if errors:
+                return JSONResponse({"errorMessages": [], "errors": errors}, status_code=400)
+            return JSONResponse(self._create(fields), status_code=201)
+
+        @app.post("/rest/api/2/issue/bulk")
+        async def create_issues(request: Request):
+            created, errors = [], []
+            for index, update in enumerate((await request.json()).get("issueUpdates", [])):
+                problems = self._validate(update.get("fields", {}))
+                if problems:
+                    errors.append({"status": 400, "failedElementNumber": index,
+                                   "elementErrors": {"errorMessages": [], "errors": problems}})
+                else:
+                    created.append(self._create(update["fields"]))
+            return JSONResponse({"issues": created, "errors": errors}, status_code=201 if created else 400)
+
+        @app.put("/rest/api/2/issue/{key}")
+        async def update_issue(key: str, request: Request):
+            issue = self._find_issue(key)
+            if not issue:
+                return JSONResponse({"errorMessages": ["Issue does not exist"], "errors": {}}, status_code=404)
+            fields = (await request.json()).get("fields", {})
+            if "assignee" in fields and fields["assignee"]:
+                user = next((u for u in self.users if u["accountId"] == fields["assignee"].get("accountId")), None)
+                fields["assignee"] = user
+            issue["fields"].update(fields)
+            issue["updated"] = time.time()
+            return Response(status_code=204)
+
+        @app.get("/rest/api/2/issue/{key}/transitions")
+        def transitions(key: str):
+            issue = self._find_issue(key)
+            if not issue:
+                return JSONResponse({"errorMessages": ["Issue does not exist"], "errors": {}}, status_code=404)
+            return {"transitions": [{"id": tid, "name": name, "to": {"name": to}}
+                                    for tid, name, to in WORKFLOW if to != issue["status"]]}
+
+        @app.post("/rest/api/2/issue/{key}/transitions")
+        async def transition(key: str, request: Request):
+            issue = self._find_issue(key)
+            transition_id = str((await request.json()).get("transition", {}).get("id"))
+            target = next((to for tid, _, to in WORKFLOW if tid == transition_id), None)
+            if not issue or target is None or target == issue["status"]:
+                return JSONResponse({"errorMessages": [f"Transition id '{transition_id}' is not valid for this issue."],
+                                     "errors": {}}, status_code=400)
+            issue["status"] = target
+            issue["updated"] = time.time()
+            return Response(status_code=204)
+
+        @app.post("/rest/api/2/issue/{key}/comment")
+        async def add_comment(key: str, request: Request):
+            issue = self._find_issue(key)
+            if not issue:
+                return JSONResponse({"errorMessages": ["Issue does not exist"], "errors": {}}, status_code=404)
+            comment = {"id": str(len(self.comments[issue["key"]]) + 1), "body": (await request.json()).get("body"),
+                       "author": {"displayName": "Agent"}, "created": _timestamp(time.time()),
+                       "self": f"{self.url}/rest/api/2/issue/{issue['id']}/comment"}
+            self.comments[issue["key"]].append(comment)
+            issue["updated"] = time.time()
+            return JSONResponse(comment, status_code=201)
+
+        @app.get("/rest/api/2/user/search")
+        def user_search(query: str = ""):
+            return [u for u in self.users if query.lower() in u["emailAddress"] or query.lower() in u["displayName"].lower()]
+
+        # GitHub
+
+        @app.get("/github/user/repos")
+        def user_repos(request: Request, page: int = 1, per_page: int = 30):
+            repos = sorted(self.repos.values(), key=lambda r: r["updated_at"], reverse=True)
+            chunk = repos[(page - 1) * per_page:page * per_page]
+            headers = {}
+            if page * per_page < len(repos):
+                headers["Link"] = f'<{self.github_url}/user/repos?page={page + 1}&per_page={per_page}>; rel="next"'
+            return self._github(request, chunk, headers=headers)
+
+        @app.post("/github/user/repos")
+        async def create_repo(request: Request):
+            body = await request.json()
+            full_name = f"acme/{body['name']}"
+            if full_name in self.repos:
+                return self._github(request, {"message": "name already exists on this account"}, status=422)
+            self._add_repo(full_name, body.get("description", ""), updated=time.time())
+            self.repos[full_name]["private"] = bool(body.get("private"))
+            return self._github(request, self.repos[full_name], status=201)
+
+        @app.get("/github/repos/{owner}/{repo}")
+        def get_repo(owner: str, repo: str, request: Request):
+            data = self.repos.get(f"{owner}/{repo}")
+            if not data:
+                return self._github(request, {"message": "Not Found"}, status=404)
+            return self._github(request, data)
+
+        @app.get("/github/repos/{owner}/{repo}/branches")
+        def branches(owner: str, repo: str, request: Request, page: int = 1, per_page: int = 30):
+            name = f"{owner}/{repo}"
+            if name not in self.repos:
+                return self._github(request, {"message": "Not Found"}, status=404)
+            sha = self._tree_sha(name)
+            items = [{"name": "main", "commit": {"sha": sha}, "protected": True}] + \
+                    [{"name": f"feature/{w}", "commit": {"sha": sha}, "protected": False} for w in WORDS[:5]]
+            return self._github(request, items[(page - 1) * per_page:page * per_page])
+
+        @app.get("/github/repos/{owner}/{repo}/commits/{ref:path}")
+        def commit(owner: str, repo: str, ref: str, request: Request):
+            name = f"{owner}/{repo}"
+            if name not in self.repos:
+                return self._github(request, {"message": "Not Found"}, status=404)
+            return self._github(request, {"sha": self._tree_sha(name)})
+
+        @app.get("/github/repos/{owner}/{repo}/git/trees/{sha}")
+        def tree(owner: str, repo: str, sha: str, request: Request):
+            name = f"{owner}/{repo}"
+            if name not in self.repos:
+                return self._github(request, {"message": "Not Found"}, status=404)
+            entries = [{"path": p, "type": "blob", "sha": hashlib.sha1(c.encode()).hexdigest(), "size": len(c)}
+                       for p, c in sorted(self.files[name].items())]
+            return self._github(request, {"sha": sha, "tree": entries, "truncated": False})
+
+        @app.get("/github/repos/{owner}/{repo}/contents/{path:path}")
+        def contents(owner: str, repo: str, path: str, request: Request):
+            content = self.files.get(f"{owner}/{repo}", {}).get(path)
+            if content is None:
+                return self._github(request, {"message": "Not Found"}, status=404)
+            return self._github(request, {"type": "file", "path": path, "encoding": "base64",
+                                          "content": base64.b64encode(content.encode()).decode(),
+                                          "sha": hashlib.sha1(content.encode()).hexdigest()})
+
+        # Figma
+
+        def figma_auth(request: Request) -> Optional[JSONResponse]:
+            if not request.headers.get("X-Figma-Token"):
+                return JSONResponse({"status": 403, "err": "Invalid token"}, status_code=403)
+            return None
+
+        @app.get("/figma/v1/files/{key}")
+        def figma_file(key: str, request: Request, depth: Optional[int] = None):
+            denied = figma_auth(request)
+            if denied:
+                return denied
+            data = self.figma_files.get(key)
+            if not data:
+                return JSONResponse({"status": 404, "err": "Not found"}, status_code=404)
+            pages = [{"id": f"0:{i + 1}", "name": p, "type": "CANVAS",
+                      "children": [] if depth == 1 else [{"id": f"{i + 1}:1", "name": "Frame", "type": "FRAME"}]}
+                     for i, p in enumerate(data["pages"])]
+            return {"name": data["name"], "lastModified": data["lastModified"], "editorType": "figma",
+                    "thumbnailUrl": f"https://example.com/{key}.png", "version": "1",
+                    "document": {"id": "0:0", "name": "Document", "type": "DOCUMENT", "children": pages}}
+
+        @app.get("/figma/v1/files/{key}/comments")
+        def figma_comments(key: str, request: Request):
+            denied = figma_auth(request)
+            if denied:
+                return denied
+            return {"comments": self.figma_files.get(key, {}).get("comments", [])}
+
+        @app.get("/figma/v1/teams/{team_id}/projects")
+        def figma_projects(team_id: str, request: Request):
+            denied = figma_auth(request)
+            if denied:
+                return denied
+            return {"name": f"Team {team_id}", "projects": [{"id": "1", "name": "Product"}]}
+
+        @app.get("/figma/v1/projects/{project_id}/files")
+        def figma_project_files(project_id: str, request: Request):
+            denied = figma_auth(request)
+            if denied:
+                return denied
+            return {"name": "Product", "files": [
+                {"key": key, "name": f["name"], "last_modified": f["lastModified"],
+                 "thumbnail_url": f"https://example.com/{key}.png"} for key, f in self.figma_files.items()]}
+
+        return app
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--issues", type=int, default=200)
+    parser.add_argument("--repo-files", type=int, default=2000)
+    for service in ("jira", "github", "figma"):
+        parser.add_argument(f"--{service}-latency", type=float, default=0.0)
+        parser.add_argument(f"--{service}-error-rate", type=float, default=0.0)
+        parser.add_argument(f"--{service}-429-every", type=int, default=0)
+    args = parser.parse_args()
+
+    fake = FakeServices(seed=args.seed, issues=args.issues, repo_files=args.repo_files)
+    for service in ("jira", "github", "figma"):
+        fake.configure(service, latency=getattr(args, f"{service}_latency"),
+                       error_rate=getattr(args, f"{service}_error_rate"),
+                       rate_limit_every=getattr(args, f"{service}_429_every"))
+    fake.start(args.port)
+    print(f"export JIRA_BASE_URL={fake.url} JIRA_EMAIL=fake@example.com JIRA_API_TOKEN=fake-token "
+          f"JIRA_PROJECT_KEY={fake.project}")
+    print(f"export GITHUB_API_URL={fake.github_url} FIGMA_API_URL={fake.figma_url} FIGMA_ACCESS_TOKEN=fake-token")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        fake.stop()
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    main()
@@ -0,0 +1,30 @@
+"""Throwaway git repositories, and bare mirrors of them, for the repository mirror tests."""
+import subprocess
+
+from tools.repo_mirror import RepoMirror
+
+GIT = ["git", "-c", "user.name=t", "-c", "user.email=t@t"]
+
+
+def git(cwd, *args: str):
+    subprocess.run(GIT + list(args), cwd=cwd, check=True, capture_output=True)
+
+
+def commit(repo, files, message="update"):
+    """Writes `files` ({path: content}) into the working tree at `repo` and commits them."""
+    for name, content in files.items():
+        (repo / name).parent.mkdir(parents=True, exist_ok=True)
+        (repo / name).write_text(content)
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", message)
+
+
+def make_mirror(tmp_path, files, repo_name="o/r") -> RepoMirror:
+    """Creates tmp_path/source with `files` on main and a RepoMirror holding a mirror of it as `repo_name`."""
+    source = tmp_path / "source"
+    source.mkdir()
+    git(source, "init", "-q", "-b", "main")
+    commit(source, files, "init")
+    mirror = RepoMirror(root=str(tmp_path / "mirrors"))
+    git(tmp_path, "clone", "-q", "--mirror", str(source), mirror.path_for(repo_name))
+    return mirror
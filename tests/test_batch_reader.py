@@ -0,0 +1,31 @@
+from tests.git_repos import make_mirror
+from tools import batch_reader
+from tools.batch_reader import BatchFileReader
+from tools.progress_tracker import progress_tracker
+
+
+def test_read_files_batches_caps_and_dedupes(tmp_path, monkeypatch):
+    mirror = make_mirror(tmp_path, {"a.py": "a = 1\n", "b.py": "b = 2\n", "big.txt": "x" * 100})
+    monkeypatch.setattr(batch_reader, "repo_mirror", mirror)
+    monkeypatch.setattr(batch_reader, "MAX_FILE_CHARS", 10)
+    progress_tracker.init_task("reader-test", ["Read"])
+    reader = BatchFileReader("reader-test")
+
+    first = reader.read_files("o/r", ["a.py", "big.txt", "missing.py", "a.py"])
+    assert first["files"]["a.py"] == "a = 1\n"
+    assert first["files"]["big.txt"].startswith("x" * 10 + "\n... [truncated")
+    assert (first["missing"], first["truncated"]) == (["missing.py"], ["big.txt"])
+
+    second = reader.read_files("o/r", ["a.py", "b.py", "big.txt"])
+    assert second["already_read"] == ["a.py"]
+    assert sorted(second["files"]) == ["b.py", "big.txt"]  # truncated files can be read again
+
+    progress_tracker.init_task("reader-test", ["Read again"])
+    assert list(reader.read_files("o/r", ["a.py"])["files"]) == ["a.py"]
+
+
+def test_read_blobs_skips_directories_and_missing_paths(tmp_path):
+    mirror = make_mirror(tmp_path, {"a.py": "a = 1\n", "src/x.py": "x = 2\n", "src/y.py": "y = 3\n"})
+    blobs = mirror.read_blobs("o/r", ["src", "a.py", "nope.py", "src/x.py", "src/y.py"])
+    assert blobs == {"a.py": "a = 1\n", "src/x.py": "x = 2\n", "src/y.py": "y = 3\n"}
+
@@ -0,0 +1,54 @@
+from tools.code_search import CodeSearch, TrigramIndex, _required_literals
+
+
+def test_required_literals_only_keeps_mandatory_runs():
+    assert _required_literals(r"def \w+_ticket") == ["def ", "_ticket"]
+    assert _required_literals(r"get_ticket\(") == ["get_ticket("]
+    assert _required_literals("colou?r") == ["colo"]
+    assert _required_literals("foo|barbaz") == []
+    assert _required_literals("(jira)?client") == []
+
+
+def test_trigram_index_survives_removal_and_round_trip():
+    index = TrigramIndex()
+    index.add("a.py", "def create_ticket(): pass")
+    index.add("b.py", "def delete_ticket(): pass")
+    index.remove("a.py")
+    restored = TrigramIndex.from_dict(index.to_dict())
+    assert restored.candidates(["_ticket"]) == ["b.py"]
+    assert restored.candidates(["create"]) == []
+    assert restored.candidates(["ab"]) is None
+
+
+def test_workspace_search_tracks_writes_and_deletes(tmp_path):
+    workspace = tmp_path / "workspace"
+    (workspace / "owner/repo/src").mkdir(parents=True)
+    (workspace / "owner/repo/src/api.js").write_text("export function fetchTickets() {}\n")
+    search = CodeSearch(root=str(tmp_path / "index"), workspace=str(workspace))
+
+    results = search.search_code("fetchtickets", repo_name="owner/repo")
+    assert [r["path"] for r in results] == ["src/api.js"]
+    assert results[0]["snippets"] == [{"line": 1, "text": "export function fetchTickets() {}"}]
+
+    (workspace / "owner/repo/src/list.js").write_text("fetchTickets().then(render)\n")
+    search.index_workspace_file("owner/repo/src/list.js")
+    (workspace / "owner/repo/src/api.js").unlink()
+    results = search.search_code(r"fetchTickets\(\)\.then", repo_name="owner/repo", regex=True, case_sensitive=True)
+    assert [r["path"] for r in results] == ["src/list.js"]
+
+
+def test_workspace_paths_are_normalized_and_walks_are_reused(tmp_path):
+    workspace = tmp_path / "workspace"
+    (workspace / "owner/repo/src").mkdir(parents=True)
+    (workspace / "owner/repo/src/a.js").write_text("const ticketBoard = 1;\n")
+    search = CodeSearch(root=str(tmp_path / "index"), workspace=str(workspace))
+    search.index_workspace_file("./owner/repo/src/a.js")
+    search.index_workspace_file("owner/repo/src/../src/a.js")
+    assert search._load("workspace").all_paths() == ["owner/repo/src/a.js"]
+    assert (tmp_path / "index/workspace.trigrams.json").exists()
+
+    assert [r["path"] for r in search.search_code("ticketBoard", repo_name="owner/repo")] == ["src/a.js"]
+    (workspace / "owner/repo/src/b.js").write_text("ticketBoard.render()\n")  # e.g. written by a shell command
+    assert len(search.search_code("ticketBoard", repo_name="owner/repo")) == 1  # walked moments ago
+    search.invalidate_workspace()
+    assert len(search.search_code("ticketBoard", repo_name="owner/repo")) == 2
@@ -0,0 +1,35 @@
+import time
+
+from tools.comment_writer import SEPARATOR, CommentWriter
+
+
+def test_bursts_are_merged_per_ticket_and_flushed():
+    posted = []
+    writer = CommentWriter(post=lambda key, text: posted.append((key, text)), window=60, min_interval=0)
+
+    writer.enqueue("kan-1", "Started work")
+    writer.enqueue("KAN-1", "Tests passing")
+    writer.enqueue("KAN-2", "QA passed")
+    assert posted == []  # nothing written inside the window
+
+    assert writer.flush()["flushed"] == 2
+    assert posted == [("KAN-1", f"Started work{SEPARATOR}Tests passing"), ("KAN-2", "QA passed")]
+    assert writer.get_stats()["merged"] == 1
+
+
+def test_background_post_retries_after_the_window():
+    attempts = []
+
+    def flaky(key, text):
+        attempts.append(text)
+        if len(attempts) == 1:
+            raise RuntimeError("503")
+
+    writer = CommentWriter(post=flaky, window=0.05, min_interval=0, backoff=0.01)
+    writer.enqueue("KAN-3", "Done")
+
+    deadline = time.monotonic() + 2
+    while writer.get_stats()["posted"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert attempts == ["Done", "Done"]
+    assert writer.get_stats()["retries"] == 1 and writer.get_stats()["pending_comments"] == 0
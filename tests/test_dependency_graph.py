@@ -0,0 +1,48 @@
+import tools.dependency_graph as dependency_graph_module
+import tools.symbol_index as symbol_index_module
+from tests.git_repos import commit, git, make_mirror
+from tools.dependency_graph import DependencyGraph, DependencyGraphService
+from tools.symbol_index import SymbolIndex
+
+EDGES = {
+    "main.py": ["routes/jira.py", "routes/github.py"],
+    "routes/jira.py": ["tools/jira_tools.py"],
+    "routes/github.py": ["tools/github_tools.py"],
+    "tools/github_tools.py": ["tools/github_client.py"],
+    "agents/dev_agent.py": ["tools/jira_tools.py", "tools/github_client.py"],
+}
+
+
+def test_reverse_and_transitive_queries():
+    graph = DependencyGraph(EDGES)
+    assert graph.dependents("tools/jira_tools.py") == {"routes/jira.py": 1, "agents/dev_agent.py": 1}
+    assert graph.dependents("tools/github_client.py", transitive=True) == {
+        "tools/github_tools.py": 1, "agents/dev_agent.py": 1, "routes/github.py": 2, "main.py": 3,
+    }
+    assert graph.dependencies("main.py", transitive=True, max_depth=2) == {
+        "routes/jira.py": 1, "routes/github.py": 1, "tools/jira_tools.py": 2, "tools/github_tools.py": 2,
+    }
+    assert graph.dependents("missing.py") == {}
+
+
+def test_impact_excludes_the_changed_files():
+    graph = DependencyGraph(EDGES)
+    assert graph.impact(["tools/jira_tools.py", "routes/jira.py"]) == {"agents/dev_agent.py": 1, "main.py": 1}
+
+
+def test_change_impact_counts_only_the_branchs_own_changes(tmp_path, monkeypatch):
+    mirror = make_mirror(tmp_path, {
+        "pkg/__init__.py": "", "pkg/core.py": "X = 1\n", "pkg/api.py": "from pkg.core import X\n",
+        "pkg/other.py": "Y = 1\n", "pkg/cli.py": "import pkg.other\n",
+    })
+    monkeypatch.setattr(dependency_graph_module, "repo_mirror", mirror)
+    monkeypatch.setattr(symbol_index_module, "repo_mirror", mirror)
+    monkeypatch.setattr(dependency_graph_module, "symbol_index", SymbolIndex(root=str(tmp_path / "index")))
+    source = tmp_path / "source"
+    git(source, "checkout", "-q", "-b", "feature")
+    commit(source, {"pkg/core.py": "X = 2\n"})
+    git(source, "checkout", "-q", "main")
+    commit(source, {"pkg/other.py": "Y = 2\n"})  # lands on main after the branch diverged
+
+    impact = DependencyGraphService().get_change_impact("o/r", "main", "feature")
+    assert impact == {"success": True, "changed": ["pkg/core.py"], "affected": ["pkg/api.py"]}
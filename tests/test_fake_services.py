@@ -0,0 +1,92 @@
+import time
+
+import pytest
+
+from tests.fake_services import FakeServices
+from tools.comment_writer import comment_writer
+from tools.figma_tools import FigmaTools
+from tools.github_client import github_client
+from tools.github_tools import GitHubTools, get_github_toolkit
+from tools.jira_tools import JiraTools
+from tools.ticket_cache import ticket_cache
+from tools.transition_cache import transition_cache
+
+
+@pytest.fixture(scope="module")
+def fake():
+    with FakeServices(seed=7, issues=120, repo_files=300).start() as services, services.use():
+        yield services
+
+
+@pytest.fixture(autouse=True)
+def clean(fake):
+    ticket_cache.invalidate()
+    transition_cache.invalidate()
+    for service in fake.faults:
+        fake.configure(service, latency=0.0, error_rate=0.0, error_status=503, rate_limit_every=0)
+
+
+def test_jira_tools_round_trip(fake):
+    tools = JiraTools()
+    created = tools.create_ticket("Export invoices as CSV", "Users can export invoices", story_points=3)
+    assert created["success"] and created["status"] == "To Do"
+
+    bulk = tools.create_tickets_bulk([
+        {"summary": "Parent story", "description": "d", "issue_type": "Story"},
+        {"summary": "Child", "description": "d", "issue_type": "Subtask", "story_points": 2, "parent_index": 0},
+    ])
+    assert bulk["created"] == 2 and bulk["results"][1]["warning"]  # points dropped for the subtask
+    assert fake.issues[bulk["results"][1]["key"]]["fields"]["parent"]["key"] == bulk["results"][0]["key"]
+
+    moved = tools.update_ticket_status(created["key"], "In Progress")
+    assert (moved["previous_status"], moved["new_status"]) == ("To Do", "In Progress")
+
+    tools.add_comment(created["key"], "Started")
+    assert comment_writer.flush(created["key"], timeout=5)
+    assert fake.comments[created["key"]][0]["body"] == "Started"
+
+    page = tools.list_tickets(max_results=50, status="In Progress")
+    assert page["items"][0]["key"] == created["key"]
+    assert all(row["status"] == "In Progress" for row in page["items"])
+    assert len(list(tools.iter_tickets())) == len(fake.issues)
+
+
+def test_github_tree_and_repo_pages(fake):
+    tools = GitHubTools()
+    tools.current_repo = "acme/webapp"
+    paths = tools._tree_paths(tools._head_sha("main"))
+    assert len(paths) == len(fake.files["acme/webapp"])
+    assert not any("/git/trees/" in key for key in github_client._cache)  # kept only in the per-SHA cache
+    with pytest.raises(ValueError):
+        tools.get_file_tree(cursor="abc")
+    with pytest.raises(ValueError):
+        tools.list_branches(cursor="2")
+
+    repos, cursor = tools._scan_pages("/user/repos", {"sort": "updated"}, None, 40, None, lambda r: r["full_name"])
+    assert repos[0]["full_name"] == "acme/webapp" and cursor is None and len(repos) == len(fake.repos)
+    repos, cursor = tools._scan_pages("/user/repos", {"sort": "updated"}, None, 0, None, lambda r: r["full_name"])
+    assert len(repos) == 1 and cursor == "1:1"  # a non-positive limit doesn't walk every page
+
+    assert get_github_toolkit("fake-token").github.get_repo("acme/webapp").full_name == "acme/webapp"  # agent tools
+
+    github_client.get("/repos/acme/webapp", ttl=0)
+    github_client.get("/repos/acme/webapp", ttl=0)
+    assert github_client.get_stats()["revalidated"] >= 1
+
+
+def test_figma_retries_after_429(fake):
+    fake.configure("figma", rate_limit_every=2, retry_after=0)
+    tools = FigmaTools()
+    assert tools.get_file("FIG0KEY", depth=1)["success"]
+    assert tools.get_file("FIG1KEY", depth=1)["success"]  # first attempt gets the 429
+
+
+def test_latency_and_error_injection(fake):
+    fake.configure("jira", latency=0.2)
+    start = time.perf_counter()
+    JiraTools().get_ticket("KAN-1")
+    assert time.perf_counter() - start >= 0.2
+
+    fake.configure("jira", latency=0.0, error_rate=1.0, error_status=500)
+    with pytest.raises(Exception):
+        JiraTools().get_ticket("KAN-2")
@@ -0,0 +1,78 @@
+from types import SimpleNamespace
+
+from camel.toolkits import FunctionTool
+
+import tools.github_budget as github_budget_module
+from tools.github_budget import GitHubRateBudget
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def _budget(clock, remaining, limit=5000, reset_in=600):
+    budget = GitHubRateBudget(reserve=100, throttle_below=0.3, clock=clock, sleep=clock.sleep)
+    budget.update_from_headers({
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Reset": str(int(clock.now + reset_in)),
+    })
+    return budget
+
+
+def test_background_calls_are_paced_only_when_the_budget_is_low():
+    clock = FakeClock()
+    assert _budget(clock, remaining=4000).acquire("background") == 0
+
+    budget = _budget(clock, remaining=700)  # 600 above the reserve, 600s to the reset
+    assert budget.acquire("background") == 0
+    assert budget.acquire("background") == 1.0
+    assert budget.acquire("interactive") == 0
+    assert budget.get_stats()["throttling"] is True
+
+
+def test_reserve_is_kept_for_interactive_calls():
+    clock = FakeClock()
+    budget = _budget(clock, remaining=100, reset_in=90)
+    assert budget.acquire("interactive") == 0
+    assert budget.acquire("background") == 90  # waits for the reset
+    assert budget.get_stats()["lanes"]["background"]["throttled"] == 1
+
+
+def test_secondary_rate_limit_pauses_both_lanes_briefly():
+    clock = FakeClock()
+    budget = _budget(clock, remaining=4000)
+    budget.update_from_headers({"Retry-After": "60"}, status_code=403)
+    assert budget.acquire("interactive") == 5.0  # capped for interactive routes
+    assert budget.acquire("background") == 55.0
+
+
+def test_budgeted_tools_wraps_copies_once(monkeypatch):
+    def get_issue(number: int) -> str:
+        """
+        Gets an issue.
+
+        Args:
+            number (int): Issue number.
+        """
+        return f"issue {number}"
+
+    acquired = []
+    monkeypatch.setattr(github_budget_module.github_budget, "acquire", acquired.append)
+    monkeypatch.setattr(github_budget_module.github_budget, "update", lambda *args: None)
+    shared = [FunctionTool(get_issue)]
+    requester = SimpleNamespace(rate_limiting=(4000, 5000), rate_limiting_resettime=0)
+    toolkit = SimpleNamespace(get_tools=lambda: shared, github=SimpleNamespace(requester=requester))
+
+    first, second = github_budget_module.budgeted_tools(toolkit), github_budget_module.budgeted_tools(toolkit)
+    assert second[0]("7") == "issue 7" and acquired == ["background"]  # paced once, not twice
+    assert shared[0].func is get_issue and first[0] is not second[0]
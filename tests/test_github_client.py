@@ -0,0 +1,114 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from tools.github_client import GitHubRestClient
+
+
+class FakeGitHub(BaseHTTPRequestHandler):
+    """Serves /repos/o/r with an ETag and answers If-None-Match with 304."""
+    requests_seen = []
+
+    def do_GET(self):
+        FakeGitHub.requests_seen.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = json.dumps({"full_name": "o/r"}).encode()
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_conditional_requests_and_invalidation():
+    server = HTTPServer(("127.0.0.1", 0), FakeGitHub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = GitHubRestClient(ttl=60)
+    client.base_url = f"http://127.0.0.1:{server.server_port}"
+    FakeGitHub.requests_seen = []
+
+    assert client.get("/repos/o/r")[0]["full_name"] == "o/r"   # miss
+    assert client.get("/repos/o/r")[0]["full_name"] == "o/r"   # fresh hit, no request
+    assert client.get("/repos/o/r", ttl=0)[0]["full_name"] == "o/r"  # revalidated via 304
+    client.invalidate("/repos/o/r")
+    client.get("/repos/o/r")                                   # miss again
+    server.shutdown()
+
+    assert FakeGitHub.requests_seen == [None, '"v1"', None]
+    stats = client.get_stats()
+    assert (stats["hits"], stats["revalidated"], stats["misses"]) == (1, 1, 2)
+    assert stats["hit_rate"] == 0.5
+
+
+class FakeRepoList(BaseHTTPRequestHandler):
+    """Serves 250 repos from /user/repos, 100 per page, with Link headers."""
+    pages_seen = []
+
+    def do_GET(self):
+        params = parse_qs(urlparse(self.path).query)
+        page, per_page = int(params["page"][0]), int(params["per_page"][0])
+        FakeRepoList.pages_seen.append(page)
+        repos = [{"full_name": f"o/{'api' if i % 50 == 0 else 'web'}-{i}", "name": f"r{i}"} for i in range(250)]
+        body = json.dumps(repos[(page - 1) * per_page:page * per_page]).encode()
+        self.send_response(200)
+        if page * per_page < len(repos):
+            self.send_header("Link", f'<http://x/user/repos?page={page + 1}>; rel="next"')
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_repo_listing_fetches_only_needed_pages():
+    from tools.github_client import github_client
+    from tools.github_tools import GitHubTools
+
+    server = HTTPServer(("127.0.0.1", 0), FakeRepoList)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    original_url = github_client.base_url
+    github_client.base_url = f"http://127.0.0.1:{server.server_port}"
+    github_client.invalidate()
+    tools = GitHubTools()
+    tools.toolkit = object()
+    FakeRepoList.pages_seen = []
+    try:
+        first = tools.list_user_repos(limit=20)
+        assert len(first["items"]) == 20 and first["next_cursor"] == "1:20"
+        second = tools.list_user_repos(cursor=first["next_cursor"], limit=90)
+        assert second["items"][0]["full_name"] == "o/web-20" and second["next_cursor"] == "2:10"
+        assert FakeRepoList.pages_seen == [1, 2]  # page 1 came from the cache the second time
+
+        filtered = tools.list_user_repos(query="API", limit=10)
+        assert [r["full_name"] for r in filtered["items"]] == [f"o/api-{i}" for i in range(0, 250, 50)]
+        assert filtered["next_cursor"] is None
+    finally:
+        server.shutdown()
+        github_client.base_url = original_url
+        github_client.invalidate()
+
+
+def test_cache_is_bounded_least_recently_used_first():
+    server = HTTPServer(("127.0.0.1", 0), FakeGitHub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = GitHubRestClient(ttl=60, max_entries=2)
+    client.base_url = f"http://127.0.0.1:{server.server_port}"
+
+    client.get("/repos/o/r", params={"page": 1})
+    client.get("/repos/o/r", params={"page": 2})
+    client.get("/repos/o/r", params={"page": 1})   # hit: page 1 becomes most recent
+    client.get("/repos/o/r", params={"page": 3})   # evicts page 2
+    server.shutdown()
+
+    assert client.get_stats()["entries"] == 2
+    assert [k.rsplit("=", 1)[1] for k in client._cache] == ["1", "3"]
@@ -0,0 +1,32 @@
+import threading
+import time
+
+import anyio
+
+from tools.integration_executor import IntegrationExecutor
+
+
+def test_slow_integration_does_not_hold_up_others():
+    executor = IntegrationExecutor({"jira": 1, "github": 2})
+    release = threading.Event()
+    finished = []
+
+    async def jira_call(name):
+        await executor.run("jira", release.wait, 5)
+        finished.append(name)
+
+    async def main():
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(jira_call, "jira-1")
+            tg.start_soon(jira_call, "jira-2")
+            await anyio.sleep(0.05)
+            assert executor.get_stats()["jira"]["waiting"] == 1   # second Jira call queued behind the limit
+            start = time.perf_counter()
+            assert await executor.run("github", lambda: "ok") == "ok"
+            assert time.perf_counter() - start < 1
+            finished.append("github")
+            release.set()
+
+    anyio.run(main)
+    assert finished[0] == "github"
+    assert executor.get_stats()["jira"]["calls"] == 2
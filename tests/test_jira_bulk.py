@@ -0,0 +1,33 @@
+def test_bulk_create_chunks_and_links_parents_created_in_the_same_call(fake_jira):
+    tools = fake_jira.tools()
+    tickets = [{"summary": "Story", "description": "d", "issue_type": "Story", "story_points": 5}]
+    tickets += [{"summary": f"Sub {i}", "parent_index": 0} for i in range(60)]
+
+    result = tools.create_tickets_bulk(tickets)
+
+    assert result["created"] == 61 and result["requests"] == 3
+    assert [len(call) for call in fake_jira.created] == [1, 50, 10]
+    assert fake_jira.created[0][0]["customfield_10026"] == 5
+    assert fake_jira.created[1][0]["parent"] == {"key": "KAN-1"}
+    assert fake_jira.created[1][0]["issuetype"] == {"name": "Subtask"}
+
+
+def test_bulk_create_reports_per_item_errors_and_drops_unsupported_story_points(fake_jira):
+    tools = fake_jira.tools()
+    tickets = [
+        {"summary": "bad"},
+        {"summary": "Child of bad", "parent_index": 0},
+        {"summary": "Estimated subtask", "story_points": 3},
+        {"description": "no summary"},
+        {"summary": "Child of no summary", "parent_index": 3},
+    ]
+
+    result = tools.create_tickets_bulk(tickets, parent_key="KAN-100")
+
+    assert result["success"] is False and result["created"] == 1 and result["failed"] == 4
+    assert result["results"][0]["error"] == {"summary": "rejected"}
+    assert "was not created" in result["results"][1]["error"]
+    assert result["results"][2]["warning"] == "Created without story points"
+    assert result["results"][3]["error"] == "Missing 'summary'"
+    assert "was not created" in result["results"][4]["error"]
+    assert len(fake_jira.created) == 2  # one bulk request plus the retry without story points
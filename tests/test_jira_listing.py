@@ -0,0 +1,23 @@
+def test_list_tickets_projects_fields_filters_and_pages(fake_jira):
+    for n in (1, 2, 3):
+        fake_jira.add_issue(n)
+    tools = fake_jira.tools()
+
+    page = tools.list_tickets(max_results=2, status='To Do,Say "hi"', fields=["summary", "status", "assignee"])
+
+    assert fake_jira.searches[0]["fields"] == ["summary", "status", "assignee"]
+    assert fake_jira.searches[0]["jql"] == 'project = KAN AND status in ("To Do", "Say \\"hi\\"") ORDER BY created DESC'
+    assert page["items"][0] == {"key": "KAN-1", "url": f"{tools.base_url}/browse/KAN-1",
+                                "summary": "Ticket 1", "status": "To Do", "assignee": "Unassigned"}
+    assert page["next_cursor"] == "2"
+    assert tools.list_tickets(max_results=2, cursor=page["next_cursor"])["next_cursor"] is None
+
+
+def test_iter_tickets_walks_every_page(fake_jira):
+    for n in (1, 2, 3):
+        fake_jira.add_issue(n)
+
+    keys = [t["key"] for t in fake_jira.tools().iter_tickets(fields=["parent_key"])]
+
+    assert keys == ["KAN-1", "KAN-2", "KAN-3"]
+    assert fake_jira.searches[0]["fields"] == ["parent"]
@@ -0,0 +1,60 @@
+import pytest
+
+
+def test_full_then_incremental_sync_serves_filtered_pages(fake_jira):
+    fake_jira.add_issue(1)
+    fake_jira.add_issue(2, labels=["ui"])
+    fake_jira.add_issue(3, "Done")
+    mirror, tools = fake_jira.mirror, fake_jira.tools()
+    assert not mirror.is_ready("KAN")
+    assert mirror.sync(tools) == {"project": "KAN", "full": True, "updated": 3, "deleted": 0}
+
+    fake_jira.add_issue(1, "In Progress", updated="new")
+    result = mirror.sync(tools)
+    assert result["updated"] == 1 and 'updated >= "-2m"' in fake_jira.searches[-1]["jql"]
+
+    calls = len(fake_jira.searches) + len(fake_jira.reads)
+    page = tools.list_tickets(max_results=2, fields=["status"])
+    assert [t["key"] for t in page["items"]] == ["KAN-3", "KAN-2"] and page["next_cursor"].startswith("m:")
+    assert tools.list_tickets(cursor=page["next_cursor"], fields=["status"])["items"][0]["status"] == "In Progress"
+    assert [t["key"] for t in tools.list_tickets(status="in progress,done")["items"]] == ["KAN-3", "KAN-1"]
+    assert [t["key"] for t in tools.list_tickets(label="UI")["items"]] == ["KAN-2"]
+    assert tools.get_ticket("KAN-2")["summary"] == "Ticket 2"
+    assert len(fake_jira.searches) + len(fake_jira.reads) == calls  # all reads came from the mirror
+    assert mirror.get_stats("KAN")["lag_seconds"] < 5
+
+
+def test_reconcile_drops_deleted_issues_and_writes_mark_rows_stale(fake_jira):
+    fake_jira.add_issue(1)
+    fake_jira.add_issue(2)
+    mirror, tools = fake_jira.mirror, fake_jira.tools()
+    mirror.sync(tools)
+
+    del fake_jira.issues["KAN-2"]
+    mirror.reconcile_interval = 0
+    assert mirror.sync(tools)["deleted"] == 1
+    assert [t["key"] for t in tools.list_tickets()["items"]] == ["KAN-1"]
+
+    fake_jira.add_issue(1, "Done")
+    tools._changed("KAN-1")
+    assert mirror.get("KAN-1", tools.base_url) is None
+    assert tools.list_tickets()["items"][0]["status"] == "Done"  # stale row re-read before the page is served
+    assert fake_jira.reads[-1] == "KAN-1" and mirror.get("KAN-1", tools.base_url)["status"] == "Done"
+
+
+def test_malformed_and_expired_cursors_are_rejected(monkeypatch, fake_jira):
+    fake_jira.add_issue(1)
+    mirror, tools = fake_jira.mirror, fake_jira.tools()
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        tools.list_tickets(cursor="m:garbage")
+    with pytest.raises(ValueError, match="expired"):
+        tools.list_tickets(cursor="m:2026-01-01|KAN-1")  # the mirror is gone; don't send it to Jira
+    assert fake_jira.searches == [] and fake_jira.reads == []
+
+    mirror.sync(tools)
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        tools.list_tickets(cursor="m:garbage")
+    monkeypatch.setattr(mirror, "is_ready", lambda project: False)
+    fake_jira.deploymentType = "Server"
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        tools.list_tickets(cursor="abc")  # Data Center pages by offset
@@ -0,0 +1,90 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import httpx
+
+from tools.llm_governor import LLMRateGovernor, TokenBucket
+
+
+class FakeModelEndpoint(BaseHTTPRequestHandler):
+    """Local stand-in for the Azure endpoint: the first N calls return 429."""
+    throttle_remaining = 0
+    calls = 0
+
+    def do_POST(self):
+        FakeModelEndpoint.calls += 1
+        if FakeModelEndpoint.throttle_remaining > 0:
+            FakeModelEndpoint.throttle_remaining -= 1
+            self.send_response(429)
+            self.send_header("Retry-After", "0.2")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(b'{"usage": {"total_tokens": 10}}')
+
+    def log_message(self, *args):
+        pass
+
+
+def _start_fake_endpoint():
+    server = HTTPServer(("127.0.0.1", 0), FakeModelEndpoint)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def test_token_bucket_wait_time():
+    now = [0.0]
+    bucket = TokenBucket(60, clock=lambda: now[0])
+    bucket.consume(60)
+    assert bucket.time_until(1) == 1.0
+    now[0] = 1.0
+    assert bucket.time_until(1) == 0.0
+
+
+def test_governor_honors_retry_after_from_endpoint():
+    server = _start_fake_endpoint()
+    FakeModelEndpoint.throttle_remaining = 2
+    FakeModelEndpoint.calls = 0
+    url = f"http://127.0.0.1:{server.server_port}/chat"
+
+    def call_model():
+        response = httpx.post(url, json={})
+        response.raise_for_status()
+        return response.json()
+
+    governor = LLMRateGovernor(requests_per_minute=6000, tokens_per_minute=100000, max_retries=3)
+    start = time.monotonic()
+    result = governor.call(call_model, lane="interactive", tokens=50)
+    elapsed = time.monotonic() - start
+    server.shutdown()
+
+    assert result["usage"]["total_tokens"] == 10
+    assert FakeModelEndpoint.calls == 3
+    assert elapsed >= 0.4
+    stats = governor.get_stats()["lanes"]["interactive"]
+    assert stats["rate_limited"] == 2
+    assert stats["calls"] == 3
+
+
+def test_interactive_lane_goes_first():
+    governor = LLMRateGovernor(requests_per_minute=60, tokens_per_minute=100000)
+    governor.requests.consume(60)  # Empty bucket: next slot in ~1s
+    order = []
+
+    def worker(lane):
+        governor.acquire(lane)
+        order.append(lane)
+
+    background = threading.Thread(target=worker, args=("background",))
+    background.start()
+    time.sleep(0.1)
+    interactive = threading.Thread(target=worker, args=("interactive",))
+    interactive.start()
+    background.join(5)
+    interactive.join(5)
+
+    assert order == ["interactive", "background"]
+    assert governor.get_stats()["lanes"]["background"]["max_wait"] > 1.0
@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+
+from config.model_config import ModelRouter
+
+
+def _completion(content="ok", finish_reason="stop", prompt_tokens=100, completion_tokens=20):
+    """Stub ChatCompletion as returned by the model endpoint."""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(finish_reason=finish_reason,
+                                 message=SimpleNamespace(content=content, tool_calls=None))],
+        usage=SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens),
+    )
+
+
+def _tool_call(name):
+    return {"role": "assistant", "content": None,
+            "tool_calls": [{"id": name, "type": "function", "function": {"name": name, "arguments": "{}"}}]}
+
+
+def _router(**routes):
+    return ModelRouter(routes=routes, costs={"heavy": [1.0, 2.0], "light": [0.1, 0.2]}, escalate_tool_calls=3)
+
+
+def _stub_runners(calls, light_result=None):
+    return {
+        "heavy": lambda m, f, t: calls.append("heavy") or _completion(),
+        "light": lambda m, f, t: calls.append("light") or (light_result or _completion()),
+    }
+
+
+def test_planning_turn_goes_to_light_tier():
+    router, calls = _router(), []
+    messages = [{"role": "user", "content": "Work on KAN-1"}, _tool_call("get_ticket"),
+                {"role": "tool", "tool_call_id": "get_ticket", "content": "{}"}]
+    router.dispatch("dev", _stub_runners(calls), messages)
+    assert calls == ["light"]
+    assert router.get_stats()["tiers"]["light"]["cost_usd"] == (100 * 0.1 + 20 * 0.2) / 1000.0
+
+
+def test_chat_turn_and_config_override():
+    router, calls = _router(**{"specs:chat": "light"}), []
+    router.dispatch("dev", _stub_runners(calls), [{"role": "user", "content": "hi"}])
+    router.dispatch("specs", _stub_runners(calls), [{"role": "user", "content": "hi"}])
+    assert calls == ["heavy", "light"]
+
+
+def test_tool_heavy_turn_escalates():
+    router, calls = _router(), []
+    messages = [{"role": "user", "content": "go"}] + [_tool_call("execute_command")] * 2 + [_tool_call("get_ticket")]
+    router.dispatch("dev", _stub_runners(calls), messages)
+    assert calls == ["heavy"]
+
+
+def test_truncated_light_answer_is_retried_on_heavy():
+    router, calls = _router(**{"specs:chat": "light"}), []
+    router.dispatch("specs", _stub_runners(calls, _completion(finish_reason="length")),
+                    [{"role": "user", "content": "bug or feature?"}])
+    assert calls == ["light", "heavy"]
+    assert router.get_stats()["tiers"]["heavy"]["escalations"] == 1
+
+
+def test_prompt_cache_accounting_and_prefix_changes():
+    router = _router()
+    cached = _completion(prompt_tokens=1000)
+    cached.usage.prompt_tokens_details = SimpleNamespace(cached_tokens=800)
+    runners = {"heavy": lambda m, f, t: cached}
+    system = {"role": "system", "content": "static prompt"}
+
+    router.dispatch("specs", runners, [system, {"role": "user", "content": "a"}])
+    router.dispatch("specs", runners, [system, {"role": "user", "content": "b"}])
+    stats = router.get_stats()["prompt_cache"]["specs"]
+    assert stats["prefix_changes"] == 0
+    assert stats["uncached_tokens"] == 400
+    assert stats["hit_rate"] == 0.8
+
+    router.dispatch("specs", runners, [{"role": "system", "content": "changed"}, {"role": "user", "content": "c"}])
+    assert router.get_stats()["prompt_cache"]["specs"]["prefix_changes"] == 1
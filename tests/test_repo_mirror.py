@@ -0,0 +1,80 @@
+import subprocess
+
+import pytest
+
+import tools.repo_mirror as repo_mirror_module
+from tests.git_repos import commit, make_mirror
+
+
+def test_reads_come_from_the_mirror_and_ensure_fetches_new_commits(tmp_path):
+    mirror = make_mirror(tmp_path, {"a.py": "a = 1\n", "src/x.py": "x = 2\n"})
+    first = mirror.resolve("o/r")
+    assert mirror.list_repo_files("o/r") == ["a.py", "src/x.py"]
+    assert mirror.list_repo_files("o/r", path="src/") == ["src/x.py"]
+    assert mirror.read_repo_file("o/r", "/src/x.py") == "x = 2\n"
+    assert mirror.read_repo_file("o/r", "nope.py").startswith("Error: git show failed")
+
+    commit(tmp_path / "source", {"a.py": "a = 3\n"})
+    assert mirror.resolve("o/r", "main") == first  # not fetched yet
+    assert mirror.ensure("o/r")["action"] == "refreshed"
+    assert mirror.resolve("o/r", "main") != first
+    assert mirror.read_repo_file("o/r", "a.py", ref=first) == "a = 1\n"
+    assert mirror.read_repo_file("o/r", "a.py") == "a = 3\n"
+
+
+def test_option_like_refs_and_unsafe_repo_names_are_rejected(tmp_path):
+    mirror = make_mirror(tmp_path, {"a.py": "a = 1\n"})
+    with pytest.raises(ValueError):
+        mirror.resolve("o/r", "--output=/tmp/pwned")
+    with pytest.raises(ValueError):
+        mirror.diff("o/r", "HEAD", "-p")
+    assert mirror.read_repo_file("o/r", "a.py", ref="--output=/tmp/pwned").startswith("Error: Invalid ref")
+    assert mirror.checkout_repo("../../etc")["success"] is False
+    assert mirror.ensure("o/..")["success"] is False
+
+
+def test_checkout_updates_past_untracked_files_but_keeps_local_edits(tmp_path, monkeypatch):
+    mirror = make_mirror(tmp_path, {"a.py": "a = 1\n", "b.py": "b = 1\n"})
+    monkeypatch.chdir(tmp_path)
+    workspace = tmp_path / "workspace/o/r"
+    assert mirror.checkout_repo("o/r")["action"] == "cloned"
+
+    (workspace / "notes.txt").write_text("scratch")
+    commit(tmp_path / "source", {"a.py": "a = 2\n"})
+    result = mirror.checkout_repo("o/r")
+    assert result["action"] == "reset" and "warning" not in result  # untracked files don't block it
+    assert (workspace / "a.py").read_text() == "a = 2\n" and (workspace / "notes.txt").exists()
+
+    (workspace / "b.py").write_text("b = 'edited'\n")
+    commit(tmp_path / "source", {"a.py": "a = 3\n"})
+    result = mirror.checkout_repo("o/r")
+    assert result["action"] == "fetched" and "Uncommitted changes kept" in result["warning"]
+    assert (workspace / "a.py").read_text() == "a = 2\n" and (workspace / "b.py").read_text() == "b = 'edited'\n"
+
+    assert mirror.checkout_repo("o/r", discard_changes=True)["action"] == "reset"
+    assert (workspace / "a.py").read_text() == "a = 3\n" and (workspace / "b.py").read_text() == "b = 1\n"
+
+
+def test_reads_fetch_when_github_has_moved_past_the_mirror(tmp_path, monkeypatch):
+    mirror = make_mirror(tmp_path, {"a.py": "a = 1\n"})
+    mirror.access_token = "token"
+    source = tmp_path / "source"
+    heads = {}
+
+    class FakeGitHub:
+        def get(self, path, **kwargs):
+            heads[path] = subprocess.run(["git", "rev-parse", "HEAD"], cwd=source, capture_output=True,
+                                         text=True, check=True).stdout.strip()
+            return {"sha": heads[path]}, {}
+
+    monkeypatch.setattr(repo_mirror_module, "github_client", FakeGitHub())
+    fetches = []
+    monkeypatch.setattr(mirror, "ensure", lambda name, ensure=mirror.ensure: fetches.append(name) or ensure(name))
+
+    assert mirror.read_repo_file("o/r", "a.py") == "a = 1\n"
+    assert fetches == []  # GitHub and the mirror agree
+
+    commit(source, {"a.py": "a = 2\n"})  # a push
+    assert mirror.read_repo_file("o/r", "a.py") == "a = 2\n"
+    assert mirror.list_repo_files("o/r") == ["a.py"]
+    assert fetches == ["o/r"] and list(heads) == ["/repos/o/r/commits/HEAD"]
@@ -0,0 +1,75 @@
+from tools.symbol_index import SymbolIndex, parse_js, parse_python
+
+ROUTES_PY = '''
+from fastapi import APIRouter
+from tools.jira_tools import JiraTools
+from . import helpers
+
+router = APIRouter(prefix="/jira", tags=["jira"])
+
+class TicketService:
+    def list(self):
+        pass
+
+@router.get("/tickets")
+async def list_tickets():
+    return []
+'''
+
+PAGE_JSX = '''
+import React from 'react';
+import { TaskTile } from './TaskTile';
+const Api = require('../api');
+
+export const AgentHub = () => <Route path="/hub" element={<TaskTile />} />;
+app.get('/health', handler);
+export default AgentHub;
+'''
+
+
+def test_parse_python_extracts_symbols_and_prefixed_routes():
+    parsed = parse_python("routes/jira.py", ROUTES_PY)
+    names = {d["name"] for d in parsed["definitions"]}
+    assert {"TicketService", "TicketService.list", "list_tickets", "router"} <= names
+    assert "tools.jira_tools" in parsed["imports"]
+    assert "routes.helpers" in parsed["imports"]
+    assert parsed["routes"] == [{"method": "GET", "path": "/jira/tickets", "handler": "list_tickets", "line": 13}]
+
+
+def test_parse_js_extracts_imports_exports_and_routes():
+    parsed = parse_js("src/AgentHub.jsx", PAGE_JSX)
+    assert parsed["imports"] == ["react", "./TaskTile", "../api"]
+    assert parsed["exports"] == ["AgentHub"]
+    assert {(r["method"], r["path"]) for r in parsed["routes"]} == {("PAGE", "/hub"), ("GET", "/health")}
+
+
+def test_incremental_update_resolves_and_drops_imports():
+    index = SymbolIndex(root="/tmp/unused")
+    built = index.index_sources({
+        "routes/jira.py": ROUTES_PY,
+        "tools/jira_tools.py": "class JiraTools:\n    pass\n",
+        "src/AgentHub.jsx": PAGE_JSX,
+        "src/TaskTile.jsx": "export const TaskTile = () => null;\n",
+    }, commit="a")
+    assert built["resolved"]["routes/jira.py"] == ["tools/jira_tools.py"]
+    assert built["resolved"]["src/AgentHub.jsx"] == ["src/TaskTile.jsx"]
+
+    updated = index.index_sources({}, commit="b", base=built, deleted=["tools/jira_tools.py"])
+    assert updated["resolved"]["routes/jira.py"] == []
+    assert "tools/jira_tools.py" in built["files"]  # the previous index is left untouched
+
+
+def test_only_imports_under_source_roots_resolve():
+    built = SymbolIndex(root="/tmp/unused").index_sources({
+        "pkg/__init__.py": "",
+        "pkg/json.py": "",
+        "scripts/requests.py": "",
+        "src/app/__init__.py": "",
+        "src/app/models.py": "",
+        "pkg/main.py": (
+            "import json\nimport requests\nfrom typing import TYPE_CHECKING\n"
+            "if TYPE_CHECKING:\n    from app.models import User\n"
+            "def load():\n    from pkg import json as local_json\n"
+        ),
+    })
+    assert built["resolved"]["pkg/main.py"] == ["pkg/__init__.py", "src/app/models.py"]
@@ -0,0 +1,39 @@
+from camel.toolkits import FunctionTool
+
+from models.agent_state import MAX_TIMINGS, AgentTiming
+from tools.progress_tracker import progress_tracker
+from tools.telemetry import instrument_tools
+
+
+def read_file(path: str) -> str:
+    """
+    Reads a file.
+
+    Args:
+        path (str): File path.
+    """
+    return f"contents of {path}"
+
+
+def test_shared_tool_is_timed_under_each_agents_task():
+    shared = [FunctionTool(read_file)]
+    progress_tracker.init_task("telemetry-a", ["A"])
+    progress_tracker.init_task("telemetry-b", ["B"])
+    tools_a = instrument_tools(shared, "telemetry-a")
+    tools_b = instrument_tools(shared, "telemetry-b")
+
+    tools_b[0]("x.py")
+    tools_b[0]("y.py")
+    tools_a[0]("z.py")
+
+    assert shared[0].func is read_file  # originals untouched
+    assert progress_tracker.get_timings("telemetry-a")["tools"]["read_file"]["calls"] == 1
+    assert progress_tracker.get_timings("telemetry-b")["tools"]["read_file"]["calls"] == 2
+    assert tools_a[0].get_openai_tool_schema() == shared[0].get_openai_tool_schema()
+
+
+def test_timings_are_capped_for_long_lived_tasks():
+    for i in range(MAX_TIMINGS + 5):
+        progress_tracker.record_timing("telemetry-chat", AgentTiming(kind="tool", name="t", started_at=i, duration=0.0))
+    timings = progress_tracker.get_timings("telemetry-chat")
+    assert len(timings["calls"]) == MAX_TIMINGS and timings["calls"][0]["started_at"] == 5
@@ -0,0 +1,28 @@
+from tools.ticket_cache import TicketCache
+
+
+def test_projection_widening_ttl_and_invalidation():
+    cache = TicketCache(ttl=60)
+    calls = []
+
+    def loader(key, fields):
+        calls.append((key, fields))
+        return {"key": key, "fields": fields}
+
+    cache.get("kan-1", ["summary", "status"], loader)
+    assert cache.get("KAN-1", ["status"], loader)["fields"] == "status,summary"   # subset: hit
+    cache.get("KAN-1", ["assignee"], loader)                                       # new field: widened fetch
+    assert calls[-1] == ("KAN-1", "assignee,status,summary")
+    cache.get("KAN-1", ["summary"], loader)
+
+    cache.invalidate("kan-1")
+    cache.get("KAN-1", ["summary"], loader)
+    assert len(calls) == 3
+
+    cache.ttl = 0
+    cache.get("KAN-1", ["summary"], loader)
+    assert len(calls) == 4
+
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["invalidations"]) == (2, 4, 1)
+    assert stats["hit_rate"] == 2 / 6
@@ -0,0 +1,55 @@
+import threading
+
+import tools.jira_tools as jira_tools_module
+from tools.jira_tools import JiraTools
+from tools.ticket_similarity import TicketSimilarityIndex, terms
+
+TICKETS = [
+    {"key": "KAN-1", "summary": "Add password reset via email", "description": "Send a reset link to the user's email",
+     "status": "To Do"},
+    {"key": "KAN-2", "summary": "Dark mode toggle", "description": "Theme switch in the settings page", "status": "Done"},
+    {"key": "KAN-3", "summary": "Export tickets to CSV", "description": "Download the board as a CSV file",
+     "status": "In Progress"},
+]
+
+
+def test_terms_drop_stopwords_and_fold_plurals():
+    assert terms("The Users want Tickets and Stories") == ["ticket", "story"]
+
+
+def test_query_ranks_duplicates_and_follows_updates():
+    index = TicketSimilarityIndex()
+    index.load(TICKETS)
+
+    matches = index.query("Reset password email link", k=2)
+    assert matches[0]["key"] == "KAN-1" and matches[0]["score"] > 0.5
+    assert all(m["key"] != "KAN-2" for m in matches)
+
+    index.update("KAN-2", summary="CSV export of tickets")
+    assert [m["key"] for m in index.query("export tickets csv", k=2)] == ["KAN-3", "KAN-2"]
+
+    index.on_mirror_change([], ["KAN-3"])
+    assert [m["key"] for m in index.query("export tickets csv")] == ["KAN-2"]
+
+
+def test_proposals_carry_similar_tickets(monkeypatch):
+    index = TicketSimilarityIndex()
+    monkeypatch.setattr(jira_tools_module, "ticket_similarity", index)
+    tools = JiraTools()
+    loaded = threading.Event()
+
+    def slow_listing(**kwargs):
+        loaded.wait(5)
+        yield from TICKETS
+
+    tools.iter_tickets = slow_listing
+
+    cold = tools.propose_ticket("Password reset email", "Users get a reset link by email")
+    assert cold["similar_tickets"] == []  # the index loads in the background
+    assert tools.find_similar_tickets("reset")["note"]
+    loaded.set()
+    assert index.wait(timeout=5)
+
+    proposal = tools.propose_ticket("Password reset email", "Users get a reset link by email")
+    assert [t["key"] for t in proposal["similar_tickets"]] == ["KAN-1"]
+    assert tools.find_similar_tickets("dark theme")["matches"][0]["key"] == "KAN-2"
@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+
+import tools.jira_tools as jira_tools_module
+from tools.jira_client import JiraClientFactory
+from tools.jira_tools import JiraTools
+from tools.ticket_cache import TicketCache
+from tools.transition_cache import TransitionCache, find_transition
+
+WORKFLOW = [
+    {"id": "11", "name": "Start Progress", "to": {"name": "In Progress"}},
+    {"id": "31", "name": "Done", "to": {"name": "Done"}},
+]
+
+
+class FakeJira:
+    def __init__(self):
+        self.status = "To Do"
+        self.workflow = list(WORKFLOW)
+        self.calls = []
+
+    def issue(self, key, fields=None):
+        self.calls.append("issue")
+        return SimpleNamespace(key=key, fields=SimpleNamespace(status=self.status))
+
+    def transitions(self, key):
+        self.calls.append("transitions")
+        return self.workflow
+
+    def transition_issue(self, key, transition_id):
+        self.calls.append(f"post {transition_id}")
+        match = [t for t in self.workflow if t["id"] == transition_id]
+        if not match:
+            raise RuntimeError("Transition id is not valid")
+
+
+def _tools(monkeypatch, fake):
+    factory = JiraClientFactory()
+    factory._client = fake
+    monkeypatch.setattr(jira_tools_module, "jira_client", factory)
+    monkeypatch.setattr(jira_tools_module, "ticket_cache", TicketCache(ttl=60))
+    monkeypatch.setattr(jira_tools_module, "transition_cache", TransitionCache(ttl=3600))
+    return JiraTools()
+
+
+def test_find_transition_matches_names_targets_and_synonyms():
+    assert find_transition(WORKFLOW, "start progress")["id"] == "11"
+    assert find_transition(WORKFLOW, "In Progress")["id"] == "11"
+    assert find_transition(WORKFLOW, "doing")["id"] == "11"
+    assert find_transition(WORKFLOW, "resolved")["id"] == "31"
+    assert find_transition(WORKFLOW, "Blocked") is None
+
+
+def test_cached_transition_is_a_single_post_and_refreshes_when_rejected(monkeypatch):
+    fake = FakeJira()
+    tools = _tools(monkeypatch, fake)
+    assert tools.update_ticket_status("KAN-1", "In Progress")["new_status"] == "In Progress"
+
+    fake.calls.clear()
+    jira_tools_module.ticket_cache.get("KAN-2", ("status",), fake.issue)  # status already cached
+    fake.calls.clear()
+    assert tools.update_ticket_status("KAN-2", "in progress")["success"]
+    assert fake.calls == ["post 11"]
+
+    fake.workflow = [{"id": "12", "name": "Start Progress", "to": {"name": "In Progress"}}]
+    fake.calls.clear()
+    assert tools.update_ticket_status("KAN-3", "Start Progress")["success"]
+    assert fake.calls == ["issue", "post 11", "issue", "transitions", "post 12"]
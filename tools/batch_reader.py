@@ -0,0 +1,110 @@
+import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from logging_config.logger import logger
+from tools.github_client import github_client
+from tools.progress_tracker import progress_tracker
+from tools.repo_mirror import repo_mirror
+
+MAX_FILE_CHARS = 60_000
+MAX_TOTAL_CHARS = 300_000
+FETCH_CONCURRENCY = 8
+
+
+class BatchFileReader:
+    """
+    Reads many repository files in one tool call: a single `git cat-file --batch`
+    against the local mirror, or concurrent contents API requests when there is no
+    mirror. Files already returned during the current task are not sent again.
+    """
+
+    def __init__(self, task_id: str):
+        self.task_id = task_id
+        self._lock = threading.Lock()
+        # (task progress object, {(repo, ref, path)}) - reset when the task is re-initialized
+        self._session: Tuple[Any, Set[Tuple[str, str, str]]] = (None, set())
+
+    def _seen(self) -> Set[Tuple[str, str, str]]:
+        current = progress_tracker.tasks.get(self.task_id)
+        if self._session[0] is not current:
+            self._session = (current, set())
+        return self._session[1]
+
+    @staticmethod
+    def _fetch_from_api(repo_name: str, paths: List[str], ref: str) -> Dict[str, str]:
+        def fetch(path: str) -> Optional[str]:
+            try:
+                data, _ = github_client.get(f"/repos/{repo_name}/contents/{path}", params={"ref": ref},
+                                           lane="background")
+                if isinstance(data, dict) and data.get("encoding") == "base64":
+                    return base64.b64decode(data["content"]).decode("utf-8", errors="replace")
+            except Exception as e:
+                logger.debug(f"Failed to fetch {repo_name}:{path}: {e}")
+            return None
+
+        with ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY) as pool:
+            contents = pool.map(fetch, paths)
+        return {path: text for path, text in zip(paths, contents) if text is not None}
+
+    def read_files(self, repo_name: str, paths: List[str], ref: str = "HEAD", force: bool = False) -> Dict[str, Any]:
+        """
+        Reads several repository files in ONE call. Prefer this over reading files one by one.
+        Large files are truncated, and files you already read in this task are listed under
+        "already_read" instead of being returned again (use force=True to re-read them).
+
+        Args:
+            repo_name (str): Full repository name (e.g., 'owner/repo').
+            paths (List[str]): File paths within the repository (e.g., ['src/App.jsx', 'routes/jira.py']).
+            ref (str, optional): Branch, tag or commit SHA. Defaults to the default branch.
+            force (bool, optional): Return files even if they were already read. Defaults to False.
+        """
+        paths = list(dict.fromkeys(p.strip("/") for p in paths if p and p.strip("/")))
+        try:
+            if repo_mirror.ensure_fresh(repo_name, ref) is None:
+                commit = repo_mirror.resolve(repo_name, ref)
+                read = lambda wanted: repo_mirror.read_blobs(repo_name, wanted, commit)
+            else:
+                commit = ref if ref != "HEAD" else ""
+                read = lambda wanted: self._fetch_from_api(repo_name, wanted, commit or None)
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+        with self._lock:
+            seen = self._seen()
+            already_read = [p for p in paths if (repo_name, commit, p) in seen and not force]
+            wanted = [p for p in paths if p not in already_read]
+
+        try:
+            contents = read(wanted)
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+        files, truncated, skipped, total = {}, [], [], 0
+        for path in wanted:
+            if path not in contents:
+                continue
+            text = contents[path]
+            if total >= MAX_TOTAL_CHARS:
+                skipped.append(path)
+                continue
+            limit = min(MAX_FILE_CHARS, MAX_TOTAL_CHARS - total)
+            if len(text) > limit:
+                text = text[:limit] + f"\n... [truncated, {len(contents[path])} chars total]"
+                truncated.append(path)
+            files[path] = text
+            total += len(text)
+
+        with self._lock:
+            seen = self._seen()
+            seen.update((repo_name, commit, p) for p in files if p not in truncated)
+
+        return {
+            "success": True,
+            "files": files,
+            "already_read": already_read,
+            "missing": [p for p in wanted if p not in contents],
+            "truncated": truncated,
+            "skipped": skipped,
+        }
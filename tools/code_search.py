@@ -0,0 +1,352 @@
+import fnmatch
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from config.settings import settings
+from logging_config.logger import logger
+from tools.repo_mirror import repo_mirror
+
+MAX_SEARCH_BYTES = 512 * 1024
+# Seconds a workspace walk is trusted; file-tool writes are indexed immediately, and
+# shell commands and checkouts call invalidate_workspace()
+WORKSPACE_RESCAN_INTERVAL = 30.0
+SKIPPED_DIRS = {".git", "node_modules", "__pycache__", "dist", "build", ".venv", "venv"}
+_REGEX_META = set(".^$*+?()[]{}|\\")
+
+
+def trigrams(text: str) -> Set[str]:
+    text = text.lower()
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _required_literals(pattern: str) -> List[str]:
+    """
+    Literal runs every match of `pattern` must contain. Returns [] when nothing can
+    be guaranteed (alternation, or no run of 3+ plain characters).
+    """
+    if "|" in pattern or re.search(r"\)[?*{]", pattern):
+        return []
+    runs, current, i = [], "", 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern):
+            nxt = pattern[i + 1]
+            if nxt.isalnum():
+                # \w, \d, \b ... are classes/anchors, not literals
+                runs.append(current)
+                current = ""
+            else:
+                current += nxt
+            i += 2
+            continue
+        if char == "[":
+            runs.append(current)
+            current = ""
+            i = pattern.find("]", i + 2) + 1 or len(pattern)
+            continue
+        if char in "*?{":
+            # The preceding character is optional/repeated
+            runs.append(current[:-1])
+            current = ""
+            if char == "{":
+                i = pattern.find("}", i) + 1 or len(pattern)
+                continue
+        elif char in _REGEX_META:
+            runs.append(current)
+            current = ""
+        else:
+            current += char
+        i += 1
+    runs.append(current)
+    return [run for run in runs if len(run) >= 3]
+
+
+class TrigramIndex:
+    """Inverted index from lowercase trigrams to document ids."""
+
+    def __init__(self):
+        self.paths: List[Optional[str]] = []
+        self.ids: Dict[str, int] = {}
+        self.postings: Dict[str, Set[int]] = {}
+        self.meta: Dict[str, Any] = {}
+
+    def add(self, path: str, text: str):
+        self.remove(path)
+        doc_id = len(self.paths)
+        self.paths.append(path)
+        self.ids[path] = doc_id
+        for gram in trigrams(text):
+            self.postings.setdefault(gram, set()).add(doc_id)
+
+    def remove(self, path: str):
+        doc_id = self.ids.pop(path, None)
+        if doc_id is None:
+            return
+        # Postings keep the stale id; it is dropped on lookup and on the next save
+        self.paths[doc_id] = None
+
+    def candidates(self, literals: Iterable[str]) -> Optional[List[str]]:
+        """Paths containing every trigram of every literal, or None if the index can't narrow it down."""
+        grams = set()
+        for literal in literals:
+            grams |= trigrams(literal)
+        if not grams:
+            return None
+        result = None
+        for gram in sorted(grams, key=lambda g: len(self.postings.get(g, ()))):
+            docs = self.postings.get(gram, set())
+            result = docs if result is None else result & docs
+            if not result:
+                return []
+        return [self.paths[i] for i in result if self.paths[i] is not None]
+
+    def all_paths(self) -> List[str]:
+        return list(self.ids)
+
+    def to_dict(self) -> Dict[str, Any]:
+        # Compact ids so removed documents don't survive a save/load cycle
+        remap = {old: new for new, old in enumerate(sorted(self.ids.values()))}
+        return {
+            "meta": self.meta,
+            "paths": [self.paths[old] for old in sorted(remap)],
+            "postings": {g: sorted(remap[i] for i in docs if i in remap)
+                         for g, docs in self.postings.items() if any(i in remap for i in docs)},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TrigramIndex":
+        index = cls()
+        index.meta = data.get("meta", {})
+        index.paths = data["paths"]
+        index.ids = {path: i for i, path in enumerate(index.paths)}
+        index.postings = {g: set(docs) for g, docs in data["postings"].items()}
+        return index
+
+
+class CodeSearch:
+    """
+    Trigram full-text search over repository mirrors (per commit, updated from git
+    diffs) and the task workspace (updated on file writes, and by mtime when searched
+    after a shell command, a checkout or WORKSPACE_RESCAN_INTERVAL).
+    Indexes are persisted under REPO_INDEX_DIR.
+    """
+
+    def __init__(self, root: Optional[str] = None, workspace: Optional[str] = None):
+        self.root = os.path.abspath(root or settings.REPO_INDEX_DIR)
+        self.workspace = os.path.abspath(workspace or os.path.join(os.getcwd(), "workspace"))
+        self._indexes: Dict[str, TrigramIndex] = {}
+        # workspace scope -> when it was last walked
+        self._scanned: Dict[str, float] = {}
+        self._lock = threading.RLock()
+
+    def _path_for(self, key: str) -> str:
+        return os.path.join(self.root, key.replace("/", "__") + ".trigrams.json")
+
+    def _load(self, key: str) -> TrigramIndex:
+        if key not in self._indexes:
+            path = self._path_for(key)
+            if os.path.exists(path):
+                with open(path, "r") as f:
+                    self._indexes[key] = TrigramIndex.from_dict(json.load(f))
+            else:
+                self._indexes[key] = TrigramIndex()
+        return self._indexes[key]
+
+    def _save(self, key: str, index: TrigramIndex):
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = self._path_for(key) + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(index.to_dict(), f)
+        os.replace(tmp_path, self._path_for(key))
+
+    # --- Mirror index ---
+
+    def update_repo(self, repo_name: str, ref: str = "HEAD") -> TrigramIndex:
+        """Indexes the mirror at `ref`, re-reading only files changed since the indexed commit."""
+        with self._lock:
+            start = time.perf_counter()
+            head = repo_mirror.resolve(repo_name, ref)
+            index = self._load(repo_name)
+            indexed_commit = index.meta.get("commit")
+            if indexed_commit == head:
+                return index
+
+            if indexed_commit:
+                changes = repo_mirror.changed_files(repo_name, indexed_commit, head)
+                for path in changes:
+                    index.remove(path)
+                changed = [p for p, status in changes.items() if status != "D"]
+            else:
+                changed = repo_mirror.list_files(repo_name, head)
+
+            for path, text in repo_mirror.read_blobs(repo_name, changed, head, max_bytes=MAX_SEARCH_BYTES).items():
+                if "\0" not in text:
+                    index.add(path, text)
+            index.meta["commit"] = head
+            self._save(repo_name, index)
+            logger.info(f"Search index for {repo_name}@{head[:7]} updated ({len(changed)} files) "
+                        f"in {time.perf_counter() - start:.2f}s")
+            return index
+
+    # --- Workspace index ---
+
+    def _read_workspace(self, path: str) -> Optional[str]:
+        full_path = os.path.join(self.workspace, path)
+        try:
+            if os.path.getsize(full_path) > MAX_SEARCH_BYTES:
+                return None
+            with open(full_path, "r", errors="replace") as f:
+                text = f.read()
+        except OSError:
+            return None
+        return None if "\0" in text else text
+
+    def _workspace_path(self, path: str) -> str:
+        """Normalizes a workspace-relative path ('./src/../src/a.js' -> 'src/a.js')."""
+        relative = os.path.relpath(os.path.normpath(os.path.join(self.workspace, path)), self.workspace)
+        if relative == ".." or relative.startswith(".." + os.sep):
+            raise ValueError(f"{path} is outside the workspace")
+        return relative
+
+    def invalidate_workspace(self):
+        """Makes the next workspace search walk the files again (after shell commands and checkouts)."""
+        with self._lock:
+            self._scanned.clear()
+
+    def index_workspace_file(self, path: str, content: Optional[str] = None):
+        """Re-indexes one workspace file (called by write_file / replace_in_file)."""
+        try:
+            path = self._workspace_path(path)
+            with self._lock:
+                index = self._load("workspace")
+                text = content if content is not None else self._read_workspace(path)
+                if text is None or len(text) > MAX_SEARCH_BYTES:
+                    index.remove(path)
+                else:
+                    index.add(path, text)
+                full_path = os.path.join(self.workspace, path)
+                index.meta.setdefault("mtimes", {})[path] = os.path.getmtime(full_path) if os.path.exists(full_path) else 0
+                self._save("workspace", index)
+        except Exception as e:
+            logger.warning(f"Failed to index workspace file {path}: {e}")
+
+    def refresh_workspace(self, prefix: str = "") -> TrigramIndex:
+        """
+        Picks up files created, changed or deleted outside the file tools (checkouts, shell
+        commands). Skipped when `prefix`, or the whole workspace, was walked recently.
+        """
+        scope = self._workspace_path(prefix) + os.sep if prefix else ""
+        with self._lock:
+            index = self._load("workspace")
+            now = time.monotonic()
+            if any(now - self._scanned[walked] < WORKSPACE_RESCAN_INTERVAL
+                   for walked in ("", scope) if walked in self._scanned):
+                return index
+            mtimes = index.meta.setdefault("mtimes", {})
+            seen, changed = set(), 0
+            top = os.path.join(self.workspace, scope)
+            for dirpath, dirnames, filenames in os.walk(top):
+                dirnames[:] = [d for d in dirnames if d not in SKIPPED_DIRS]
+                for name in filenames:
+                    full_path = os.path.join(dirpath, name)
+                    path = os.path.relpath(full_path, self.workspace)
+                    seen.add(path)
+                    mtime = os.path.getmtime(full_path)
+                    if mtimes.get(path) != mtime:
+                        text = self._read_workspace(path)
+                        if text is None:
+                            index.remove(path)
+                        else:
+                            index.add(path, text)
+                        mtimes[path] = mtime
+                        changed += 1
+            for path in [p for p in mtimes if p.startswith(scope) and p not in seen]:
+                index.remove(path)
+                del mtimes[path]
+                changed += 1
+            if changed:
+                self._save("workspace", index)
+            self._scanned[scope] = now
+            return index
+
+    # --- Search ---
+
+    @staticmethod
+    def _match_lines(text: str, matcher: re.Pattern, max_lines: int = 3) -> List[Dict[str, Any]]:
+        lines, count = [], 0
+        for number, line in enumerate(text.splitlines(), start=1):
+            if matcher.search(line):
+                count += 1
+                if len(lines) < max_lines:
+                    lines.append({"line": number, "text": line.strip()[:200]})
+        return [{"count": count}] + lines if count else []
+
+    def _search(self, index: TrigramIndex, read: Any, query: str, regex: bool, path_glob: Optional[str],
+                case_sensitive: bool, limit: int, scope: str = "") -> List[Dict[str, Any]]:
+        flags = 0 if case_sensitive else re.IGNORECASE
+        matcher = re.compile(query if regex else re.escape(query), flags)
+        literals = _required_literals(query) if regex else [query]
+        paths = index.candidates(literals)
+        if paths is None:
+            paths = index.all_paths()
+        paths = [p for p in paths if p.startswith(scope)]
+        if path_glob:
+            paths = [p for p in paths if fnmatch.fnmatch(p[len(scope):], path_glob)
+                     or fnmatch.fnmatch(os.path.basename(p), path_glob)]
+
+        results = []
+        for path, text in read(paths).items():
+            found = self._match_lines(text, matcher)
+            if not found:
+                continue
+            count = found[0]["count"]
+            # Files whose name matches rank first, then by number of hits
+            score = count + (10 if matcher.search(os.path.basename(path)) else 0)
+            results.append({"path": path[len(scope):], "matches": count, "score": score, "snippets": found[1:]})
+        results.sort(key=lambda r: (-r["score"], len(r["path"]), r["path"]))
+        return results[:limit]
+
+    def search_code(self, query: str, repo_name: Optional[str] = None, regex: bool = False,
+                    path_glob: Optional[str] = None, case_sensitive: bool = False, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Searches code for a literal string or regular expression and returns ranked files
+        with matching line snippets. Much faster than grepping file by file.
+        If the repository is checked out in the workspace, the working copy (including
+        your edits) is searched; otherwise the default branch of the local mirror.
+
+        Args:
+            query (str): Text or regex to search for (e.g., 'createTicket' or 'def \\w+_ticket').
+            repo_name (str, optional): Full repository name (e.g., 'owner/repo'). If omitted, the whole workspace is searched.
+            regex (bool, optional): Treat `query` as a regular expression. Defaults to False.
+            path_glob (str, optional): Only search matching paths (e.g., '*.py' or 'src/components/*').
+            case_sensitive (bool, optional): Defaults to False.
+            limit (int, optional): Maximum number of files to return. Defaults to 20.
+        """
+        try:
+            checkout = os.path.join(self.workspace, repo_name) if repo_name else self.workspace
+            if not repo_name or os.path.isdir(checkout):
+                scope = repo_name.strip("/") + "/" if repo_name else ""
+                index = self.refresh_workspace(scope)
+                read = lambda paths: {p: t for p in paths if (t := self._read_workspace(p)) is not None}
+            else:
+                error = repo_mirror.ensure_fresh(repo_name)
+                if error:
+                    return [{"error": error}]
+                index = self.update_repo(repo_name)
+                commit = index.meta["commit"]
+                scope = ""
+                read = lambda paths: repo_mirror.read_blobs(repo_name, paths, commit, max_bytes=MAX_SEARCH_BYTES)
+            return self._search(index, read, query, regex, path_glob, case_sensitive, limit, scope)
+        except re.error as e:
+            return [{"error": f"Invalid regex: {e}"}]
+        except Exception as e:
+            logger.error(f"Code search failed: {e}")
+            return [{"error": str(e)}]
+
+
+# Global code search instance
+code_search = CodeSearch()
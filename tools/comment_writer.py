@@ -0,0 +1,145 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from config.settings import settings
+from logging_config.logger import logger
+from tools.jira_client import jira_client
+from tools.jira_mirror import jira_mirror
+from tools.ticket_cache import ticket_cache
+
+SEPARATOR = "\n----\n"
+
+
+def post_comment(ticket_key: str, text: str):
+    jira_client.get().add_comment(ticket_key, text)
+    ticket_cache.invalidate(ticket_key)
+    jira_mirror.mark_stale(ticket_key)
+
+
+class CommentWriter:
+    """
+    Buffers agent comments per ticket and posts them from a background thread.
+    Comments on the same ticket that arrive within `window` seconds of each other
+    are merged into one Jira comment (a burst is cut off after 5 windows); posts
+    are spaced by `min_interval` and retried with backoff. flush() writes
+    everything pending, e.g. when an agent task finishes.
+    """
+
+    def __init__(self, post: Callable[[str, str], Any] = post_comment, window: float = 3.0,
+                 min_interval: float = 1.0, max_retries: int = 3, backoff: float = 2.0):
+        self.post = post
+        self.window = window
+        self.min_interval = min_interval
+        self.max_retries = max_retries
+        self.backoff = backoff
+        # ticket -> {"comments": [...], "first": t, "last": t}
+        self._pending: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        # One post at a time keeps a ticket's bursts in order and the spacing accurate
+        self._write_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._last_post = 0.0
+        self._stats = {"queued": 0, "posted": 0, "merged": 0, "retries": 0, "failed": 0}
+        self.failures: List[Dict[str, Any]] = []
+
+    def enqueue(self, ticket_key: str, comment: str) -> Dict[str, Any]:
+        key = ticket_key.upper()
+        now = time.monotonic()
+        with self._cond:
+            entry = self._pending.setdefault(key, {"comments": [], "first": now, "last": now})
+            entry["comments"].append(comment)
+            entry["last"] = now
+            self._stats["queued"] += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="jira-comments", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+            return {"queued": True, "pending": len(entry["comments"])}
+
+    def _due(self, entry: Dict[str, Any]) -> float:
+        return min(entry["last"] + self.window, entry["first"] + self.window * 5)
+
+    def _take(self, ticket_key: str) -> Dict[str, Any]:
+        entry = self._pending.pop(ticket_key)
+        self._in_flight += 1
+        return entry
+
+    def _post_with_retry(self, ticket_key: str, text: str, count: int):
+        for attempt in range(self.max_retries + 1):
+            wait = self._last_post + self.min_interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                self.post(ticket_key, text)
+                self._last_post = time.monotonic()
+                self._stats["posted"] += 1
+                self._stats["merged"] += count - 1
+                logger.info(f"Posted {count} comment(s) to {ticket_key}")
+                return
+            except Exception as e:
+                self._last_post = time.monotonic()
+                if attempt == self.max_retries:
+                    self._stats["failed"] += 1
+                    self.failures = (self.failures + [{"ticket_key": ticket_key, "comment": text,
+                                                       "error": str(e)}])[-20:]
+                    logger.error(f"Failed to post comment to {ticket_key}: {e}")
+                    return
+                self._stats["retries"] += 1
+                logger.warning(f"Comment on {ticket_key} failed ({e}); retrying")
+                time.sleep(self.backoff * (2 ** attempt))
+
+    def _write(self, ticket_key: str, entry: Dict[str, Any]):
+        comments = entry["comments"]
+        text = comments[0] if len(comments) == 1 else SEPARATOR.join(comments)
+        try:
+            with self._write_lock:
+                self._post_with_retry(ticket_key, text, len(comments))
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify_all()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                now = time.monotonic()
+                due = [k for k, e in self._pending.items() if self._due(e) <= now]
+                if not due:
+                    if not self._pending:
+                        self._cond.wait(timeout=60)
+                    else:
+                        self._cond.wait(timeout=min(self._due(e) for e in self._pending.values()) - now)
+                    continue
+                batch = [(k, self._take(k)) for k in due]
+            for ticket_key, entry in batch:
+                self._write(ticket_key, entry)
+
+    def flush(self, ticket_key: Optional[str] = None, timeout: float = 30.0) -> Dict[str, Any]:
+        """Posts pending comments now (all tickets, or one) and waits for in-flight posts."""
+        with self._cond:
+            keys = [ticket_key.upper()] if ticket_key else list(self._pending)
+            batch = [(k, self._take(k)) for k in keys if k in self._pending]
+        for key, entry in batch:
+            self._write(key, entry)
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._in_flight and time.monotonic() < deadline:
+                self._cond.wait(timeout=deadline - time.monotonic())
+        return {"flushed": len(batch), "failed": self._stats["failed"]}
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {**self._stats, "pending_tickets": len(self._pending),
+                    "pending_comments": sum(len(e["comments"]) for e in self._pending.values()),
+                    "recent_failures": list(self.failures)}
+
+
+# Shared by every JiraTools instance
+comment_writer = CommentWriter(
+    window=settings.JIRA_COMMENT_WINDOW,
+    min_interval=settings.JIRA_COMMENT_MIN_INTERVAL,
+    max_retries=settings.JIRA_COMMENT_MAX_RETRIES,
+)
@@ -0,0 +1,183 @@
+import threading
+import time
+from array import array
+from typing import Any, Dict, List, Optional
+
+from logging_config.logger import logger
+from tools.repo_mirror import repo_mirror
+from tools.symbol_index import symbol_index
+
+
+class DependencyGraph:
+    """
+    Immutable file-level import graph in CSR form: node i's edges are
+    targets[offsets[i]:offsets[i + 1]]. Forward (imports) and reverse (imported by)
+    adjacency are both kept so either direction is a slice lookup.
+    """
+
+    def __init__(self, edges: Dict[str, List[str]], commit: str = ""):
+        self.commit = commit
+        self.nodes: List[str] = sorted(set(edges) | {t for targets in edges.values() for t in targets})
+        self.ids: Dict[str, int] = {path: i for i, path in enumerate(self.nodes)}
+        forward = [[self.ids[t] for t in edges.get(path, ())] for path in self.nodes]
+        reverse: List[List[int]] = [[] for _ in self.nodes]
+        for source, targets in enumerate(forward):
+            for target in targets:
+                reverse[target].append(source)
+        self.offsets, self.targets = self._pack(forward)
+        self.reverse_offsets, self.reverse_targets = self._pack(reverse)
+
+    @staticmethod
+    def _pack(adjacency: List[List[int]]):
+        offsets, targets = array("i", [0]), array("i")
+        for neighbours in adjacency:
+            targets.extend(sorted(neighbours))
+            offsets.append(len(targets))
+        return offsets, targets
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def _closure(self, path: str, reverse: bool, max_depth: Optional[int]) -> Dict[str, int]:
+        """Breadth-first walk; returns {path: distance} excluding the start node."""
+        start = self.ids.get(path)
+        if start is None:
+            return {}
+        offsets, targets = (self.reverse_offsets, self.reverse_targets) if reverse else (self.offsets, self.targets)
+        seen = bytearray(len(self.nodes))
+        seen[start] = 1
+        found: Dict[str, int] = {}
+        frontier, distance = [start], 0
+        # Level-by-level BFS over the packed arrays
+        while frontier and (max_depth is None or distance < max_depth):
+            distance += 1
+            next_frontier = []
+            for node in frontier:
+                for neighbour in targets[offsets[node]:offsets[node + 1]]:
+                    if not seen[neighbour]:
+                        seen[neighbour] = 1
+                        next_frontier.append(neighbour)
+                        found[self.nodes[neighbour]] = distance
+            frontier = next_frontier
+        return found
+
+    def dependencies(self, path: str, transitive: bool = False, max_depth: Optional[int] = None) -> Dict[str, int]:
+        """Files `path` imports (directly, or transitively with their distance)."""
+        return self._closure(path, reverse=False, max_depth=max_depth if transitive else 1)
+
+    def dependents(self, path: str, transitive: bool = False, max_depth: Optional[int] = None) -> Dict[str, int]:
+        """Files that import `path` (directly, or transitively with their distance)."""
+        return self._closure(path, reverse=True, max_depth=max_depth if transitive else 1)
+
+    def impact(self, paths: List[str], max_depth: Optional[int] = None) -> Dict[str, int]:
+        """Union of the transitive dependents of several changed files, keeping the shortest distance."""
+        affected: Dict[str, int] = {}
+        for path in paths:
+            for dependent, distance in self.dependents(path, transitive=True, max_depth=max_depth).items():
+                affected[dependent] = min(distance, affected.get(dependent, distance))
+        for path in paths:
+            affected.pop(path, None)
+        return affected
+
+
+class DependencyGraphService:
+    """
+    Per-repository dependency graphs. Parsing is delegated to the symbol index, which
+    re-reads only files changed since the last indexed commit; the graph arrays are
+    then re-packed for the new commit.
+    """
+
+    def __init__(self):
+        self._graphs: Dict[str, DependencyGraph] = {}
+        self._lock = threading.Lock()
+
+    def get(self, repo_name: str) -> DependencyGraph:
+        error = repo_mirror.ensure_fresh(repo_name)
+        if error:
+            raise RuntimeError(error)
+        index = symbol_index.update(repo_name)
+        with self._lock:
+            graph = self._graphs.get(repo_name)
+            if graph is None or graph.commit != index["commit"]:
+                start = time.perf_counter()
+                graph = DependencyGraph(index["resolved"], index["commit"])
+                self._graphs[repo_name] = graph
+                logger.info(f"Dependency graph for {repo_name}@{index['commit'][:7]}: {len(graph.nodes)} files, "
+                            f"{graph.edge_count} edges in {time.perf_counter() - start:.2f}s")
+            return graph
+
+    def query(self, repo_name: str, path: str, direction: str = "dependents",
+              transitive: bool = True, max_depth: Optional[int] = None) -> Dict[str, Any]:
+        graph = self.get(repo_name)
+        path = path.strip("/")
+        if path not in graph.ids:
+            return {"success": False, "error": f"{path} is not an indexed source file"}
+        lookup = graph.dependencies if direction == "dependencies" else graph.dependents
+        found = lookup(path, transitive=transitive, max_depth=max_depth)
+        return {
+            "success": True,
+            "path": path,
+            "commit": graph.commit,
+            "direction": direction,
+            "direct": sorted(p for p, d in found.items() if d == 1),
+            "transitive": sorted(found, key=lambda p: (found[p], p)),
+            "count": len(found),
+        }
+
+    # --- Agent tools ---
+
+    def get_dependents(self, repo_name: str, path: str, transitive: bool = True) -> Dict[str, Any]:
+        """
+        Lists the files that depend on (import) a file, directly and transitively.
+        Use it to assess the blast radius of a change or to pick which tests to run.
+
+        Args:
+            repo_name (str): Full repository name (e.g., 'owner/repo').
+            path (str): File path within the repository (e.g., 'tools/jira_tools.py').
+            transitive (bool, optional): Include indirect dependents. Defaults to True.
+        """
+        try:
+            return self.query(repo_name, path, "dependents", transitive)
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def get_dependencies(self, repo_name: str, path: str, transitive: bool = False) -> Dict[str, Any]:
+        """
+        Lists the repository files a file imports, directly or transitively.
+
+        Args:
+            repo_name (str): Full repository name (e.g., 'owner/repo').
+            path (str): File path within the repository (e.g., 'routes/jira.py').
+            transitive (bool, optional): Include indirect dependencies. Defaults to False.
+        """
+        try:
+            return self.query(repo_name, path, "dependencies", transitive)
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    def get_change_impact(self, repo_name: str, base: str, head: str) -> Dict[str, Any]:
+        """
+        Lists the files changed between two branches and every file that transitively
+        depends on them. Use it to decide which modules and tests a change affects.
+
+        Args:
+            repo_name (str): Full repository name (e.g., 'owner/repo').
+            base (str): Base branch or commit (e.g., 'main').
+            head (str): Head branch or commit (e.g., 'feature/KAN-19').
+        """
+        try:
+            repo_mirror.refresh(repo_name)
+            changed = sorted(repo_mirror.changed_files(repo_name, base, head, merge_base=True))
+            affected = self.get(repo_name).impact(changed)
+            return {
+                "success": True,
+                "changed": changed,
+                "affected": sorted(affected, key=lambda p: (affected[p], p)),
+            }
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+
+# Global dependency graph service
+dependency_graph = DependencyGraphService()
@@ -5,8 +5,6 @@ from logging_config.logger import logger
 from models.figma import FigmaFile, FigmaComment
 
 class FigmaTools:
-    BASE_URL = "https://api.figma.com/v1"
-
     def __init__(self):
         self.access_token = settings.FIGMA_ACCESS_TOKEN
         self.team_id = settings.FIGMA_TEAM_ID
@@ -18,6 +16,10 @@ class FigmaTools:
         else:
             logger.warning("FIGMA_ACCESS_TOKEN not found in settings.")
 
+    @property
+    def base_url(self) -> str:
+        return settings.FIGMA_API_URL.rstrip("/")
+
     def _get_headers(self) -> Dict[str, str]:
         if not self.access_token:
             return {}
@@ -51,7 +53,7 @@ class FigmaTools:
             return {"success": False, "error": "Figma token not configured."}
         
         real_key = self._extract_key(file_key)
-        url = f"{self.BASE_URL}/files/{real_key}"
+        url = f"{self.base_url}/files/{real_key}"
         
         params = {}
         if depth is not None:
@@ -110,7 +112,7 @@ class FigmaTools:
             return []
             
         real_key = self._extract_key(file_key)
-        url = f"{self.BASE_URL}/files/{real_key}/comments"
+        url = f"{self.base_url}/files/{real_key}/comments"
         
         max_retries = 3
         backoff = 2
@@ -158,7 +160,7 @@ class FigmaTools:
         if not self.access_token or not target_team_id:
             return []
 
-        url = f"{self.BASE_URL}/teams/{target_team_id}/projects"
+        url = f"{self.base_url}/teams/{target_team_id}/projects"
         try:
             response = requests.get(url, headers=self._get_headers())
             response.raise_for_status()
@@ -175,7 +177,7 @@ class FigmaTools:
         if not self.access_token or not target_project_id:
             return []
 
-        url = f"{self.BASE_URL}/projects/{target_project_id}/files"
+        url = f"{self.base_url}/projects/{target_project_id}/files"
         try:
             response = requests.get(url, headers=self._get_headers())
             response.raise_for_status()
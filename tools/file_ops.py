@@ -1,5 +1,7 @@
 import os
 
+from tools.code_search import code_search
+
 def read_file(path: str) -> str:
     """
     Read the content of a file from the workspace.
@@ -41,7 +43,8 @@ def replace_in_file(path: str, old_text: str, new_text: str) -> str:
         
         with open(full_path, 'w') as f:
             f.write(new_content)
-            
+
+        code_search.index_workspace_file(path, new_content)
         return f"Successfully updated {path}."
         
     except Exception as e:
@@ -63,7 +66,8 @@ def write_file(path: str, content: str) -> str:
         
         with open(full_path, 'w') as f:
             f.write(content)
-            
+
+        code_search.index_workspace_file(path, content)
         return f"Successfully wrote to {path}."
     except Exception as e:
         return f"Error writing file: {str(e)}"
@@ -0,0 +1,184 @@
+import copy
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from camel.toolkits import FunctionTool
+from config.settings import settings
+from logging_config.logger import logger
+
+LANES = ("interactive", "background")
+# Interactive requests never wait longer than this; past it they are sent and may fail
+INTERACTIVE_MAX_WAIT = 5.0
+# Sleep in short slices so a budget refresh (e.g. the reset passing) is noticed
+WAIT_SLICE = 30.0
+
+
+class GitHubRateBudget:
+    """
+    Tracks the shared token's REST budget from X-RateLimit-* headers (and PyGithub's
+    requester). Background calls (agent toolkits) are paced across the time left until
+    the reset once the budget drops below a threshold, and stop before the reserve kept
+    for interactive routes. Interactive calls only wait out short secondary-limit backoffs.
+    """
+
+    def __init__(self, reserve: int = 200, throttle_below: float = 0.3,
+                 clock: Callable[[], float] = time.time, sleep: Callable[[float], None] = time.sleep):
+        self.reserve = reserve
+        self.throttle_below = throttle_below
+        self.clock = clock
+        self.sleep = sleep
+        self.remaining: Optional[int] = None
+        self.limit: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self._blocked_until = 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {
+            lane: {"calls": 0, "throttled": 0, "total_wait": 0.0} for lane in LANES
+        }
+
+    def update(self, remaining: Optional[int], limit: Optional[int], reset_at: Optional[float]):
+        if remaining is None or limit is None or limit < 0:
+            return  # no rate limit information yet
+        with self._lock:
+            self.remaining, self.limit = int(remaining), int(limit)
+            if reset_at:
+                self.reset_at = float(reset_at)
+
+    def reset(self):
+        """Forgets the known budget (e.g. after switching tokens)."""
+        with self._lock:
+            self.remaining, self.limit, self.reset_at = None, None, None
+            self._blocked_until = self._next_slot = 0.0
+
+    def update_from_headers(self, headers: Mapping[str, str], status_code: int = 200):
+        """Reads X-RateLimit-* (core resource only) and Retry-After from a GitHub response."""
+        resource = headers.get("X-RateLimit-Resource", "core")
+        if resource == "core" and "X-RateLimit-Remaining" in headers:
+            self.update(int(headers["X-RateLimit-Remaining"]), int(headers.get("X-RateLimit-Limit", -1)),
+                        float(headers.get("X-RateLimit-Reset", 0)))
+        if status_code in (403, 429):
+            retry_after = headers.get("Retry-After")
+            if retry_after:
+                self.backoff(float(retry_after))
+            elif headers.get("X-RateLimit-Remaining") == "0" and self.reset_at:
+                self.backoff(self.reset_at - self.clock())
+
+    def backoff(self, seconds: float):
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, self.clock() + max(seconds, 0.0))
+        logger.warning(f"GitHub rate limited, pausing calls for {seconds:.0f}s")
+
+    def _reserve(self) -> int:
+        # Small (e.g. unauthenticated) limits keep at most a tenth in reserve
+        return min(self.reserve, (self.limit or 0) // 10)
+
+    def delay_for(self, lane: str) -> float:
+        """Seconds the next call in `lane` must wait (backoffs, and the reserve for background calls)."""
+        with self._lock:
+            now = self.clock()
+            blocked = max(self._blocked_until - now, 0.0)
+            if lane == "interactive" or self.remaining is None or not self.reset_at:
+                return blocked
+            if self.remaining <= self._reserve() and self.reset_at > now:
+                return max(blocked, self.reset_at - now)
+            return blocked
+
+    def _pace(self) -> float:
+        """
+        Below the throttle threshold, hands out background slots spread evenly over the
+        time left until the reset. Returns the wait for the reserved slot.
+        """
+        with self._lock:
+            now = self.clock()
+            if self.remaining is None or not self.limit or not self.reset_at or self.reset_at <= now:
+                return 0.0
+            if self.remaining >= self.limit * self.throttle_below:
+                return 0.0
+            interval = (self.reset_at - now) / max(self.remaining - self._reserve(), 1)
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + interval
+            return slot - now
+
+    def acquire(self, lane: str = "background") -> float:
+        """Waits as long as the budget requires for `lane`. Returns the seconds waited."""
+        lane = lane if lane in LANES else "background"
+        waited = 0.0
+        while True:
+            delay = self.delay_for(lane)
+            if lane == "interactive":
+                delay = min(delay, max(INTERACTIVE_MAX_WAIT - waited, 0.0))
+            if delay <= 0:
+                break
+            step = min(delay, WAIT_SLICE)
+            self.sleep(step)
+            waited += step
+        if lane == "background":
+            paced = self._pace()
+            if paced > 0:
+                self.sleep(paced)
+                waited += paced
+
+        with self._lock:
+            stats = self._stats[lane]
+            stats["calls"] += 1
+            stats["total_wait"] += waited
+            if waited > 0:
+                stats["throttled"] += 1
+            if self.remaining is not None:
+                # Count the call now; the response headers correct it afterwards
+                self.remaining -= 1
+        if waited > 0:
+            logger.info(f"GitHub budget {self.remaining}/{self.limit}: {lane} call delayed {waited:.1f}s")
+        return waited
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            now = self.clock()
+            return {
+                "remaining": self.remaining,
+                "limit": self.limit,
+                "reset_at": self.reset_at,
+                "resets_in": max(self.reset_at - now, 0.0) if self.reset_at else None,
+                "blocked_for": max(self._blocked_until - now, 0.0),
+                "throttling": bool(self.remaining is not None and self.limit
+                                   and self.remaining < self.limit * self.throttle_below),
+                "lanes": {lane: dict(stats) for lane, stats in self._stats.items()},
+            }
+
+
+def _budgeted(func: Callable, toolkit: Any) -> Callable:
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        github_budget.acquire("background")
+        try:
+            return func(*args, **kwargs)
+        finally:
+            requester = toolkit.github.requester
+            remaining, limit = requester.rate_limiting
+            github_budget.update(remaining, limit, requester.rate_limiting_resettime)
+
+    return wrapper
+
+
+def budgeted_tools(toolkit: Any) -> List[FunctionTool]:
+    """
+    Returns copies of the toolkit's tools with every call paced by the shared budget
+    (background lane). The toolkit's own tools are left untouched, so calling this
+    once per agent never wraps a tool twice.
+    """
+    budgeted = []
+    for tool in toolkit.get_tools():
+        paced = copy.copy(tool)
+        paced.func = _budgeted(tool.func, toolkit)
+        budgeted.append(paced)
+    return budgeted
+
+
+# Shared budget for the one GitHub token used by routes and agents
+github_budget = GitHubRateBudget(
+    reserve=settings.GITHUB_RATE_RESERVE,
+    throttle_below=settings.GITHUB_THROTTLE_BELOW,
+)
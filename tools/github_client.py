@@ -0,0 +1,159 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from config.settings import settings
+from logging_config.logger import logger
+from tools.github_budget import github_budget
+
+
+@dataclass
+class CachedResponse:
+    data: Any
+    headers: Dict[str, str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+class GitHubRestClient:
+    """
+    GitHub REST client on one keep-alive session with an HTTP caching layer.
+    Responses are served from memory within their TTL, then revalidated with
+    If-None-Match / If-Modified-Since (304s don't count against the rate limit).
+    At most `max_entries` responses are kept, least recently used evicted first.
+    """
+
+    def __init__(self, access_token: Optional[str] = None, ttl: float = 60.0, max_entries: int = 1000,
+                 timeout: float = 30.0):
+        self.base_url = settings.GITHUB_API_URL.rstrip("/")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        })
+        # Least recently used first
+        self._cache: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "revalidated": 0, "misses": 0}
+        self.set_token(access_token)
+
+    def set_token(self, access_token: Optional[str]):
+        self.access_token = access_token
+        if access_token:
+            self.session.headers["Authorization"] = f"Bearer {access_token}"
+        else:
+            self.session.headers.pop("Authorization", None)
+        # Cached responses may not be visible to the new token
+        self.invalidate()
+        github_budget.reset()
+
+    def _url(self, path: str) -> str:
+        return path if path.startswith("http") else f"{self.base_url}{path}"
+
+    @staticmethod
+    def _key(url: str, params: Optional[Dict[str, Any]]) -> str:
+        if not params:
+            return url
+        return url + "?" + "&".join(f"{k}={params[k]}" for k in sorted(params))
+
+    def _store(self, key: str, entry: CachedResponse):
+        """Caches `entry` as most recently used, evicting the oldest beyond max_entries. Caller holds the lock."""
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None,
+            ttl: Optional[float] = None, lane: str = "interactive") -> Tuple[Any, Dict[str, str]]:
+        """
+        Cached GET. Returns (json data, response headers). Raises requests.HTTPError on failure.
+        `lane` is "interactive" for route handlers and "background" for agent work.
+        """
+        url = self._url(path)
+        key = self._key(url, params)
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry and time.monotonic() - entry.fetched_at < ttl:
+                self._cache.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry.data, entry.headers
+
+        headers = {}
+        if entry and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        elif entry and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+
+        github_budget.acquire(lane)
+        response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+        github_budget.update_from_headers(response.headers, response.status_code)
+        if response.status_code == 304 and entry:
+            with self._lock:
+                entry.fetched_at = time.monotonic()
+                self._store(key, entry)
+                self._stats["revalidated"] += 1
+            return entry.data, entry.headers
+
+        response.raise_for_status()
+        data = response.json()
+        kept_headers = {k: v for k, v in response.headers.items() if k.lower() in ("link", "etag", "last-modified")}
+        with self._lock:
+            self._store(key, CachedResponse(
+                data=data,
+                headers=kept_headers,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                fetched_at=time.monotonic()
+            ))
+            self._stats["misses"] += 1
+        return data, kept_headers
+
+    def request(self, method: str, path: str, lane: str = "interactive", **kwargs) -> Any:
+        """Uncached request: writes (POST/PATCH/DELETE) and large reads cached by the caller."""
+        github_budget.acquire(lane)
+        kwargs.setdefault("timeout", self.timeout)
+        response = self.session.request(method, self._url(path), **kwargs)
+        github_budget.update_from_headers(response.headers, response.status_code)
+        response.raise_for_status()
+        return response.json() if response.content else None
+
+    def invalidate(self, prefix: str = ""):
+        """Drops cached responses whose path starts with `prefix` (everything by default)."""
+        url_prefix = self._url(prefix) if prefix else ""
+        with self._lock:
+            for key in [k for k in self._cache if k.startswith(url_prefix)]:
+                del self._cache[key]
+        logger.debug(f"GitHub cache invalidated: {prefix or '*'}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = sum(self._stats.values())
+            return {
+                **self._stats,
+                "entries": len(self._cache),
+                "hit_rate": (self._stats["hits"] + self._stats["revalidated"]) / total if total else 0.0
+            }
+
+
+def next_page_url(headers: Dict[str, str]) -> Optional[str]:
+    """Returns the rel="next" URL from a GitHub Link header, if any."""
+    link = headers.get("Link") or headers.get("link")
+    if not link:
+        return None
+    for item in requests.utils.parse_header_links(link):
+        if item.get("rel") == "next":
+            return item.get("url")
+    return None
+
+
+# Shared client instance (routes and agents)
+github_client = GitHubRestClient(settings.GITHUB_ACCESS_TOKEN, ttl=settings.GITHUB_CACHE_TTL,
+                                 max_entries=settings.GITHUB_CACHE_MAX_ENTRIES, timeout=settings.GITHUB_TIMEOUT)
@@ -1,18 +1,51 @@
-from typing import List, Optional, Dict, Any
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Dict, Any, Tuple
 from camel.toolkits.github_toolkit import GithubToolkit
 from config.settings import settings
 from logging_config.logger import logger
 from models.github import GitHubRepo
+from tools.repo_mirror import repo_mirror
+from tools.github_client import github_client, next_page_url
+from tools.github_budget import github_budget
+
+_shared_toolkit: Optional[GithubToolkit] = None
+_toolkit_lock = threading.Lock()
+
+
+def get_github_toolkit(access_token: Optional[str] = None) -> Optional[GithubToolkit]:
+    """
+    Returns the GithubToolkit shared by the agents and the routes (one PyGithub client
+    per process). A new token re-authenticates it in place, so tools already handed to
+    agents use it too.
+    """
+    global _shared_toolkit
+    token = access_token or settings.GITHUB_ACCESS_TOKEN
+    if not token:
+        return _shared_toolkit
+    with _toolkit_lock:
+        if _shared_toolkit is None:
+            _shared_toolkit = GithubToolkit(access_token=token)
+        elif not access_token:
+            return _shared_toolkit
+        from github import Auth, Github
+        # GithubToolkit always targets api.github.com; honour GITHUB_API_URL (e.g. tests/fake_services.py)
+        _shared_toolkit.github = Github(auth=Auth.Token(token), base_url=settings.GITHUB_API_URL)
+    return _shared_toolkit
+
 
 class GitHubTools:
     def __init__(self):
         self.access_token = settings.GITHUB_ACCESS_TOKEN
         self.current_repo = None # Initially disconnected
+        self.default_branch = None
         self.toolkit = None
+        # (repo, commit sha) -> sorted file paths; a tree never changes for a given sha
+        self._tree_cache: "OrderedDict[Tuple[str, str], List[str]]" = OrderedDict()
         
         if self.access_token:
             try:
-                self.toolkit = GithubToolkit(access_token=self.access_token)
+                self.toolkit = get_github_toolkit()
                 logger.info("GitHub Toolkit initialized with token.")
             except Exception as e:
                 logger.error(f"Failed to initialize GitHub Toolkit: {e}")
@@ -20,6 +53,20 @@ class GitHubTools:
         else:
             logger.warning("GITHUB_ACCESS_TOKEN not found in settings.")
 
+    @staticmethod
+    def _repo_model(data: Dict[str, Any]) -> GitHubRepo:
+        return GitHubRepo(
+            full_name=data["full_name"],
+            name=data["name"],
+            description=data.get("description"),
+            private=data.get("private", False),
+            stars=data.get("stargazers_count", 0),
+            forks=data.get("forks_count", 0),
+            open_issues=data.get("open_issues_count", 0),
+            language=data.get("language"),
+            url=data.get("html_url")
+        )
+
     def connect_repo(self, repo_name: str) -> Dict[str, Any]:
         """
         Connects to a specific GitHub repository and verifies access.
@@ -28,22 +75,13 @@ class GitHubTools:
              return {"success": False, "error": "GitHub token not configured."}
 
         try:
-            repo = self.toolkit.github.get_repo(repo_name)
-            self.current_repo = repo.full_name
-            
-            repo_model = GitHubRepo(
-                full_name=repo.full_name,
-                name=repo.name,
-                description=repo.description,
-                private=repo.private,
-                stars=repo.stargazers_count,
-                forks=repo.forks_count,
-                open_issues=repo.open_issues_count,
-                language=repo.language,
-                url=repo.html_url
-            )
+            # Connecting always re-reads the repo from GitHub
+            github_client.invalidate(f"/repos/{repo_name}")
+            data, _ = github_client.get(f"/repos/{repo_name}")
+            self.current_repo = data["full_name"]
+            self.default_branch = data.get("default_branch")
             
-            result = repo_model.to_dict()
+            result = self._repo_model(data).to_dict()
             result["success"] = True
             return result
         except Exception as e:
@@ -56,7 +94,9 @@ class GitHubTools:
         """
         return {
             "connected": bool(self.toolkit and self.current_repo),
-            "repo_name": self.current_repo if (self.toolkit and self.current_repo) else None
+            "repo_name": self.current_repo if (self.toolkit and self.current_repo) else None,
+            "cache": github_client.get_stats(),
+            "rate_limit": github_budget.get_stats()
         }
 
     def get_repo_details(self) -> Dict[str, Any]:
@@ -65,8 +105,15 @@ class GitHubTools:
         """
         if not self.current_repo:
             return {"success": False, "error": "No repository connected."}
-        
-        return self.connect_repo(self.current_repo)
+
+        try:
+            data, _ = github_client.get(f"/repos/{self.current_repo}")
+            result = self._repo_model(data).to_dict()
+            result["success"] = True
+            return result
+        except Exception as e:
+            logger.error(f"Failed to get repo details for {self.current_repo}: {e}")
+            return {"success": False, "error": str(e)}
 
     def list_issues(self, state: str = "open") -> List[Dict[str, Any]]:
         """
@@ -84,53 +131,170 @@ class GitHubTools:
             return []
         return self.toolkit.github_get_pull_request_list(self.current_repo, state=state)
     
-    def list_user_repos(self) -> List[Dict[str, Any]]:
+    LIST_PAGE_SIZE = 100
+    # Listing pages change rarely; keep them briefly so pickers can page/filter without API calls
+    LIST_CACHE_TTL = 30
+
+    @staticmethod
+    def _page_cursor(cursor: Optional[str]) -> Tuple[int, int]:
+        """Parses a "<page>:<offset>" list cursor; raises ValueError when malformed."""
+        if not cursor:
+            return 1, 0
+        page, sep, offset = cursor.partition(":")
+        if not (sep and page.isdigit() and offset.isdigit() and int(page) >= 1):
+            raise ValueError(f"Invalid cursor: {cursor!r}")
+        return int(page), int(offset)
+
+    def _scan_pages(self, path: str, params: Dict[str, Any], cursor: Optional[str], limit: int,
+                    query: Optional[str], name_of) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Walks GitHub list pages lazily, starting at `cursor` ("<page>:<offset>"), and returns
+        up to `limit` items whose name contains `query` plus the cursor of the next item.
+        Only the pages needed to fill `limit` are fetched.
         """
-        Lists repositories available to the authenticated user.
+        page, offset = self._page_cursor(cursor)
+        # An unbounded limit would walk every page
+        limit = max(1, min(limit, self.LIST_PAGE_SIZE))
+        needle = query.lower() if query else None
+        items = []
+        while True:
+            data, headers = github_client.get(path, params={**params, "per_page": self.LIST_PAGE_SIZE, "page": page},
+                                              ttl=self.LIST_CACHE_TTL)
+            for index in range(offset, len(data)):
+                if needle and needle not in name_of(data[index]).lower():
+                    continue
+                if len(items) == limit:
+                    return items, f"{page}:{index}"
+                items.append(data[index])
+            if not next_page_url(headers) or len(data) < self.LIST_PAGE_SIZE:
+                return items, None
+            page, offset = page + 1, 0
+
+    def list_user_repos(self, query: Optional[str] = None, cursor: Optional[str] = None,
+                        limit: int = 20) -> Dict[str, Any]:
+        """
+        Lists repositories available to the authenticated user, most recently updated first.
+        Returns {"items": [...], "next_cursor": str | None}. Raises ValueError for a malformed cursor.
         """
+        self._page_cursor(cursor)
         if not self.toolkit:
-            return []
+            return {"items": [], "next_cursor": None}
         try:
-            # toolkit.github is the PyGithub instance
-            repos = self.toolkit.github.get_user().get_repos(sort="updated")
-            return [
-                {
-                    "full_name": r.full_name,
-                    "name": r.name,
-                    "description": r.description,
-                    "private": r.private
-                }
-                for r in repos[:20]  # Limit to 20 for brevity
-            ]
+            repos, next_cursor = self._scan_pages("/user/repos", {"sort": "updated"}, cursor, limit, query,
+                                                  name_of=lambda r: r["full_name"])
+            return {
+                "items": [
+                    {
+                        "full_name": r["full_name"],
+                        "name": r["name"],
+                        "description": r.get("description"),
+                        "private": r.get("private", False)
+                    }
+                    for r in repos
+                ],
+                "next_cursor": next_cursor
+            }
         except Exception as e:
             logger.error(f"Failed to list repos: {e}")
-            return []
+            return {"items": [], "next_cursor": None}
 
-    def list_branches(self) -> List[str]:
+    def list_branches(self, query: Optional[str] = None, cursor: Optional[str] = None,
+                      limit: int = 100) -> Dict[str, Any]:
         """
-        Lists branches of the current repository.
+        Lists branches of the current repository. Returns {"items": [names], "next_cursor": str | None}.
+        Raises ValueError for a malformed cursor.
         """
+        self._page_cursor(cursor)
         if not self.current_repo or not self.toolkit:
-            return []
+            return {"items": [], "next_cursor": None}
         try:
-            repo = self.toolkit.github.get_repo(self.current_repo)
-            return [b.name for b in repo.get_branches()]
+            branches, next_cursor = self._scan_pages(f"/repos/{self.current_repo}/branches", {}, cursor, limit,
+                                                     query, name_of=lambda b: b["name"])
+            return {"items": [b["name"] for b in branches], "next_cursor": next_cursor}
         except Exception as e:
             logger.error(f"Failed to list branches: {e}")
-            return []
+            return {"items": [], "next_cursor": None}
+
+    TREE_CACHE_SIZE = 16
+
+    def _head_sha(self, ref: str) -> str:
+        """
+        Resolves a branch/tag/sha to its commit SHA. Asked of GitHub rather than the local
+        mirror, which is only fetched on connect, so pushes show up; the mirror is the fallback.
+        """
+        try:
+            # Short TTL: the branch may move, and revalidation 304s are free
+            commit, _ = github_client.get(f"/repos/{self.current_repo}/commits/{ref}", ttl=5)
+            return commit["sha"]
+        except Exception as e:
+            if not repo_mirror.has(self.current_repo):
+                raise
+            logger.warning(f"Resolving {ref} via GitHub failed, using the local mirror: {e}")
+            return repo_mirror.resolve(self.current_repo, ref)
+
+    def _tree_paths(self, sha: str) -> List[str]:
+        """
+        Returns every file path at a commit. Built once per SHA from the mirror, or from a
+        single git trees API call with recursive=1.
+        """
+        key = (self.current_repo, sha)
+        if key in self._tree_cache:
+            self._tree_cache.move_to_end(key)
+            return self._tree_cache[key]
 
-    def get_file_tree(self, path: str = "") -> List[str]:
+        paths = None
+        if repo_mirror.has(self.current_repo):
+            try:
+                paths = repo_mirror.list_files(self.current_repo, sha)
+            except Exception as e:
+                logger.warning(f"Mirror tree failed, falling back to GitHub API: {e}")
+        if paths is None:
+            # Uncached request: the per-SHA cache above already holds the result
+            tree = github_client.request("GET", f"/repos/{self.current_repo}/git/trees/{sha}",
+                                         params={"recursive": 1})
+            if tree.get("truncated"):
+                logger.warning(f"Tree for {self.current_repo}@{sha[:7]} is truncated by GitHub; "
+                               "connect the repo to build a local mirror for the full listing.")
+            paths = [entry["path"] for entry in tree["tree"] if entry["type"] == "blob"]
+
+        paths = sorted(paths)
+        self._tree_cache[key] = paths
+        if len(self._tree_cache) > self.TREE_CACHE_SIZE:
+            self._tree_cache.popitem(last=False)
+        return paths
+
+    def get_file_tree(self, path: str = "", ref: Optional[str] = None,
+                      cursor: Optional[str] = None, limit: int = 1000) -> Dict[str, Any]:
         """
-        Returns the file tree of the repository.
+        Returns the file tree of the repository, filtered by `path` prefix and paginated.
+        Cached by the commit SHA of `ref`, so repeat calls are free until the branch moves.
+        Raises ValueError for a malformed cursor.
         """
+        if cursor and not cursor.isdigit():
+            raise ValueError(f"Invalid cursor: {cursor!r}")
+        empty = {"files": [], "sha": None, "total": 0, "next_cursor": None}
         if not self.current_repo or not self.toolkit:
-             return []
-        # GithubToolkit's get_all_file_paths returns a list of strings
+             return empty
         try:
-            return self.toolkit.github_get_all_file_paths(self.current_repo, path)
+            sha = self._head_sha(ref or self.default_branch or "HEAD")
+            paths = self._tree_paths(sha)
         except Exception as e:
             logger.error(f"Failed to get file tree: {e}")
-            return []
+            return empty
+
+        prefix = path.strip("/")
+        if prefix:
+            paths = [p for p in paths if p == prefix or p.startswith(prefix + "/")]
+
+        start = int(cursor) if cursor else 0
+        limit = max(1, min(limit, 5000))
+        end = start + limit
+        return {
+            "files": paths[start:end],
+            "sha": sha,
+            "total": len(paths),
+            "next_cursor": str(end) if end < len(paths) else None
+        }
 
     def create_repository(self, name: str, description: str = "", private: bool = False) -> Dict[str, Any]:
         """
@@ -139,29 +303,18 @@ class GitHubTools:
         if not self.toolkit:
             return {"success": False, "error": "GitHub token not configured."}
         try:
-            user = self.toolkit.github.get_user()
-            repo = user.create_repo(
-                name=name,
-                description=description,
-                private=private,
-                auto_init=True
-            )
-            self.current_repo = repo.full_name
+            data = github_client.request("POST", "/user/repos", json={
+                "name": name,
+                "description": description,
+                "private": private,
+                "auto_init": True
+            })
+            github_client.invalidate("/user/repos")
+            self.current_repo = data["full_name"]
+            self.default_branch = data.get("default_branch")
             logger.info(f"Created new GitHub repo: {self.current_repo}")
             
-            repo_model = GitHubRepo(
-                full_name=repo.full_name,
-                name=repo.name,
-                description=repo.description,
-                private=repo.private,
-                stars=repo.stargazers_count,
-                forks=repo.forks_count,
-                open_issues=repo.open_issues_count,
-                language=repo.language,
-                url=repo.html_url
-            )
-            
-            result = repo_model.to_dict()
+            result = self._repo_model(data).to_dict()
             result["success"] = True
             return result
         except Exception as e:
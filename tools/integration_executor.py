@@ -0,0 +1,54 @@
+import time
+from typing import Any, Callable, Dict
+
+import anyio
+
+from config.settings import settings
+
+
+class IntegrationExecutor:
+    """
+    Runs blocking Jira/GitHub/Figma client calls off the event loop. Each integration
+    has its own CapacityLimiter, so a slow upstream can only tie up its own worker
+    slots - other routes (and /ws broadcasting) keep responding.
+    """
+
+    def __init__(self, limits: Dict[str, int]):
+        self._limiters = {name: anyio.CapacityLimiter(tokens) for name, tokens in limits.items()}
+        self._stats = {name: {"calls": 0, "waited": 0.0, "max_wait": 0.0} for name in limits}
+
+    async def run(self, integration: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        limiter = self._limiters[integration]
+        stats = self._stats[integration]
+        queued = time.perf_counter()
+
+        def call():
+            waited = time.perf_counter() - queued
+            stats["calls"] += 1
+            stats["waited"] += waited
+            stats["max_wait"] = max(stats["max_wait"], waited)
+            return func(*args, **kwargs)
+
+        return await anyio.to_thread.run_sync(call, limiter=limiter)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            name: {
+                "limit": int(limiter.total_tokens),
+                "in_flight": limiter.borrowed_tokens,
+                "waiting": limiter.statistics().tasks_waiting,
+                "calls": self._stats[name]["calls"],
+                "avg_wait": round(self._stats[name]["waited"] / self._stats[name]["calls"], 4)
+                if self._stats[name]["calls"] else 0.0,
+                "max_wait": round(self._stats[name]["max_wait"], 4),
+            }
+            for name, limiter in self._limiters.items()
+        }
+
+
+# Shared by the integration routes
+integration_executor = IntegrationExecutor({
+    "jira": settings.JIRA_CONCURRENCY,
+    "github": settings.GITHUB_CONCURRENCY,
+    "figma": settings.FIGMA_CONCURRENCY,
+})
@@ -0,0 +1,94 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from jira import JIRA
+from requests.adapters import HTTPAdapter
+
+from config.settings import settings
+from logging_config.logger import logger
+
+
+class JiraClientFactory:
+    """
+    Process-wide Jira client. Nothing touches the network until the first call;
+    the client then reuses one keep-alive session (pooled adapter) for every
+    JiraTools instance. A failed health check drops it so the next call reconnects.
+    """
+
+    def __init__(self, health_ttl: float = 60.0):
+        self.health_ttl = health_ttl
+        self._client: Optional[JIRA] = None
+        self._lock = threading.Lock()
+        self._last_health: Dict[str, Any] = {}
+        self._connects = 0
+        self._field_ids: Dict[str, Optional[str]] = {}
+
+    def _connect(self) -> JIRA:
+        start = time.perf_counter()
+        logger.info(f"Connecting to Jira at {settings.JIRA_BASE_URL}...")
+        client = JIRA(
+            server=settings.JIRA_BASE_URL,
+            basic_auth=(settings.JIRA_EMAIL, settings.JIRA_API_TOKEN),
+            get_server_info=False,  # no handshake; the first real call validates the connection
+            timeout=settings.JIRA_TIMEOUT,
+            max_retries=settings.JIRA_MAX_RETRIES,
+        )
+        if ".atlassian.net" in settings.JIRA_BASE_URL:
+            # Without serverInfo the library assumes Data Center and would use the retired /search API
+            client.deploymentType = "Cloud"
+        # JIRA has no public hook for its requests session (jira is pinned in requirements.txt for this)
+        adapter = HTTPAdapter(pool_connections=settings.JIRA_POOL_SIZE, pool_maxsize=settings.JIRA_POOL_SIZE)
+        client._session.mount("https://", adapter)
+        client._session.mount("http://", adapter)
+        self._connects += 1
+        logger.info(f"Jira client ready in {time.perf_counter() - start:.2f}s")
+        return client
+
+    def get(self) -> JIRA:
+        client = self._client
+        if client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self._connect()
+                client = self._client
+        return client
+
+    def reset(self):
+        with self._lock:
+            if self._client is not None:
+                try:
+                    self._client.close()
+                except Exception:
+                    pass
+            self._client = None
+            self._field_ids.clear()
+
+    def field_id(self, *names: str) -> Optional[str]:
+        """Id of the first field matching one of `names` (case-insensitive); looked up once per client."""
+        cache_key = "|".join(n.lower() for n in names)
+        if cache_key not in self._field_ids:
+            by_name = {f["name"].lower(): f["id"] for f in self.get().fields()}
+            self._field_ids[cache_key] = next((by_name[n.lower()] for n in names if n.lower() in by_name), None)
+            logger.info(f"Jira field {names[0]!r} resolved to {self._field_ids[cache_key]}")
+        return self._field_ids[cache_key]
+
+    def health_check(self, force: bool = False) -> Dict[str, Any]:
+        """Calls serverInfo at most once per `health_ttl`; resets the client when it fails."""
+        if not force and self._last_health and time.monotonic() - self._last_health["checked_at"] < self.health_ttl:
+            return {k: v for k, v in self._last_health.items() if k != "checked_at"}
+        start = time.perf_counter()
+        try:
+            info = self.get().server_info()
+            result = {"healthy": True, "version": info.get("version"), "server_title": info.get("serverTitle")}
+        except Exception as e:
+            logger.warning(f"Jira health check failed: {e}")
+            self.reset()
+            result = {"healthy": False, "error": str(e)}
+        result.update(latency=round(time.perf_counter() - start, 3), connects=self._connects)
+        self._last_health = {**result, "checked_at": time.monotonic()}
+        return result
+
+
+# Shared Jira client factory
+jira_client = JiraClientFactory(health_ttl=settings.JIRA_HEALTH_TTL)
@@ -0,0 +1,308 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from config.settings import settings
+from logging_config.logger import logger
+
+# Ticket fields stored per issue (the names list_tickets uses)
+COLUMNS = ("summary", "status", "issue_type", "assignee", "labels", "parent_key",
+           "description", "story_points", "created", "updated")
+CURSOR_PREFIX = "m:"
+PAGE_SIZE = 100
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    key TEXT PRIMARY KEY,
+    project TEXT NOT NULL,
+    summary TEXT, status TEXT COLLATE NOCASE, issue_type TEXT COLLATE NOCASE, assignee TEXT,
+    labels TEXT, parent_key TEXT, description TEXT, story_points REAL,
+    created TEXT, updated TEXT,
+    stale INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS issues_project_created ON issues (project, created DESC, key DESC);
+CREATE INDEX IF NOT EXISTS issues_project_status ON issues (project, status);
+CREATE INDEX IF NOT EXISTS issues_project_type ON issues (project, issue_type);
+CREATE INDEX IF NOT EXISTS issues_stale ON issues (project) WHERE stale = 1;
+CREATE TABLE IF NOT EXISTS issue_labels (
+    key TEXT NOT NULL,
+    label TEXT NOT NULL COLLATE NOCASE,
+    PRIMARY KEY (key, label)
+);
+CREATE INDEX IF NOT EXISTS issue_labels_label ON issue_labels (label);
+CREATE TABLE IF NOT EXISTS sync_state (
+    project TEXT PRIMARY KEY,
+    last_sync REAL NOT NULL,
+    last_reconcile REAL NOT NULL
+);
+"""
+
+
+class JiraMirror:
+    """
+    Local SQLite copy of the project's issues. A background thread re-reads issues
+    updated since the last sync (with a little overlap) every `interval` seconds and
+    does a key-only pass every `reconcile_interval` to drop deleted issues.
+    JiraTools serves list_tickets / get_ticket from here once the first full sync
+    has finished; its writes mark the touched rows stale and wake the sync thread,
+    and list pages re-read stale rows from Jira (refresh_stale) before serving them.
+    """
+
+    def __init__(self, path: str, interval: float = 60.0, reconcile_interval: float = 3600.0):
+        self.path = path
+        self.interval = interval
+        self.reconcile_interval = reconcile_interval
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._initialized = False
+        self._listeners: List[Callable[[List[dict], List[str]], None]] = []
+        self._stats = {"syncs": 0, "errors": 0, "upserted": 0, "deleted": 0, "last_error": None,
+                       "last_duration": None}
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            self._initialized = True
+        return conn
+
+    def _state(self, project: str) -> Optional[sqlite3.Row]:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT * FROM sync_state WHERE project = ?", (project.upper(),)).fetchone()
+
+    def is_ready(self, project: str) -> bool:
+        """True once a full sync of `project` has completed."""
+        return os.path.exists(self.path) and self._state(project) is not None
+
+    # --- Sync ---
+
+    @staticmethod
+    def _walk(tools, jql: str, fields: List[str]) -> Iterator[List[dict]]:
+        cursor = None
+        while True:
+            issues, cursor = tools._search_page(jql, fields, cursor, PAGE_SIZE)
+            yield issues
+            if not cursor:
+                return
+
+    def subscribe(self, callback: Callable[[List[dict], List[str]], None]):
+        """callback(upserted rows, deleted keys) runs after each sync write."""
+        self._listeners.append(callback)
+
+    def _notify(self, rows: List[dict], deleted: List[str]):
+        for callback in self._listeners:
+            try:
+                callback(rows, deleted)
+            except Exception as e:
+                logger.warning(f"Jira mirror listener failed: {e}")
+
+    def _upsert(self, project: str, rows: List[dict]):
+        with self._write_lock, closing(self._connect()) as conn, conn:
+            for row in rows:
+                values = [row.get(c) for c in COLUMNS]
+                values[COLUMNS.index("labels")] = json.dumps(row.get("labels") or [])
+                conn.execute(
+                    f"INSERT OR REPLACE INTO issues (key, project, {', '.join(COLUMNS)}, stale) "
+                    f"VALUES (?, ?, {', '.join('?' * len(COLUMNS))}, 0)",
+                    [row["key"], project, *values],
+                )
+                conn.execute("DELETE FROM issue_labels WHERE key = ?", (row["key"],))
+                conn.executemany("INSERT OR IGNORE INTO issue_labels (key, label) VALUES (?, ?)",
+                                 [(row["key"], label) for label in row.get("labels") or []])
+        self._stats["upserted"] += len(rows)
+        self._notify(rows, [])
+
+    def _delete(self, keys: List[str]):
+        with self._write_lock, closing(self._connect()) as conn, conn:
+            for key in keys:
+                conn.execute("DELETE FROM issues WHERE key = ?", (key,))
+                conn.execute("DELETE FROM issue_labels WHERE key = ?", (key,))
+        self._stats["deleted"] += len(keys)
+        if keys:
+            self._notify([], keys)
+
+    def _delete_missing(self, project: str, live_keys: Set[str]) -> int:
+        with closing(self._connect()) as conn:
+            stored = {r[0] for r in conn.execute("SELECT key FROM issues WHERE project = ?", (project,))}
+        gone = sorted(stored - live_keys)
+        self._delete(gone)
+        return len(gone)
+
+    def sync(self, tools, full: bool = False) -> Dict[str, Any]:
+        """Brings the mirror of tools.project_key up to date. `tools` is a JiraTools instance."""
+        project = tools.project_key.upper()
+        started = time.time()
+        state = self._state(project)
+        full = full or state is None
+        mapping = tools._list_fields(list(COLUMNS))
+        if full:
+            jql = f"project = {project}"
+        else:
+            # Relative JQL avoids the user-timezone ambiguity of absolute dates; re-reading a minute is harmless
+            minutes = int((started - state["last_sync"]) // 60) + 2
+            jql = f'project = {project} AND updated >= "-{minutes}m"'
+
+        seen: Set[str] = set()
+        for issues in self._walk(tools, jql, list(mapping.values())):
+            rows = [tools._ticket_row(raw, mapping) for raw in issues]
+            self._upsert(project, rows)
+            seen.update(row["key"] for row in rows)
+
+        last_reconcile = state["last_reconcile"] if state else started
+        deleted = 0
+        if full:
+            deleted = self._delete_missing(project, seen)
+            last_reconcile = started
+        elif started - last_reconcile >= self.reconcile_interval:
+            live_keys = {raw["key"] for issues in self._walk(tools, f"project = {project}", ["updated"])
+                         for raw in issues}
+            deleted = self._delete_missing(project, live_keys)
+            last_reconcile = started
+
+        with self._write_lock, closing(self._connect()) as conn, conn:
+            conn.execute("INSERT OR REPLACE INTO sync_state (project, last_sync, last_reconcile) VALUES (?, ?, ?)",
+                         (project, started, last_reconcile))
+        self._stats["syncs"] += 1
+        self._stats["last_duration"] = round(time.time() - started, 3)
+        logger.info(f"Jira mirror synced {project}: {len(seen)} updated, {deleted} deleted "
+                    f"({'full' if full else 'incremental'}, {self._stats['last_duration']}s)")
+        return {"project": project, "full": full, "updated": len(seen), "deleted": deleted}
+
+    def _run(self, tools):
+        while not self._stop.is_set():
+            try:
+                self.sync(tools)
+            except Exception as e:
+                self._stats["errors"] += 1
+                self._stats["last_error"] = str(e)
+                logger.warning(f"Jira mirror sync failed: {e}")
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def start(self, tools):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(tools,), name="jira-mirror", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def request_sync(self):
+        self._wake.set()
+
+    def mark_stale(self, key: str):
+        """Reads of `key` go to Jira until the next sync has re-read it."""
+        self._wake.set()
+        if not os.path.exists(self.path):
+            return
+        with self._write_lock, closing(self._connect()) as conn, conn:
+            conn.execute("UPDATE issues SET stale = 1 WHERE key = ?", (key.upper(),))
+
+    def refresh_stale(self, project: str, fetch: Callable[[str], Optional[dict]]) -> int:
+        """
+        Re-reads the rows of `project` marked stale by a write, so list pages don't show
+        pre-write values until the next sync. fetch(key) returns the row, or None if the
+        issue is gone; keys whose fetch fails stay stale for the sync thread.
+        """
+        if not os.path.exists(self.path):
+            return 0
+        with closing(self._connect()) as conn:
+            keys = [r[0] for r in conn.execute("SELECT key FROM issues WHERE project = ? AND stale = 1",
+                                               (project.upper(),))]
+        rows, gone = [], []
+        for key in keys:
+            try:
+                row = fetch(key)
+            except Exception as e:
+                logger.warning(f"Could not refresh stale mirror row {key}: {e}")
+                continue
+            if row:
+                rows.append(row)
+            else:
+                gone.append(key)
+        if rows:
+            self._upsert(project.upper(), rows)
+        self._delete(gone)
+        return len(rows) + len(gone)
+
+    # --- Reads ---
+
+    @staticmethod
+    def _row_dict(row: sqlite3.Row, fields: List[str], base_url: str) -> dict:
+        result = {"key": row["key"], "url": f"{base_url}/browse/{row['key']}"}
+        for name in fields:
+            result[name] = json.loads(row["labels"] or "[]") if name == "labels" else row[name]
+        return result
+
+    def get(self, key: str, base_url: str) -> Optional[dict]:
+        """Full row for `key`, or None when it is unknown or stale."""
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT * FROM issues WHERE key = ? AND stale = 0", (key.upper(),)).fetchone()
+        return self._row_dict(row, list(COLUMNS), base_url) if row else None
+
+    @staticmethod
+    def parse_cursor(cursor: str) -> Tuple[str, str]:
+        """(created, key) of the last row of a page from a "m:<created>|<key>" cursor; raises ValueError if malformed."""
+        created, sep, key = cursor[len(CURSOR_PREFIX):].partition("|")
+        if not (cursor.startswith(CURSOR_PREFIX) and sep and created and key):
+            raise ValueError(f"Invalid cursor: {cursor!r}")
+        return created, key
+
+    def query(self, project: str, fields: List[str], base_url: str, limit: int = 50,
+              cursor: Optional[str] = None, status: Optional[List[str]] = None,
+              label: Optional[List[str]] = None, issue_type: Optional[List[str]] = None) -> Dict[str, Any]:
+        """One page, newest first. Returns {"items", "next_cursor"} like JiraTools.list_tickets."""
+        sql, params = "SELECT * FROM issues WHERE project = ?", [project.upper()]
+        for column, values in (("status", status), ("issue_type", issue_type)):
+            if values:
+                sql += f" AND {column} IN ({', '.join('?' * len(values))})"
+                params += values
+        if label:
+            sql += f" AND key IN (SELECT key FROM issue_labels WHERE label IN ({', '.join('?' * len(label))}))"
+            params += label
+        if cursor:
+            created, key = self.parse_cursor(cursor)
+            sql += " AND (created < ? OR (created = ? AND key < ?))"
+            params += [created, created, key]
+        sql += " ORDER BY created DESC, key DESC LIMIT ?"
+        params.append(limit + 1)
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(sql, params).fetchall()
+        page = rows[:limit]
+        next_cursor = f"{CURSOR_PREFIX}{page[-1]['created']}|{page[-1]['key']}" if len(rows) > limit else None
+        return {"items": [self._row_dict(r, fields, base_url) for r in page], "next_cursor": next_cursor}
+
+    def get_stats(self, project: Optional[str] = None) -> Dict[str, Any]:
+        state = self._state(project or settings.JIRA_PROJECT_KEY or "PROJ")
+        with closing(self._connect()) as conn:
+            count = conn.execute("SELECT COUNT(*) FROM issues").fetchone()[0]
+        return {
+            **self._stats,
+            "running": bool(self._thread and self._thread.is_alive()),
+            "issues": count,
+            "last_sync": state["last_sync"] if state else None,
+            # Upper bound on how old a mirrored ticket can be
+            "lag_seconds": round(time.time() - state["last_sync"], 1) if state else None,
+        }
+
+
+# Shared by JiraTools and the background sync started in main.py
+jira_mirror = JiraMirror(
+    settings.JIRA_MIRROR_PATH,
+    interval=settings.JIRA_MIRROR_INTERVAL,
+    reconcile_interval=settings.JIRA_MIRROR_RECONCILE_INTERVAL,
+)
@@ -1,25 +1,74 @@
-from typing import List, Optional
-from jira import JIRA
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from jira import JIRA, JIRAError
 from config.settings import settings
 from logging_config.logger import logger
-from models.ticket import JiraTicket
+from tools.jira_client import jira_client
+from tools.comment_writer import comment_writer
+from tools.jira_mirror import COLUMNS as MIRROR_COLUMNS, CURSOR_PREFIX, jira_mirror
+from tools.ticket_cache import ticket_cache
+from tools.ticket_similarity import SIMILAR_MIN_SCORE, ticket_similarity
+from tools.transition_cache import find_transition, transition_cache
 from models.proposal import TicketProposal
 
+ISSUE_TYPES = {
+    "sub-task": "Subtask",
+    "subtask": "Subtask",
+    "story": "Story",
+    "task": "Task",
+    "epic": "Epic",
+    "bug": "Bug"
+}
+
+# Jira's bulk-create endpoint accepts at most 50 issues per request
+BULK_CREATE_CHUNK = 50
+
+# list_tickets output name -> Jira field; story_points is resolved per instance
+LIST_FIELDS = {
+    "summary": "summary",
+    "status": "status",
+    "issue_type": "issuetype",
+    "assignee": "assignee",
+    "labels": "labels",
+    "parent_key": "parent",
+    "description": "description",
+    "created": "created",
+    "updated": "updated",
+}
+DEFAULT_LIST_FIELDS = ("summary", "status", "issue_type", "assignee", "labels", "parent_key")
+LIST_PAGE_MAX = 100
+# Tickets loaded into the duplicate-detection index
+SIMILARITY_MAX_TICKETS = 5000
+
 class JiraTools:
     def __init__(self):
         self.base_url = settings.JIRA_BASE_URL
         self.email = settings.JIRA_EMAIL
         self.api_token = settings.JIRA_API_TOKEN
         self.project_key = settings.JIRA_PROJECT_KEY or "PROJ"
-        
-        # Initialize Jira client
-        logger.info(f"Connecting to Jira at {self.base_url}...")
-        self.jira = JIRA(
-            server=self.base_url,
-            basic_auth=(self.email, self.api_token)
-        )
-        logger.info(f"Jira client initialized for project {self.project_key}")
-    
+
+    @property
+    def jira(self) -> JIRA:
+        """Shared client, connected on first use."""
+        return jira_client.get()
+
+    def health_check(self) -> dict:
+        return jira_client.health_check()
+
+    TICKET_FIELDS = ("summary", "description", "status", "assignee", "created", "updated")
+
+    def _issue(self, ticket_key: str, fields=TICKET_FIELDS):
+        """Cached issue fetch, projected to `fields`."""
+        return ticket_cache.get(ticket_key, fields, lambda key, projection: self.jira.issue(key, fields=projection))
+
+    def _changed(self, ticket_key: str):
+        """Drops `ticket_key` from the ticket cache and the local mirror after a write."""
+        ticket_cache.invalidate(ticket_key)
+        jira_mirror.mark_stale(ticket_key)
+
+    def cache_stats(self) -> dict:
+        return {**ticket_cache.get_stats(), "transitions": transition_cache.get_stats(),
+                "similarity": ticket_similarity.get_stats()}
+
     def propose_ticket(self, summary: str, description: str, 
                       issue_type: str = "Story", 
                       story_points: Optional[int] = None,
@@ -37,27 +86,48 @@ class JiraTools:
             labels (List[str], optional): Tags.
             parent_key (str, optional): Parent link.
         """
-        type_mapping = {
-            "sub-task": "Subtask",
-            "subtask": "Subtask",
-            "story": "Story",
-            "task": "Task",
-            "epic": "Epic",
-            "bug": "Bug"
-        }
-        normalized_type = type_mapping.get(issue_type.lower(), issue_type)
+        normalized_type = ISSUE_TYPES.get(issue_type.lower(), issue_type)
 
         logger.info(f"Proposing ticket: {summary}")
+        try:
+            similar = self._similar(f"{summary}\n{description}", k=3, min_score=SIMILAR_MIN_SCORE)
+        except Exception as e:
+            logger.warning(f"Duplicate check failed: {e}")
+            similar = []
         proposal = TicketProposal(
             summary=summary,
             description=description,
             issue_type=normalized_type,
             story_points=story_points,
             labels=labels or ["agent-core"],
-            parent_key=parent_key
+            parent_key=parent_key,
+            similar_tickets=similar
         )
         return proposal.to_dict()
 
+    def _similar(self, text: str, k: int, min_score: float = 0.0) -> List[dict]:
+        ticket_similarity.ensure(lambda: self.iter_tickets(fields=["summary", "description", "status"],
+                                                           limit=SIMILARITY_MAX_TICKETS))
+        return ticket_similarity.query(text, k=k, min_score=min_score)
+
+    def find_similar_tickets(self, text: str, k: int = 5) -> dict:
+        """
+        Finds existing tickets similar to a summary or description, ranked by score (0-1). Use this
+        BEFORE proposing a ticket to catch duplicates, instead of listing and reading tickets.
+
+        Args:
+            text (str): Summary and/or description of the work.
+            k (int, optional): Maximum number of matches. Defaults to 5.
+        """
+        try:
+            result = {"success": True, "matches": self._similar(text, k)}
+            if not ticket_similarity.ready:
+                result["note"] = "The ticket index is still loading; no matches yet. Try again shortly."
+            return result
+        except Exception as e:
+            logger.error(f"Similarity search failed: {str(e)}")
+            return {"success": False, "error": str(e)}
+
     def create_ticket(self, summary: str, description: str, 
                      issue_type: str = "Story", 
                      story_points: Optional[int] = None,
@@ -72,51 +142,31 @@ class JiraTools:
             issue_type (str, optional): The type of ticket. Defaults to 'Story'. Options: 'Story', 'Task', 'Bug', 'Subtask'.
             story_points (int, optional): The complexity of the ticket.
             labels (List[str], optional): List of tags/labels to apply.
-            parent_key (str, optional): The Jira key of the parent ticket (required for 'Subtask').
+            parent_key (str, optional): The Jira key of the parent ticket (required for 'Subtask'; for other types, the epic).
         """
-        type_mapping = {
-            "sub-task": "Subtask",
-            "subtask": "Subtask",
-            "story": "Story",
-            "task": "Task",
-            "epic": "Epic",
-            "bug": "Bug"
-        }
-        
-        normalized_type = type_mapping.get(issue_type.lower(), issue_type)
+        issue_dict = self._issue_fields(summary, description, issue_type, story_points, labels, parent_key)
+        points_field = self._story_points_field() if story_points else None
 
-        issue_dict = {
-            'project': {'key': self.project_key},
-            'summary': summary,
-            'description': description,
-            'issuetype': {'name': normalized_type},
-        }
-        
-        if normalized_type == "Subtask" and parent_key:
-            issue_dict['parent'] = {'key': parent_key}
-        
-        if story_points:
-            issue_dict['customfield_10016'] = story_points
-        
-        if labels:
-            issue_dict['labels'] = labels
-        
         try:
             logger.info(f"Creating ticket: {summary[:50]}...")
             new_issue = self.jira.create_issue(fields=issue_dict)
             logger.info(f"Ticket created successfully: {new_issue.key}")
         except Exception as e:
-            if 'customfield_10016' in issue_dict:
-                del issue_dict['customfield_10016']
-                try:
-                    new_issue = self.jira.create_issue(fields=issue_dict)
-                    logger.info(f"Ticket created successfully (without story points): {new_issue.key}")
-                except Exception as second_e:
-                    logger.error(f"Failed to create ticket: {str(second_e)}")
-                    return {"success": False, "error": str(second_e)}
-            else:
+            if points_field not in issue_dict or points_field not in str(e):
                 logger.error(f"Failed to create ticket: {str(e)}")
                 return {"success": False, "error": str(e)}
+            # Story points are not on this issue type's create screen
+            del issue_dict[points_field]
+            try:
+                new_issue = self.jira.create_issue(fields=issue_dict)
+                logger.info(f"Ticket created successfully (without story points): {new_issue.key}")
+            except Exception as second_e:
+                logger.error(f"Failed to create ticket: {str(second_e)}")
+                return {"success": False, "error": str(second_e)}
+        if parent_key:
+            self._changed(parent_key)
+        jira_mirror.request_sync()
+        ticket_similarity.update(new_issue.key, summary, description, str(new_issue.fields.status))
         
         return {
             "success": True,
@@ -125,6 +175,139 @@ class JiraTools:
             "status": str(new_issue.fields.status),
             "url": f"{self.base_url}/browse/{new_issue.key}"
         }
+
+    def _story_points_field(self) -> Optional[str]:
+        """Custom field id for story points (company- or team-managed name), cached per client."""
+        try:
+            return jira_client.field_id("Story Points", "Story point estimate")
+        except Exception as e:
+            logger.warning(f"Could not look up the story points field: {e}")
+            return None
+
+    def _issue_fields(self, summary: str, description: str, issue_type: str = "Story",
+                      story_points: Optional[int] = None, labels: Optional[List[str]] = None,
+                      parent_key: Optional[str] = None) -> dict:
+        normalized_type = ISSUE_TYPES.get(issue_type.lower(), issue_type)
+        issue_dict = {
+            'project': {'key': self.project_key},
+            'summary': summary,
+            'description': description,
+            'issuetype': {'name': normalized_type},
+        }
+        # Subtasks need a parent; other types use it to join an epic
+        if parent_key:
+            issue_dict['parent'] = {'key': parent_key}
+        if story_points:
+            points_field = self._story_points_field()
+            if points_field:
+                issue_dict[points_field] = story_points
+        if labels:
+            issue_dict['labels'] = labels
+        return issue_dict
+
+    def _create_chunk(self, field_list: List[dict]) -> List[dict]:
+        """One bulk request per BULK_CREATE_CHUNK issues; items rejected only for story points are retried without them."""
+        results = []
+        for i in range(0, len(field_list), BULK_CREATE_CHUNK):
+            results.extend(self.jira.create_issues(field_list[i:i + BULK_CREATE_CHUNK], prefetch=False))
+
+        points_field = self._story_points_field()
+        retry = [i for i, r in enumerate(results)
+                 if r["status"] == "Error" and points_field in (r["error"] or {}) and points_field in field_list[i]]
+        if retry:
+            stripped = [{k: v for k, v in field_list[i].items() if k != points_field} for i in retry]
+            for i, result in zip(retry, self._create_chunk(stripped)):
+                results[i] = {**result, "story_points_dropped": result["status"] == "Success"}
+        return results
+
+    def create_tickets_bulk(self, tickets: List[dict], parent_key: Optional[str] = None) -> dict:
+        """
+        Creates many tickets at once (e.g. every sub-task of a feature breakdown, or one QA Defect per
+        failure) using Jira's bulk API, instead of calling create_ticket repeatedly.
+
+        Args:
+            tickets (List[dict]): One dict per ticket with 'summary' and 'description', and optionally
+                'issue_type' (default 'Subtask' when a parent is set, else 'Story'), 'story_points', 'labels',
+                'parent_key' and 'parent_index' (position in this list of a ticket created in the same call,
+                e.g. a new Story whose sub-tasks follow it).
+            parent_key (str, optional): Parent for every ticket that does not set its own parent.
+        """
+        results: List[Optional[dict]] = [None] * len(tickets)
+        keys: dict = {}
+        requests_made = 0
+
+        # Reject malformed items up front so they fail alone instead of aborting the batch
+        for index, ticket in enumerate(tickets):
+            if not isinstance(ticket, dict):
+                results[index] = {"index": index, "success": False, "error": "Ticket must be an object"}
+            elif not isinstance(ticket.get("summary"), str) or not ticket["summary"].strip():
+                results[index] = {"index": index, "success": False, "error": "Missing 'summary'"}
+        pending = [i for i in range(len(tickets)) if results[i] is None]
+
+        # Create in waves so tickets whose parent is created in this call wait for its key
+        while pending:
+            wave, waiting = [], []
+            for index in pending:
+                parent_index = tickets[index].get("parent_index")
+                if parent_index is None or parent_index in keys:
+                    wave.append(index)
+                elif not (isinstance(parent_index, int) and 0 <= parent_index < len(tickets)) \
+                        or results[parent_index] is not None or parent_index == index:
+                    results[index] = {"index": index, "success": False,
+                                      "error": f"Parent ticket #{parent_index} was not created"}
+                else:
+                    waiting.append(index)
+            if not wave:
+                for index in waiting:
+                    results[index] = {"index": index, "success": False, "error": "Circular parent_index"}
+                break
+
+            field_list = []
+            for index in wave:
+                ticket = tickets[index]
+                parent = keys.get(ticket.get("parent_index")) or ticket.get("parent_key") or parent_key
+                field_list.append(self._issue_fields(
+                    summary=ticket["summary"],
+                    description=ticket.get("description", ""),
+                    issue_type=ticket.get("issue_type") or ("Subtask" if parent else "Story"),
+                    story_points=ticket.get("story_points"),
+                    labels=ticket.get("labels"),
+                    parent_key=parent,
+                ))
+
+            logger.info(f"Bulk creating {len(field_list)} tickets...")
+            try:
+                created = self._create_chunk(field_list)
+            except Exception as e:
+                logger.error(f"Bulk create failed: {str(e)}")
+                created = [{"status": "Error", "error": str(e), "issue": None}] * len(field_list)
+            requests_made += -(-len(field_list) // BULK_CREATE_CHUNK)
+
+            for index, fields, result in zip(wave, field_list, created):
+                if result["status"] == "Success":
+                    key = result["issue"].key
+                    keys[index] = key
+                    ticket_similarity.update(key, fields["summary"], fields["description"])
+                    results[index] = {"index": index, "success": True, "key": key,
+                                      "url": f"{self.base_url}/browse/{key}"}
+                    if result.get("story_points_dropped"):
+                        results[index]["warning"] = "Created without story points"
+                else:
+                    results[index] = {"index": index, "success": False, "error": result["error"]}
+                if "parent" in fields:
+                    self._changed(fields["parent"]["key"])
+            pending = [i for i in waiting if results[i] is None]
+
+        jira_mirror.request_sync()
+        created_count = len(keys)
+        logger.info(f"Bulk create finished: {created_count}/{len(tickets)} tickets in {requests_made} requests")
+        return {
+            "success": created_count == len(tickets),
+            "created": created_count,
+            "failed": len(tickets) - created_count,
+            "requests": requests_made,
+            "results": results,
+        }
     
     def get_ticket(self, ticket_key: str) -> dict:
         """
@@ -134,7 +317,19 @@ class JiraTools:
             ticket_key (str): The unique Jira key (e.g., 'KAN-1').
         """
         logger.info(f"Fetching ticket details for {ticket_key}")
-        issue = self.jira.issue(ticket_key)
+        if jira_mirror.is_ready(ticket_key.split("-")[0]):
+            row = jira_mirror.get(ticket_key, self.base_url)
+            if row:
+                return {
+                    "key": row["key"],
+                    "summary": row["summary"],
+                    "description": row["description"],
+                    "status": row["status"],
+                    "assignee": None if row["assignee"] == "Unassigned" else row["assignee"],
+                    "created": row["created"],
+                    "updated": row["updated"],
+                }
+        issue = self._issue(ticket_key)
         
         return {
             "key": issue.key,
@@ -146,31 +341,56 @@ class JiraTools:
             "updated": str(issue.fields.updated),
         }
     
+    def _current_transitions(self, ticket_key: str, refresh: bool = False):
+        """(transitions available from the ticket's status, status); read from the shared workflow cache."""
+        project = ticket_key.split("-")[0]
+        if refresh:
+            ticket_cache.invalidate(ticket_key)
+        status = str(self._issue(ticket_key, ("status",)).fields.status)
+        load = lambda: self.jira.transitions(ticket_key)
+        if refresh:
+            return transition_cache.refresh(project, status, load), status
+        return transition_cache.get(project, status, load), status
+
     def update_ticket_status(self, ticket_key: str, transition_name: str) -> dict:
         """
         Moves a ticket through its workflow (e.g., from 'To Do' to 'In Progress').
 
         Args:
             ticket_key (str): The Jira key (e.g., 'KAN-1').
-            transition_name (str): The name of the transition (e.g., 'In Progress', 'Done').
+            transition_name (str): The transition or target status (e.g., 'In Progress', 'Start Progress', 'Done').
         """
         logger.info(f"Updating ticket {ticket_key} to status {transition_name}")
-        issue = self.jira.issue(ticket_key)
-        transitions = self.jira.transitions(issue)
-        transition_id = None
-        
-        for t in transitions:
-            if t['name'].lower() == transition_name.lower():
-                transition_id = t['id']
-                break
-        
-        if transition_id:
-            self.jira.transition_issue(issue, transition_id)
-            logger.info(f"Ticket {ticket_key} successfully transitioned to {transition_name}")
+        transitions, status = self._current_transitions(ticket_key)
+        transition = find_transition(transitions, transition_name)
+        refreshed = False
+        if transition is None:
+            # The workflow or the ticket's status may have changed since the map was cached
+            transitions, status = self._current_transitions(ticket_key, refresh=True)
+            transition = find_transition(transitions, transition_name)
+            refreshed = True
+
+        if transition:
+            try:
+                self.jira.transition_issue(ticket_key, transition['id'])
+            except Exception as e:
+                if refreshed:
+                    raise
+                logger.warning(f"Cached transition {transition['id']} failed for {ticket_key}: {e}")
+                transitions, status = self._current_transitions(ticket_key, refresh=True)
+                transition = find_transition(transitions, transition_name)
+                if transition is None:
+                    return {"success": False, "error": f"Transition '{transition_name}' not found",
+                            "available_transitions": [t['name'] for t in transitions]}
+                self.jira.transition_issue(ticket_key, transition['id'])
+            self._changed(ticket_key)
+            new_status = transition['to']['name'] or transition['name']
+            logger.info(f"Ticket {ticket_key} successfully transitioned to {new_status}")
             return {
                 "success": True,
                 "ticket_key": ticket_key,
-                "new_status": transition_name
+                "previous_status": status,
+                "new_status": new_status
             }
         else:
             available = [t['name'] for t in transitions]
@@ -191,7 +411,6 @@ class JiraTools:
             description (str, optional): The new detailed requirements.
         """
         logger.info(f"Updating fields for ticket {ticket_key}")
-        issue = self.jira.issue(ticket_key)
         fields = {}
         if summary:
             fields['summary'] = summary
@@ -199,23 +418,25 @@ class JiraTools:
             fields['description'] = description
         
         if fields:
-            issue.update(fields=fields)
+            self._issue(ticket_key, ("summary",)).update(fields=fields)
+            self._changed(ticket_key)
+            ticket_similarity.update(ticket_key.upper(), fields.get('summary'), fields.get('description'))
             logger.info(f"Ticket {ticket_key} successfully updated.")
             return {"success": True, "ticket_key": ticket_key}
         return {"success": False, "error": "No fields provided to update."}
     
     def add_comment(self, ticket_key: str, comment: str) -> dict:
         """
-        Adds a comment to an existing Jira ticket.
+        Adds a comment to an existing Jira ticket. The comment is posted in the background within a few
+        seconds; several comments on the same ticket in quick succession are combined into one.
 
         Args:
             ticket_key (str): The Jira key (e.g., 'KAN-1').
             comment (str): The text of the comment to add.
         """
-        logger.info(f"Adding comment to ticket {ticket_key}")
-        issue = self.jira.issue(ticket_key)
-        self.jira.add_comment(issue, comment)
-        return {"success": True, "ticket_key": ticket_key}
+        logger.info(f"Queueing comment for ticket {ticket_key}")
+        queued = comment_writer.enqueue(ticket_key, comment)
+        return {"success": True, "ticket_key": ticket_key, **queued}
     
     def assign_ticket(self, ticket_key: str, assignee_email: str) -> dict:
         """
@@ -226,43 +447,158 @@ class JiraTools:
             assignee_email (str): The email of the person to assign the ticket to.
         """
         logger.info(f"Assigning ticket {ticket_key} to {assignee_email}")
-        issue = self.jira.issue(ticket_key)
         users = self.jira.search_users(query=assignee_email)
         
         if users:
             user = users[0]
-            issue.update(assignee={'accountId': user.accountId})
+            self._issue(ticket_key, ("summary",)).update(assignee={'accountId': user.accountId})
+            self._changed(ticket_key)
             logger.info(f"Ticket {ticket_key} assigned to {user.displayName}")
             return {"success": True, "assigned_to": user.displayName}
         else:
             logger.warning(f"User {assignee_email} not found for assignment")
             return {"success": False, "error": f"User {assignee_email} not found"}
     
-    def list_tickets(self, max_results: int = 50) -> list:
+    @staticmethod
+    def _csv(value: Optional[str]) -> List[str]:
+        return [v.strip() for v in (value or "").split(",") if v.strip()]
+
+    @classmethod
+    def _jql_values(cls, field: str, value: Optional[str]) -> Optional[str]:
+        """'To Do,In Progress' -> status in ("To Do", "In Progress")"""
+        values = cls._csv(value)
+        if not values:
+            return None
+        quoted = ", ".join('"' + v.replace("\\", "\\\\").replace('"', '\\"') + '"' for v in values)
+        return f"{field} in ({quoted})"
+
+    def _list_jql(self, status: Optional[str], label: Optional[str], issue_type: Optional[str]) -> str:
+        clauses = [f"project = {self.project_key}"]
+        for field, value in (("status", status), ("labels", label), ("issuetype", issue_type)):
+            clause = self._jql_values(field, value)
+            if clause:
+                clauses.append(clause)
+        return " AND ".join(clauses) + " ORDER BY created DESC"
+
+    def _list_fields(self, fields: Optional[List[str]]) -> Dict[str, str]:
+        wanted = fields or DEFAULT_LIST_FIELDS
+        mapping = {name: LIST_FIELDS[name] for name in wanted if name in LIST_FIELDS}
+        if "story_points" in wanted:
+            points_field = self._story_points_field()
+            if points_field:
+                mapping["story_points"] = points_field
+        return mapping
+
+    def _ticket_row(self, raw: dict, mapping: Dict[str, str]) -> dict:
+        values = raw.get("fields") or {}
+        row = {"key": raw["key"], "url": f"{self.base_url}/browse/{raw['key']}"}
+        for name, field in mapping.items():
+            value = values.get(field)
+            if name == "assignee":
+                value = value["displayName"] if value else "Unassigned"
+            elif name in ("status", "issue_type"):
+                value = value["name"] if value else None
+            elif name == "parent_key":
+                value = value["key"] if value else None
+            elif name == "labels":
+                value = value or []
+            row[name] = value
+        return row
+
+    def _search_page(self, jql: str, jira_fields: List[str], cursor: Optional[str],
+                     limit: int) -> Tuple[List[dict], Optional[str]]:
+        """One page of raw issues. Cloud pages by token; Data Center by offset. Raises ValueError for a bad cursor."""
+        client = self.jira
+        if client.deploymentType == "Cloud":
+            data = client.enhanced_search_issues(jql, nextPageToken=cursor or None, maxResults=limit,
+                                                 fields=list(jira_fields), json_result=True)
+            issues = data.get("issues", [])
+            return issues, None if data.get("isLast") else data.get("nextPageToken")
+        if cursor and not cursor.isdigit():
+            raise ValueError(f"Invalid cursor: {cursor!r}")
+        start = int(cursor or 0)
+        data = client.search_issues(jql, startAt=start, maxResults=limit, fields=list(jira_fields), json_result=True)
+        issues = data.get("issues", [])
+        end = start + len(issues)
+        return issues, str(end) if issues and end < data.get("total", 0) else None
+
+    def _mirror_row(self, ticket_key: str) -> Optional[dict]:
+        """A ticket re-read from Jira in the mirror's row format, or None if it no longer exists."""
+        mapping = self._list_fields(list(MIRROR_COLUMNS))
+        try:
+            issue = self.jira.issue(ticket_key, fields=",".join(mapping.values()))
+        except JIRAError as e:
+            if e.status_code == 404:
+                return None
+            raise
+        return self._ticket_row(issue.raw, mapping)
+
+    def _mirror_page(self, fields: Optional[List[str]], limit: int, cursor: Optional[str],
+                     status: Optional[str], label: Optional[str], issue_type: Optional[str]) -> Dict[str, Any]:
+        jira_mirror.refresh_stale(self.project_key, self._mirror_row)
+        names = [name for name in (fields or DEFAULT_LIST_FIELDS) if name in LIST_FIELDS or name == "story_points"]
+        return jira_mirror.query(self.project_key, names, self.base_url, limit=limit, cursor=cursor,
+                                 status=self._csv(status), label=self._csv(label), issue_type=self._csv(issue_type))
+
+    def list_tickets(self, max_results: int = 50, cursor: Optional[str] = None,
+                     status: Optional[str] = None, label: Optional[str] = None,
+                     issue_type: Optional[str] = None, fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Lists the most recent tickets in the project. Use this to get an overview of what's already in the system.
+        Returns {"items": [...], "next_cursor": str | None}; pass next_cursor back to get the next page.
 
         Args:
-            max_results (int, optional): The number of tickets to return. Defaults to 50.
+            max_results (int, optional): The number of tickets to return (max 100). Defaults to 50.
+            cursor (str, optional): next_cursor from a previous call.
+            status (str, optional): Only tickets in these statuses, comma-separated (e.g., 'To Do,In Progress').
+            label (str, optional): Only tickets with one of these labels, comma-separated.
+            issue_type (str, optional): Only tickets of these types, comma-separated (e.g., 'Bug').
+            fields (List[str], optional): Fields to return besides key and url. Defaults to summary, status,
+                issue_type, assignee, labels and parent_key; 'description', 'story_points', 'created' and
+                'updated' are also available.
         """
-        jql = f"project = {self.project_key} ORDER BY created DESC"
+        limit = max(1, min(max_results, LIST_PAGE_MAX))
+        mirrored = jira_mirror.is_ready(self.project_key)
+        if cursor and cursor.startswith(CURSOR_PREFIX):
+            jira_mirror.parse_cursor(cursor)
+            if not mirrored:
+                raise ValueError("Cursor has expired; list again without a cursor")
+        if mirrored and (not cursor or cursor.startswith(CURSOR_PREFIX)):
+            return self._mirror_page(fields, limit, cursor, status, label, issue_type)
+
+        jql = self._list_jql(status, label, issue_type)
+        mapping = self._list_fields(fields)
         
         logger.info(f"Executing JQL: {jql}")
-        issues = self.jira.search_issues(jql, maxResults=max_results)
-        
-        ticket_list = []
-        for issue in issues:
-            ticket = JiraTicket(
-                key=issue.key,
-                summary=issue.fields.summary,
-                status=str(issue.fields.status),
-                description=getattr(issue.fields, 'description', None),
-                assignee=str(issue.fields.assignee) if issue.fields.assignee else "Unassigned",
-                labels=getattr(issue.fields, 'labels', []),
-                issue_type=issue.fields.issuetype.name,
-                url=f"{self.base_url}/browse/{issue.key}",
-                parent_key=getattr(issue.fields, 'parent', None).key if hasattr(issue.fields, 'parent') else None
-            )
-            ticket_list.append(ticket.to_dict())
-            
-        return ticket_list
\ No newline at end of file
+        issues, next_cursor = self._search_page(jql, list(mapping.values()), cursor, limit)
+        return {"items": [self._ticket_row(raw, mapping) for raw in issues], "next_cursor": next_cursor}
+
+    def iter_tickets(self, status: Optional[str] = None, label: Optional[str] = None,
+                     issue_type: Optional[str] = None, fields: Optional[List[str]] = None,
+                     limit: Optional[int] = None) -> Iterator[dict]:
+        """Yields matching tickets page by page, so callers can stream them."""
+        if jira_mirror.is_ready(self.project_key):
+            cursor, sent = None, 0
+            while True:
+                page = self._mirror_page(fields, LIST_PAGE_MAX, cursor, status, label, issue_type)
+                for row in page["items"]:
+                    if limit is not None and sent >= limit:
+                        return
+                    yield row
+                    sent += 1
+                cursor = page["next_cursor"]
+                if not cursor:
+                    return
+
+        jql = self._list_jql(status, label, issue_type)
+        mapping = self._list_fields(fields)
+        cursor, sent = None, 0
+        while True:
+            issues, cursor = self._search_page(jql, list(mapping.values()), cursor, LIST_PAGE_MAX)
+            for raw in issues:
+                if limit is not None and sent >= limit:
+                    return
+                yield self._ticket_row(raw, mapping)
+                sent += 1
+            if not cursor:
+                return
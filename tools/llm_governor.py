@@ -0,0 +1,212 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+
+from config.settings import settings
+from logging_config.logger import logger
+
+LANES = ("interactive", "background")
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """
+    Per-minute token bucket. Capacity refills continuously at capacity/60 per second.
+    """
+
+    def __init__(self, per_minute: int, clock: Callable[[], float] = time.monotonic):
+        self.capacity = float(max(per_minute, 1))
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.clock = clock
+        self.last = clock()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+
+    def time_until(self, amount: float) -> float:
+        """Seconds until `amount` can be consumed (requests above capacity wait for a full bucket)."""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float):
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+    def adjust(self, delta: float):
+        """Charges (positive) or refunds (negative) tokens after the real usage is known."""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - delta)
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    status = getattr(error, "status_code", None)
+    if status is None and getattr(error, "response", None) is not None:
+        status = getattr(error.response, "status_code", None)
+    return status
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Reads Retry-After (seconds or HTTP date) or retry-after-ms from an API error response."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000.0
+        value = headers.get("retry-after") or headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_retryable(error: Exception) -> bool:
+    if _status_code(error) in RETRYABLE_STATUS:
+        return True
+    # openai.APIConnectionError / APITimeoutError carry no status code
+    return any(cls.__name__ == "APIConnectionError" for cls in type(error).__mro__)
+
+
+def _usage_tokens(result: Any) -> Optional[int]:
+    usage = getattr(result, "usage", None)
+    return getattr(usage, "total_tokens", None) if usage is not None else None
+
+
+class LLMRateGovernor:
+    """
+    Process-wide governor for model calls. Every call waits for a request slot and
+    its estimated tokens in the RPM/TPM buckets. Interactive calls (Specs chat) are
+    served before background runs (Dev/QA). 429s pause all lanes for Retry-After.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int, max_retries: int = 3,
+                 clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.max_retries = max_retries
+        self.requests = TokenBucket(requests_per_minute, clock)
+        self.tokens = TokenBucket(tokens_per_minute, clock)
+        self._cond = threading.Condition()
+        self._local = threading.local()
+        self._blocked_until = 0.0
+        self._waiting: Dict[str, int] = {lane: 0 for lane in LANES}
+        self._stats: Dict[str, Dict[str, float]] = {
+            lane: {"calls": 0, "retries": 0, "rate_limited": 0, "total_wait": 0.0, "max_wait": 0.0}
+            for lane in LANES
+        }
+
+    def acquire(self, lane: str = "background", tokens: int = 0) -> float:
+        """Blocks until the call may proceed. Returns the seconds spent queued."""
+        lane = lane if lane in LANES else "background"
+        start = self.clock()
+        with self._cond:
+            self._waiting[lane] += 1
+            try:
+                while True:
+                    if lane == "background" and self._waiting["interactive"] > 0:
+                        # Yield to queued interactive calls
+                        self._cond.wait(timeout=0.05)
+                        continue
+                    delay = max(
+                        self._blocked_until - self.clock(),
+                        self.requests.time_until(1),
+                        self.tokens.time_until(tokens),
+                    )
+                    if delay <= 0:
+                        self.requests.consume(1)
+                        self.tokens.consume(tokens)
+                        break
+                    self._cond.wait(timeout=delay)
+            finally:
+                self._waiting[lane] -= 1
+                self._cond.notify_all()
+
+            waited = self.clock() - start
+            stats = self._stats[lane]
+            stats["calls"] += 1
+            stats["total_wait"] += waited
+            stats["max_wait"] = max(stats["max_wait"], waited)
+        return waited
+
+    def backoff(self, seconds: float):
+        """Pauses every lane for `seconds` (e.g. after a 429 with Retry-After)."""
+        with self._cond:
+            self._blocked_until = max(self._blocked_until, self.clock() + seconds)
+            self._cond.notify_all()
+
+    def reconcile(self, estimated: int, actual: Optional[int]):
+        """Corrects the TPM bucket once the real token usage of a call is known."""
+        if actual is None:
+            return
+        with self._cond:
+            self.tokens.adjust(actual - estimated)
+
+    def call(self, fn: Callable, *args, lane: str = "background", tokens: int = 0, **kwargs):
+        """
+        Runs `fn` under the governor, retrying 429/5xx/connection errors with
+        Retry-After-aware exponential backoff.
+        """
+        lane = lane if lane in LANES else "background"
+        self._local.retries = 0
+        for attempt in range(self.max_retries + 1):
+            self.acquire(lane, tokens)
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                if attempt >= self.max_retries or not _is_retryable(e):
+                    raise
+                status = _status_code(e)
+                delay = _retry_after(e)
+                if delay is None:
+                    delay = min(2 ** attempt, 60)
+                with self._cond:
+                    self._stats[lane]["retries"] += 1
+                    if status == 429:
+                        self._stats[lane]["rate_limited"] += 1
+                self._local.retries += 1
+                logger.warning(f"Model call failed ({status or type(e).__name__}). Retrying in {delay:.1f}s "
+                               f"(Attempt {attempt + 1}/{self.max_retries})")
+                # Tokens were not spent; give them back before waiting
+                self.reconcile(tokens, 0)
+                self.backoff(delay)
+                continue
+            self.reconcile(tokens, _usage_tokens(result))
+            return result
+
+    def last_call_retries(self) -> int:
+        """Retries spent by the most recent call() on the current thread."""
+        return getattr(self._local, "retries", 0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            lanes = {}
+            for lane, stats in self._stats.items():
+                calls = stats["calls"]
+                lanes[lane] = {
+                    **stats,
+                    "queued": self._waiting[lane],
+                    "avg_wait": (stats["total_wait"] / calls) if calls else 0.0,
+                }
+            return {
+                "requests_available": round(self.requests.tokens, 2),
+                "tokens_available": round(self.tokens.tokens, 2),
+                "blocked_for": max(self._blocked_until - self.clock(), 0.0),
+                "lanes": lanes,
+            }
+
+
+# Global governor instance
+llm_governor = LLMRateGovernor(
+    requests_per_minute=settings.LLM_REQUESTS_PER_MINUTE,
+    tokens_per_minute=settings.LLM_TOKENS_PER_MINUTE,
+    max_retries=settings.AZURE_OPENAI_MAX_RETRIES,
+)
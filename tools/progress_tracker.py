@@ -1,5 +1,5 @@
 from typing import List, Dict, Any, Optional
-from models.agent_state import AgentStep, AgentTaskProgress
+from models.agent_state import AgentStep, AgentTaskProgress, AgentTiming
 import time
 import asyncio
 from tools.websocket_manager import manager
@@ -138,6 +138,46 @@ class ProgressTracker:
             self.add_log(task_id, "✅ Task finalized. All steps marked complete.")
             # _broadcast is called by add_log
 
+    def record_timing(self, task_id: str, timing: AgentTiming):
+        """Attach an instrumented model/tool call to the task (not broadcast)."""
+        if task_id not in self.tasks:
+            self.tasks[task_id] = AgentTaskProgress(task_id=task_id)
+        if timing.error:
+            timing.error = self._redact(timing.error)
+        self.tasks[task_id].timings.append(timing)
+
+    def get_timings(self, task_id: str) -> Dict[str, Any]:
+        """Returns a per-task timing breakdown: model vs tool time, per-tool totals and the raw calls."""
+        timings = self.tasks[task_id].timings if task_id in self.tasks else []
+        breakdown = {
+            "model": {"calls": 0, "duration": 0.0, "prompt_tokens": 0, "completion_tokens": 0, "retries": 0},
+            "tools": {},
+        }
+        for t in timings:
+            if t.kind == "model":
+                model = breakdown["model"]
+                model["calls"] += 1
+                model["duration"] += t.duration
+                model["prompt_tokens"] += t.prompt_tokens or 0
+                model["completion_tokens"] += t.completion_tokens or 0
+                model["retries"] += t.retries
+            else:
+                tool = breakdown["tools"].setdefault(t.name, {"calls": 0, "duration": 0.0, "errors": 0, "result_size": 0})
+                tool["calls"] += 1
+                tool["duration"] += t.duration
+                tool["errors"] += int(bool(t.error))
+                tool["result_size"] += t.result_size or 0
+
+        wall_time = (max(t.started_at + t.duration for t in timings) - min(t.started_at for t in timings)) if timings else 0.0
+        return {
+            "task_id": task_id,
+            "wall_time": wall_time,
+            "model_time": breakdown["model"]["duration"],
+            "tool_time": sum(t["duration"] for t in breakdown["tools"].values()),
+            **breakdown,
+            "calls": [t.to_dict() for t in timings]
+        }
+
     def get_progress(self, task_id: str):
         if task_id not in self.tasks:
             return {"steps": [], "logs": [], "final_response": None}
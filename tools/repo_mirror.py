@@ -0,0 +1,332 @@
+import base64
+import os
+import re
+import subprocess
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from config.settings import settings
+from logging_config.logger import logger
+from tools.github_client import github_client
+
+REPO_NAME = re.compile(r"^[A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+$")
+
+
+def check_repo_name(repo_name: str) -> str:
+    """Returns `repo_name` if it is a plain 'owner/name', else raises ValueError."""
+    if not REPO_NAME.match(repo_name or "") or any(part in (".", "..") for part in repo_name.split("/")):
+        raise ValueError(f"Invalid repository name: {repo_name!r} (expected 'owner/name')")
+    return repo_name
+
+
+def check_ref(ref: str) -> str:
+    """Refs come from the model; one starting with '-' would be parsed by git as an option."""
+    if not ref or ref.startswith("-"):
+        raise ValueError(f"Invalid ref: {ref!r}")
+    return ref
+
+
+class RepoMirror:
+    """
+    Manages one local bare mirror (`git clone --mirror`) per connected GitHub repository.
+    Trees, file contents and diffs are served from local disk, and workspace
+    checkouts are cloned from the mirror instead of from GitHub.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = os.path.abspath(root or settings.REPO_MIRROR_DIR)
+        self.access_token = settings.GITHUB_ACCESS_TOKEN
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _lock(self, repo_name: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(repo_name, threading.Lock())
+
+    def path_for(self, repo_name: str) -> str:
+        return os.path.join(self.root, repo_name.replace("/", "__") + ".git")
+
+    def has(self, repo_name: Optional[str]) -> bool:
+        return bool(repo_name) and os.path.isdir(self.path_for(repo_name))
+
+    def _auth_args(self) -> List[str]:
+        """Per-command auth header, so the token is never written into the mirror's config."""
+        if not self.access_token:
+            return []
+        basic = base64.b64encode(f"x-access-token:{self.access_token}".encode()).decode()
+        return ["-c", f"http.https://github.com/.extraheader=AUTHORIZATION: basic {basic}"]
+
+    def _git(self, *args: str, cwd: Optional[str] = None, auth: bool = False, timeout: int = 900) -> str:
+        cmd = ["git", "-c", "core.quotepath=off"] + (self._auth_args() if auth else []) + list(args)
+        result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True, timeout=timeout)
+        if result.returncode != 0:
+            error = result.stderr.strip()
+            if self.access_token:
+                error = error.replace(self.access_token, "[REDACTED]")
+            command = next(a for i, a in enumerate(args) if a != "-c" and (i == 0 or args[i - 1] != "-c"))
+            raise RuntimeError(f"git {command} failed: {error}")
+        return result.stdout
+
+    def ensure(self, repo_name: str) -> Dict[str, Any]:
+        """
+        Creates the mirror on first use, otherwise refreshes it with `git fetch`.
+        """
+        start = time.perf_counter()
+        path = self.path_for(repo_name)
+        try:
+            check_repo_name(repo_name)
+            with self._lock(repo_name):
+                if os.path.isdir(path):
+                    self._git("fetch", "--prune", "origin", cwd=path, auth=True)
+                    action = "refreshed"
+                else:
+                    os.makedirs(self.root, exist_ok=True)
+                    self._git("clone", "--mirror", f"https://github.com/{repo_name}.git", path, auth=True)
+                    action = "created"
+                # Lets workspace checkouts make partial (blobless) clones from the mirror
+                self._git("config", "uploadpack.allowFilter", "true", cwd=path)
+                self._git("config", "uploadpack.allowAnySHA1InWant", "true", cwd=path)
+            duration = time.perf_counter() - start
+            logger.info(f"Repository mirror {action} for {repo_name} in {duration:.1f}s")
+            return {"success": True, "repo_name": repo_name, "path": path, "action": action, "duration": duration}
+        except Exception as e:
+            logger.error(f"Failed to mirror repo {repo_name}: {e}")
+            return {"success": False, "error": str(e)}
+
+    def refresh(self, repo_name: str) -> Dict[str, Any]:
+        return self.ensure(repo_name)
+
+    def resolve(self, repo_name: str, ref: str = "HEAD") -> str:
+        """Returns the commit SHA for a branch, tag or SHA in the mirror."""
+        ref = check_ref(ref)
+        return self._git("rev-parse", "--verify", f"{ref}^{{commit}}", cwd=self.path_for(repo_name)).strip()
+
+    def list_files(self, repo_name: str, ref: str = "HEAD", path: str = "") -> List[str]:
+        args = ["ls-tree", "-r", "--name-only", check_ref(ref)]
+        if path:
+            args += ["--", path.strip("/")]
+        return self._git(*args, cwd=self.path_for(repo_name)).splitlines()
+
+    def read_file(self, repo_name: str, path: str, ref: str = "HEAD") -> str:
+        return self._git("show", f"{check_ref(ref)}:{path.lstrip('/')}", cwd=self.path_for(repo_name))
+
+    def read_blobs(self, repo_name: str, paths: List[str], ref: str = "HEAD",
+                   max_bytes: Optional[int] = None) -> Dict[str, str]:
+        """
+        Reads many files at `ref` through a single `git cat-file --batch` process.
+        Missing paths and files larger than `max_bytes` are skipped.
+        """
+        if not paths:
+            return {}
+        check_ref(ref)
+        request = "".join(f"{ref}:{p}\n" for p in paths).encode("utf-8")
+        proc = subprocess.run(["git", "cat-file", "--batch"], cwd=self.path_for(repo_name),
+                              input=request, capture_output=True, timeout=900)
+        if proc.returncode != 0:
+            raise RuntimeError(f"git cat-file failed: {proc.stderr.decode(errors='replace').strip()}")
+
+        out, pos, blobs = proc.stdout, 0, {}
+        for path in paths:
+            header_end = out.index(b"\n", pos)
+            header = out[pos:header_end].split(b" ")
+            pos = header_end + 1
+            if header[-1] in (b"missing", b"ambiguous"):
+                continue  # "<ref>:<path> missing" has no content
+            _, kind, size = header
+            size = int(size)
+            content = out[pos:pos + size]
+            pos += size + 1  # content is followed by a newline
+            if kind != b"blob":
+                continue  # a directory (tree) or submodule
+            if max_bytes is None or size <= max_bytes:
+                blobs[path] = content.decode("utf-8", errors="replace")
+        return blobs
+
+    def changed_files(self, repo_name: str, base: str, head: str, merge_base: bool = False) -> Dict[str, str]:
+        """Returns {path: status} (A/M/D) between two commits, with renames split into D + A.
+
+        With merge_base=True only the changes made on head since it diverged from base are listed.
+        """
+        changes = {}
+        refs = [f"{check_ref(base)}...{check_ref(head)}"] if merge_base else [check_ref(base), check_ref(head)]
+        output = self._git("diff", "--name-status", "--no-renames", *refs, cwd=self.path_for(repo_name))
+        for line in output.splitlines():
+            status, _, path = line.partition("\t")
+            changes[path] = status[:1]
+        return changes
+
+    def diff(self, repo_name: str, base: str, head: str, path: Optional[str] = None) -> str:
+        args = ["diff", f"{check_ref(base)}...{check_ref(head)}"]
+        if path:
+            args += ["--", path]
+        return self._git(*args, cwd=self.path_for(repo_name))
+
+    def ensure_fresh(self, repo_name: str, ref: str = "HEAD") -> Optional[str]:
+        """
+        Creates the mirror on first use; afterwards fetches only when GitHub's commit for `ref`
+        differs from the mirror's (e.g. after a push). Returns an error message, or None.
+        """
+        if self.has(repo_name):
+            if not self.access_token:
+                return None  # anonymous API calls are too scarce to spend on this
+            try:
+                # Same short-TTL lookup as GitHubTools._head_sha; revalidation 304s are free
+                remote, _ = github_client.get(f"/repos/{repo_name}/commits/{check_ref(ref)}", ttl=5,
+                                              lane="background")
+            except Exception as e:
+                logger.debug(f"Could not check {repo_name}@{ref} on GitHub, using the mirror as is: {e}")
+                return None
+            try:
+                if self.resolve(repo_name, ref) == remote["sha"]:
+                    return None
+            except RuntimeError:
+                pass  # not in the mirror yet
+        result = self.ensure(repo_name)
+        return None if result.get("success") else result.get("error")
+
+    # --- Agent tools ---
+
+    def list_repo_files(self, repo_name: str, path: str = "", ref: str = "HEAD") -> List[str]:
+        """
+        Lists all file paths in a repository from the local mirror (fast, no API calls).
+
+        Args:
+            repo_name (str): Full repository name (e.g., 'owner/repo').
+            path (str, optional): Directory prefix to list. Defaults to the repository root.
+            ref (str, optional): Branch, tag or commit SHA. Defaults to the default branch.
+        """
+        error = self.ensure_fresh(repo_name, ref)
+        if error:
+            return [f"Error: {error}"]
+        try:
+            return self.list_files(repo_name, ref, path)
+        except Exception as e:
+            return [f"Error: {e}"]
+
+    def read_repo_file(self, repo_name: str, path: str, ref: str = "HEAD") -> str:
+        """
+        Reads a file's content from the local repository mirror (fast, no API calls).
+
+        Args:
+            repo_name (str): Full repository name (e.g., 'owner/repo').
+            path (str): File path within the repository (e.g., 'src/App.jsx').
+            ref (str, optional): Branch, tag or commit SHA. Defaults to the default branch.
+        """
+        error = self.ensure_fresh(repo_name, ref)
+        if error:
+            return f"Error: {error}"
+        try:
+            return self.read_file(repo_name, path, ref)
+        except Exception as e:
+            return f"Error: {e}"
+
+    def diff_repo_refs(self, repo_name: str, base: str, head: str, path: Optional[str] = None) -> str:
+        """
+        Shows the diff between two branches/commits from the local repository mirror.
+
+        Args:
+            repo_name (str): Full repository name (e.g., 'owner/repo').
+            base (str): Base branch or commit (e.g., 'main').
+            head (str): Head branch or commit (e.g., 'feature/KAN-19').
+            path (str, optional): Limit the diff to this file or directory.
+        """
+        # Branches move, so always fetch first
+        result = self.refresh(repo_name)
+        if not result.get("success"):
+            return f"Error: {result.get('error')}"
+        try:
+            return self.diff(repo_name, base, head, path) or "No differences."
+        except Exception as e:
+            return f"Error: {e}"
+
+    @staticmethod
+    def _sparse_patterns(paths: List[str]) -> List[str]:
+        """Root-level files plus each requested file or directory (non-cone sparse patterns)."""
+        return ["/*", "!/*/"] + ["/" + p.strip("/") for p in paths if p.strip("/")]
+
+    def checkout_repo(self, repo_name: str, branch: str = "main", paths: Optional[List[str]] = None,
+                      depth: Optional[int] = None, discard_changes: bool = False) -> Dict[str, Any]:
+        """
+        Creates (or updates) a working copy of the repository in workspace/<repo_name>,
+        cloned from the local mirror instead of GitHub. Use this instead of `git clone`.
+        For large repositories, pass the directories/files the ticket touches as `paths`:
+        only those (plus root-level files) are checked out, and other file contents are
+        not downloaded. An existing checkout is fetched and reset instead of re-cloned.
+
+        Args:
+            repo_name (str): Full repository name (e.g., 'owner/repo').
+            branch (str, optional): Branch to check out. Defaults to 'main'.
+            paths (List[str], optional): Sparse checkout of these paths (e.g., ['src/components', 'package.json']).
+            depth (int, optional): Shallow clone with this many commits of history.
+            discard_changes (bool, optional): Reset an existing checkout even if it has uncommitted changes. Defaults to False.
+        """
+        try:
+            check_repo_name(repo_name)
+            check_ref(branch)
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+        start = time.perf_counter()
+        timings = {}
+        mirrored = self.ensure(repo_name)
+        timings["mirror"] = round(time.perf_counter() - start, 2)
+        if not mirrored.get("success"):
+            return mirrored
+
+        mirror = self.path_for(repo_name)
+        dest = os.path.join(os.getcwd(), "workspace", repo_name)
+        try:
+            phase = time.perf_counter()
+            if os.path.isdir(os.path.join(dest, ".git")):
+                # Point origin at the mirror for these commands only, so fetches and any
+                # lazily-fetched blobs of a partial clone come from local disk
+                via_mirror = ["-c", f"url.file://{mirror}.insteadOf=https://github.com/{repo_name}.git"]
+                fetch = via_mirror + ["fetch", "--prune"] + ([f"--depth={depth}"] if depth else [])
+                self._git(*fetch, "origin", f"+refs/heads/{branch}:refs/remotes/origin/{branch}", cwd=dest)
+                timings["fetch"] = round(time.perf_counter() - phase, 2)
+                # Untracked files (build output, node_modules) survive a reset, so they don't block it
+                dirty = self._git(*via_mirror, "status", "--porcelain", "--untracked-files=no", cwd=dest).strip()
+                if dirty and not discard_changes:
+                    return {"success": True, "path": f"workspace/{repo_name}", "branch": branch, "action": "fetched",
+                            "warning": "Uncommitted changes kept; origin/" + branch + " was fetched but not applied.",
+                            "duration": round(time.perf_counter() - start, 2), "timings": timings}
+                phase = time.perf_counter()
+                if paths:
+                    self._git(*via_mirror, "sparse-checkout", "set", "--no-cone", *self._sparse_patterns(paths), cwd=dest)
+                self._git(*via_mirror, "checkout", "-q", "-B", branch, f"origin/{branch}", cwd=dest)
+                self._git(*via_mirror, "reset", "-q", "--hard", f"origin/{branch}", cwd=dest)
+                action = "reset"
+            else:
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                if paths or depth:
+                    # file:// so --depth/--filter apply; the mirror serves the missing blobs on checkout
+                    clone = ["clone", "-q", "--no-checkout", "--branch", branch]
+                    clone += ["--filter=blob:none"] if paths else []
+                    clone += [f"--depth={depth}"] if depth else []
+                    self._git(*clone, f"file://{mirror}", dest)
+                    if paths:
+                        self._git("sparse-checkout", "set", "--no-cone", *self._sparse_patterns(paths), cwd=dest)
+                    self._git("checkout", "-q", branch, cwd=dest)
+                else:
+                    # Plain local clone hard-links the mirror's objects: no data is copied
+                    self._git("clone", "-q", "--branch", branch, mirror, dest)
+                # Pushes and pulls from the container go to GitHub, not the host mirror
+                self._git("remote", "set-url", "origin", f"https://github.com/{repo_name}.git", cwd=dest)
+                action = "cloned"
+            timings["checkout"] = round(time.perf_counter() - phase, 2)
+            # Imported here: code_search reads from this module's mirrors
+            from tools.code_search import code_search
+            code_search.invalidate_workspace()
+            duration = round(time.perf_counter() - start, 2)
+            mode = ", ".join(filter(None, ["sparse" if paths else "", f"depth={depth}" if depth else ""]))
+            mode = mode or ("full" if action == "cloned" else "unchanged")
+            logger.info(f"Checked out {repo_name}@{branch} ({action}, {mode}) in {duration}s")
+            return {"success": True, "path": f"workspace/{repo_name}", "branch": branch, "action": action,
+                    "mode": mode, "duration": duration, "timings": timings}
+        except Exception as e:
+            logger.error(f"Failed to check out {repo_name}: {e}")
+            return {"success": False, "error": str(e)}
+
+
+# Global mirror manager instance
+repo_mirror = RepoMirror()
@@ -0,0 +1,385 @@
+import ast
+import json
+import os
+import posixpath
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.settings import settings
+from logging_config.logger import logger
+from tools.repo_mirror import repo_mirror
+
+PYTHON_EXTENSIONS = (".py",)
+JS_EXTENSIONS = (".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs")
+MAX_INDEXED_BYTES = 512 * 1024
+# Bumped when parsing changes; persisted indexes of another version are rebuilt
+INDEX_VERSION = 2
+# Seconds a resolved ref is reused, so tool queries don't each run `git rev-parse`
+HEAD_TTL = 5.0
+HTTP_METHODS = {"get", "post", "put", "patch", "delete", "head", "options", "websocket", "route", "all", "use"}
+
+# --- JS/TS patterns ---
+_JS_IMPORT = re.compile(
+    r"""(?:^|[;\s])(?:import\s+(?:[\w*{}\s,$]+?\s+from\s+)?|export\s+(?:[\w*{}\s,$]+?)\s+from\s+)['"]([^'"]+)['"]"""
+    r"""|\brequire\(\s*['"]([^'"]+)['"]\s*\)|\bimport\(\s*['"]([^'"]+)['"]\s*\)""",
+    re.M,
+)
+_JS_DEFINITION = re.compile(
+    r"^\s*(?:export\s+)?(?:default\s+)?(?:declare\s+)?(?:async\s+)?"
+    r"(function\*?|class|const|let|var|interface|type|enum)\s+([A-Za-z_$][\w$]*)",
+    re.M,
+)
+_JS_EXPORT_DECL = re.compile(
+    r"^\s*export\s+(?:default\s+)?(?:declare\s+)?(?:async\s+)?"
+    r"(?:function\*?|class|const|let|var|interface|type|enum)\s+([A-Za-z_$][\w$]*)",
+    re.M,
+)
+_JS_EXPORT_LIST = re.compile(r"^\s*export\s*\{([^}]*)\}", re.M)
+_JS_EXPORT_DEFAULT = re.compile(r"^\s*export\s+default\s+([A-Za-z_$][\w$]*)\s*;?\s*$", re.M)
+_JS_ROUTE = re.compile(
+    r"""\b(app|router|server|api)\.(get|post|put|patch|delete|all|use)\(\s*['"`]([^'"`]+)['"`]"""
+    r"""|<Route\b[^>]*\bpath\s*=\s*['"{]+([^'"}]+)['"}]+""",
+    re.M,
+)
+
+_JS_KIND = {"function": "function", "function*": "function", "class": "class", "interface": "interface",
+            "type": "type", "enum": "enum", "const": "variable", "let": "variable", "var": "variable"}
+
+
+def _line_of(source: str, offset: int) -> int:
+    return source.count("\n", 0, offset) + 1
+
+
+def parse_python(path: str, source: str) -> Dict[str, Any]:
+    """Extracts definitions, imports, exports and FastAPI/Flask-style routes from Python source."""
+    result = {"definitions": [], "imports": [], "exports": [], "routes": []}
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return result
+
+    package = posixpath.dirname(path).replace("/", ".")
+    router_prefixes: Dict[str, str] = {}
+    explicit_exports = None
+
+    def route_of(decorator) -> Optional[Dict[str, Any]]:
+        if not (isinstance(decorator, ast.Call) and isinstance(decorator.func, ast.Attribute)):
+            return None
+        method = decorator.func.attr.lower()
+        if method not in HTTP_METHODS or not decorator.args:
+            return None
+        first = decorator.args[0]
+        if not (isinstance(first, ast.Constant) and isinstance(first.value, str)):
+            return None
+        owner = decorator.func.value.id if isinstance(decorator.func.value, ast.Name) else ""
+        return {"method": method.upper(), "path": router_prefixes.get(owner, "") + first.value}
+
+    # Imports anywhere in the file: under `if TYPE_CHECKING:`, in try/except fallbacks, in functions
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            result["imports"].extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                parts = package.split(".") if package else []
+                parts = parts[:len(parts) - (node.level - 1)] if node.level > 1 else parts
+                base = ".".join(p for p in parts + ([node.module] if node.module else []) if p)
+            if node.module is None:
+                # "from . import a, b" imports sibling modules
+                result["imports"].extend(f"{base}.{alias.name}" if base else alias.name for alias in node.names)
+            else:
+                result["imports"].append(base)
+
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            kind = "class" if isinstance(node, ast.ClassDef) else "function"
+            result["definitions"].append({"name": node.name, "kind": kind, "line": node.lineno})
+            for decorator in getattr(node, "decorator_list", []):
+                route = route_of(decorator)
+                if route:
+                    result["routes"].append({**route, "handler": node.name, "line": node.lineno})
+            if isinstance(node, ast.ClassDef):
+                for child in node.body:
+                    if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                        result["definitions"].append(
+                            {"name": f"{node.name}.{child.name}", "kind": "method", "line": child.lineno})
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            for target in targets:
+                if not isinstance(target, ast.Name):
+                    continue
+                result["definitions"].append({"name": target.id, "kind": "variable", "line": node.lineno})
+                value = node.value
+                if target.id == "__all__" and isinstance(value, (ast.List, ast.Tuple)):
+                    explicit_exports = [e.value for e in value.elts if isinstance(e, ast.Constant)]
+                # router = APIRouter(prefix="/agent") -> routes on `router` get the prefix
+                if isinstance(value, ast.Call):
+                    for keyword in value.keywords:
+                        if keyword.arg == "prefix" and isinstance(keyword.value, ast.Constant):
+                            router_prefixes[target.id] = str(keyword.value.value)
+
+    if explicit_exports is not None:
+        result["exports"] = explicit_exports
+    else:
+        result["exports"] = [d["name"] for d in result["definitions"]
+                             if d["kind"] != "method" and not d["name"].startswith("_")]
+    return result
+
+
+def parse_js(path: str, source: str) -> Dict[str, Any]:
+    """Extracts definitions, imports, exports and Express/React Router routes from JS/TS source."""
+    result = {"definitions": [], "imports": [], "exports": [], "routes": []}
+    for match in _JS_IMPORT.finditer(source):
+        result["imports"].append(next(g for g in match.groups() if g))
+    for match in _JS_DEFINITION.finditer(source):
+        result["definitions"].append({"name": match.group(2), "kind": _JS_KIND.get(match.group(1), "variable"),
+                                      "line": _line_of(source, match.start(2))})
+    exports = [m.group(1) for m in _JS_EXPORT_DECL.finditer(source)]
+    for match in _JS_EXPORT_LIST.finditer(source):
+        for item in match.group(1).split(","):
+            name = item.strip().split(" as ")[-1].strip()
+            if name:
+                exports.append(name)
+    exports += [m.group(1) for m in _JS_EXPORT_DEFAULT.finditer(source)]
+    result["exports"] = list(dict.fromkeys(exports))
+    for match in _JS_ROUTE.finditer(source):
+        if match.group(3):
+            result["routes"].append({"method": match.group(2).upper(), "path": match.group(3),
+                                     "line": _line_of(source, match.start())})
+        else:
+            result["routes"].append({"method": "PAGE", "path": match.group(4), "line": _line_of(source, match.start())})
+    return result
+
+
+def parse_file(path: str, source: str) -> Optional[Dict[str, Any]]:
+    if path.endswith(PYTHON_EXTENSIONS):
+        return parse_python(path, source)
+    if path.endswith(JS_EXTENSIONS):
+        return parse_js(path, source)
+    return None
+
+
+def is_indexable(path: str) -> bool:
+    return path.endswith(PYTHON_EXTENSIONS + JS_EXTENSIONS) and "node_modules/" not in path
+
+
+class SymbolIndex:
+    """
+    Per-repository symbol table (definitions, imports, exports, routes) for Python and
+    JS/TS, built from the local mirror and updated incrementally from git diffs.
+    Persisted as JSON under REPO_INDEX_DIR.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = os.path.abspath(root or settings.REPO_INDEX_DIR)
+        # repo -> {"version": n, "commit": sha, "files": {path: parsed}, "resolved": {path: [paths]}}
+        self._indexes: Dict[str, Dict[str, Any]] = {}
+        # (repo, ref) -> (sha, resolved at)
+        self._heads: Dict[Tuple[str, str], Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def _path_for(self, repo_name: str) -> str:
+        return os.path.join(self.root, repo_name.replace("/", "__") + ".symbols.json")
+
+    def _load(self, repo_name: str) -> Optional[Dict[str, Any]]:
+        if repo_name in self._indexes:
+            return self._indexes[repo_name]
+        path = self._path_for(repo_name)
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                index = json.load(f)
+            if index.get("version") == INDEX_VERSION:
+                self._indexes[repo_name] = index
+                return index
+        return None
+
+    def _save(self, repo_name: str, index: Dict[str, Any]):
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = self._path_for(repo_name) + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, self._path_for(repo_name))
+
+    # --- Import resolution ---
+
+    @staticmethod
+    def _source_roots(files: Dict[str, Any]) -> List[str]:
+        """
+        Directories Python imports are resolved from: the repository root, plus the parent of
+        each top-level package (a directory with __init__.py), e.g. src/ for src/pkg/__init__.py.
+        """
+        packages = {posixpath.dirname(p) for p in files if posixpath.basename(p) == "__init__.py"}
+        return sorted({""} | {posixpath.dirname(p) for p in packages if posixpath.dirname(p) not in packages})
+
+    @staticmethod
+    def _resolve_python(module: str, files: Dict[str, Any], roots: List[str]) -> Optional[str]:
+        """Stdlib and third-party modules are not under a source root and stay unresolved."""
+        relative = module.replace(".", "/")
+        for root in roots:
+            prefix = f"{root}/" if root else ""
+            for candidate in (f"{prefix}{relative}.py", f"{prefix}{relative}/__init__.py"):
+                if candidate in files:
+                    return candidate
+        return None
+
+    @staticmethod
+    def _resolve_js(importer: str, spec: str, files: Dict[str, Any]) -> Optional[str]:
+        if not spec.startswith("."):
+            return None  # package import
+        base = posixpath.normpath(posixpath.join(posixpath.dirname(importer), spec))
+        if base in files:
+            return base
+        for ext in JS_EXTENSIONS:
+            if base + ext in files:
+                return base + ext
+        for ext in JS_EXTENSIONS:
+            if f"{base}/index{ext}" in files:
+                return f"{base}/index{ext}"
+        return None
+
+    def resolve_imports(self, files: Dict[str, Any]) -> Dict[str, List[str]]:
+        """Maps each file to the repository files it imports."""
+        roots = self._source_roots(files)
+        resolved = {}
+        for path, parsed in files.items():
+            targets = []
+            for spec in parsed["imports"]:
+                if path.endswith(PYTHON_EXTENSIONS):
+                    target = self._resolve_python(spec, files, roots)
+                else:
+                    target = self._resolve_js(path, spec, files)
+                if target and target != path:
+                    targets.append(target)
+            resolved[path] = sorted(set(targets))
+        return resolved
+
+    # --- Build / update ---
+
+    def index_sources(self, sources: Dict[str, str], commit: str = "",
+                      base: Optional[Dict[str, Any]] = None, deleted: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Parses `sources` into a (new or copied) index and re-resolves imports."""
+        files = dict(base["files"]) if base else {}
+        for path in deleted or []:
+            files.pop(path, None)
+        for path, source in sources.items():
+            parsed = parse_file(path, source)
+            if parsed is not None:
+                files[path] = parsed
+        return {"version": INDEX_VERSION, "commit": commit, "files": files, "resolved": self.resolve_imports(files)}
+
+    def _resolve_head(self, repo_name: str, ref: str) -> str:
+        """Commit SHA of `ref` in the mirror, reused for HEAD_TTL seconds. Caller holds the lock."""
+        cached = self._heads.get((repo_name, ref))
+        if cached and time.monotonic() - cached[1] < HEAD_TTL:
+            return cached[0]
+        head = repo_mirror.resolve(repo_name, ref)
+        self._heads[(repo_name, ref)] = (head, time.monotonic())
+        return head
+
+    def update(self, repo_name: str, ref: str = "HEAD") -> Dict[str, Any]:
+        """
+        Builds the index on first use; afterwards re-parses only files changed since
+        the indexed commit.
+        """
+        start = time.perf_counter()
+        with self._lock:
+            head = self._resolve_head(repo_name, ref)
+            index = self._load(repo_name)
+            if index and index.get("commit") == head:
+                return index
+
+            if index and index.get("commit"):
+                changes = repo_mirror.changed_files(repo_name, index["commit"], head)
+                deleted = [p for p, status in changes.items() if status == "D"]
+                changed = [p for p, status in changes.items() if status != "D" and is_indexable(p)]
+                mode = f"incremental ({len(changed)} changed, {len(deleted)} deleted)"
+            else:
+                deleted = []
+                changed = [p for p in repo_mirror.list_files(repo_name, head) if is_indexable(p)]
+                index = None
+                mode = f"full ({len(changed)} files)"
+
+            sources = repo_mirror.read_blobs(repo_name, changed, head, max_bytes=MAX_INDEXED_BYTES)
+            index = self.index_sources(sources, head, base=index, deleted=deleted)
+            self._indexes[repo_name] = index
+            self._save(repo_name, index)
+            logger.info(f"Symbol index for {repo_name}@{head[:7]} updated: {mode} in {time.perf_counter() - start:.2f}s")
+            return index
+
+    def _ensure(self, repo_name: str) -> Dict[str, Any]:
+        error = repo_mirror.ensure_fresh(repo_name)
+        if error:
+            raise RuntimeError(error)
+        return self.update(repo_name)
+
+    # --- Agent tools ---
+
+    def find_symbol(self, repo_name: str, name: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Finds where a function, class, method, variable, type or component is defined.
+        Matches exact names first, then names containing the query (case-insensitive).
+
+        Args:
+            repo_name (str): Full repository name (e.g., 'owner/repo').
+            name (str): Symbol name to look for (e.g., 'JiraTools' or 'JiraTools.get_ticket').
+            limit (int, optional): Maximum number of results. Defaults to 20.
+        """
+        try:
+            index = self._ensure(repo_name)
+        except Exception as e:
+            return [{"error": str(e)}]
+        query = name.lower()
+        exact, partial = [], []
+        for path, parsed in index["files"].items():
+            exported = set(parsed["exports"])
+            for definition in parsed["definitions"]:
+                symbol = definition["name"].lower()
+                if symbol == query or symbol.endswith("." + query):
+                    bucket = exact
+                elif query in symbol:
+                    bucket = partial
+                else:
+                    continue
+                bucket.append({"path": path, **definition, "exported": definition["name"] in exported})
+        return (exact + partial)[:limit]
+
+    def who_imports(self, repo_name: str, path: str) -> List[str]:
+        """
+        Lists the repository files that directly import the given file.
+
+        Args:
+            repo_name (str): Full repository name (e.g., 'owner/repo').
+            path (str): File path within the repository (e.g., 'tools/jira_tools.py').
+        """
+        try:
+            index = self._ensure(repo_name)
+        except Exception as e:
+            return [f"Error: {e}"]
+        target = path.strip("/")
+        return sorted(importer for importer, targets in index["resolved"].items() if target in targets)
+
+    def files_for_route(self, repo_name: str, route: str) -> List[Dict[str, Any]]:
+        """
+        Finds the files and handlers that serve an HTTP route or frontend page path.
+
+        Args:
+            repo_name (str): Full repository name (e.g., 'owner/repo').
+            route (str): Route path or fragment (e.g., '/jira/tickets' or 'tickets').
+        """
+        try:
+            index = self._ensure(repo_name)
+        except Exception as e:
+            return [{"error": str(e)}]
+        query = route.lower().rstrip("/")
+        matches = []
+        for path, parsed in index["files"].items():
+            for r in parsed["routes"]:
+                if query in r["path"].lower():
+                    matches.append({"file": path, **r})
+        return sorted(matches, key=lambda m: (m["path"] != route, m["path"]))
+
+
+# Global symbol index instance
+symbol_index = SymbolIndex()
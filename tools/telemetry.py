@@ -0,0 +1,64 @@
+import copy
+import functools
+import time
+from typing import Any, Callable, List, Optional
+
+from camel.toolkits import FunctionTool
+from models.agent_state import AgentTiming
+from tools.progress_tracker import progress_tracker
+
+
+def record_model_call(task_id: str, name: str, started_at: float, duration: float,
+                      result: Any = None, retries: int = 0, error: Optional[str] = None):
+    """Attach one model call (latency, tokens, retries) to the task in the ProgressTracker."""
+    usage = getattr(result, "usage", None)
+    progress_tracker.record_timing(task_id, AgentTiming(
+        kind="model",
+        name=name,
+        started_at=started_at,
+        duration=duration,
+        prompt_tokens=getattr(usage, "prompt_tokens", None),
+        completion_tokens=getattr(usage, "completion_tokens", None),
+        retries=retries,
+        error=error
+    ))
+
+
+def _timed(func: Callable, task_id: str) -> Callable:
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        started_at = time.time()
+        start = time.perf_counter()
+        result, error = None, None
+        try:
+            result = func(*args, **kwargs)
+            return result
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            progress_tracker.record_timing(task_id, AgentTiming(
+                kind="tool",
+                name=func.__name__,
+                started_at=started_at,
+                duration=time.perf_counter() - start,
+                result_size=len(str(result)) if result is not None else 0,
+                error=error
+            ))
+
+    return wrapper
+
+
+def instrument_tools(tools: List[FunctionTool], task_id: str) -> List[FunctionTool]:
+    """
+    Returns copies of the tools whose calls record their name, duration, result size
+    and error against `task_id`, independent of the model calling report_task_progress.
+    The originals are left untouched, so a tool shared by several agents is timed
+    under each agent's own task.
+    """
+    instrumented = []
+    for tool in tools:
+        timed = copy.copy(tool)
+        timed.func = _timed(tool.func, task_id)
+        instrumented.append(timed)
+    return instrumented
@@ -0,0 +1,69 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from config.settings import settings
+from logging_config.logger import logger
+
+
+class TicketCache:
+    """
+    Read-through cache of Jira issues shared by every JiraTools instance. Entries are
+    fetched with a field projection; a request is a hit while the entry is fresh and
+    holds all requested fields. JiraTools' write methods invalidate the tickets they touch.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 500):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # key -> (issue, fields fetched, fetched_at)
+        self._entries: "OrderedDict[str, Tuple[Any, FrozenSet[str], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+    def get(self, key: str, fields: Iterable[str], loader: Callable[[str, str], Any]) -> Any:
+        """Returns the cached issue, or calls loader(key, "f1,f2") and caches the result."""
+        key = key.upper()
+        wanted = frozenset(fields)
+        with self._lock:
+            entry = self._entries.get(key)
+            fresh = entry is not None and time.monotonic() - entry[2] < self.ttl
+            if fresh and wanted <= entry[1]:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry[0]
+            self._stats["misses"] += 1
+            # Widen the projection so the entry keeps serving earlier callers' fields
+            if fresh:
+                wanted |= entry[1]
+
+        issue = loader(key, ",".join(sorted(wanted)))
+        with self._lock:
+            self._entries[key] = (issue, wanted, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return issue
+
+    def invalidate(self, key: Optional[str] = None):
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key.upper(), None)
+            self._stats["invalidations"] += 1
+        logger.debug(f"Ticket cache invalidated: {key or '*'}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+            }
+
+
+# Shared across agents and routes
+ticket_cache = TicketCache(ttl=settings.JIRA_TICKET_CACHE_TTL)
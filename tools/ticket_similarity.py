@@ -0,0 +1,183 @@
+import math
+import re
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from logging_config.logger import logger
+from tools.jira_mirror import jira_mirror
+
+# Proposals list existing tickets scoring at least this (cosine similarity, 0-1)
+SIMILAR_MIN_SCORE = 0.35
+SUMMARY_WEIGHT = 2
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "for", "from", "has", "have", "in", "into",
+    "is", "it", "its", "of", "on", "or", "should", "so", "that", "the", "this", "to", "when", "will",
+    "with", "we", "user", "users", "able", "want", "need", "new", "add", "given", "then",
+}
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def terms(text: str) -> List[str]:
+    """Lower-cased word tokens without stopwords, with plurals folded ('tickets' -> 'ticket')."""
+    result = []
+    for token in TOKEN_RE.findall((text or "").lower()):
+        if len(token) < 2 or token in STOPWORDS:
+            continue
+        if len(token) > 4 and token.endswith("ies"):
+            token = token[:-3] + "y"
+        elif len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        result.append(token)
+    return result
+
+
+class TicketSimilarityIndex:
+    """
+    In-memory TF-IDF index over ticket summaries and descriptions. Queries only score
+    tickets sharing at least one term with the text, via an inverted index. It is
+    loaded in a background thread from JiraTools' ticket listing (the local mirror
+    when available) and kept current by the mirror's change feed and JiraTools'
+    own writes.
+    """
+
+    def __init__(self, refresh_interval: float = 300.0):
+        self.refresh_interval = refresh_interval
+        self._docs: Dict[str, Dict[str, Any]] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._loaded_at: Optional[float] = None
+        # Document vector norms; they depend on every idf, so any write clears them
+        self._norms: Dict[str, float] = {}
+        self._lock = threading.RLock()
+        self._loader: Optional[threading.Thread] = None
+        self._retry_at = 0.0
+
+    def _remove(self, key: str):
+        self._norms.clear()
+        doc = self._docs.pop(key, None)
+        if doc:
+            for term in doc["tf"]:
+                keys = self._postings.get(term)
+                if keys:
+                    keys.discard(key)
+                    if not keys:
+                        del self._postings[term]
+
+    def add(self, key: str, summary: Optional[str], description: Optional[str] = None, status: Optional[str] = None):
+        tf = Counter(terms(summary or "") * SUMMARY_WEIGHT + terms(description or ""))
+        with self._lock:
+            self._remove(key)
+            self._norms.clear()
+            self._docs[key] = {"summary": summary or "", "description": description or "", "status": status, "tf": tf}
+            for term in tf:
+                self._postings.setdefault(term, set()).add(key)
+
+    def update(self, key: str, summary: Optional[str] = None, description: Optional[str] = None,
+               status: Optional[str] = None):
+        """Re-indexes `key`, keeping whichever of its fields were not given."""
+        with self._lock:
+            doc = self._docs.get(key, {})
+            self.add(key, summary if summary is not None else doc.get("summary"),
+                     description if description is not None else doc.get("description"),
+                     status if status is not None else doc.get("status"))
+
+    def remove(self, key: str):
+        with self._lock:
+            self._remove(key)
+
+    def load(self, tickets: Iterable[dict]):
+        with self._lock:
+            self._docs.clear()
+            self._postings.clear()
+            self._norms.clear()
+            for ticket in tickets:
+                self.add(ticket["key"], ticket.get("summary"), ticket.get("description"), ticket.get("status"))
+            self._loaded_at = time.monotonic()
+        logger.info(f"Ticket similarity index loaded: {len(self._docs)} tickets, {len(self._postings)} terms")
+
+    @property
+    def ready(self) -> bool:
+        return self._loaded_at is not None
+
+    def ensure(self, loader: Callable[[], Iterable[dict]]):
+        """
+        Starts a background (re)load from `loader` when empty or older than refresh_interval,
+        and returns at once: until the first load finishes, queries find no matches.
+        """
+        now = time.monotonic()
+        with self._lock:
+            due = self._loaded_at is None or now - self._loaded_at > self.refresh_interval
+            if not due or now < self._retry_at or (self._loader and self._loader.is_alive()):
+                return
+            self._loader = threading.Thread(target=self._load_from, args=(loader,), name="ticket-similarity",
+                                            daemon=True)
+            self._loader.start()
+
+    def _load_from(self, loader: Callable[[], Iterable[dict]]):
+        try:
+            # Fetched outside the lock so queries keep serving the previous index meanwhile
+            self.load(list(loader()))
+        except Exception as e:
+            self._retry_at = time.monotonic() + 60
+            logger.warning(f"Ticket similarity load failed: {e}")
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits for a load in progress; True once the index has been loaded."""
+        loader = self._loader
+        if loader:
+            loader.join(timeout)
+        return self.ready
+
+    def on_mirror_change(self, rows: List[dict], deleted: List[str]):
+        if self._loaded_at is None:
+            return
+        for row in rows:
+            self.add(row["key"], row.get("summary"), row.get("description"), row.get("status"))
+        for key in deleted:
+            self.remove(key)
+
+    def _idf(self, term: str, total: int) -> float:
+        return math.log((total + 1) / (len(self._postings.get(term, ())) + 1)) + 1
+
+    def query(self, text: str, k: int = 5, min_score: float = 0.0,
+              exclude: Iterable[str] = ()) -> List[Dict[str, Any]]:
+        query_tf = Counter(terms(text))
+        excluded = set(exclude)
+        with self._lock:
+            total = len(self._docs)
+            weights = {t: (1 + math.log(c)) * self._idf(t, total) for t, c in query_tf.items()}
+            query_norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            candidates = set().union(*(self._postings.get(t, set()) for t in weights)) - excluded if weights else set()
+
+            scored = []
+            for key in candidates:
+                tf = self._docs[key]["tf"]
+                doc_norm = self._norms.get(key)
+                if doc_norm is None:
+                    doc_norm = math.sqrt(sum(((1 + math.log(c)) * self._idf(t, total)) ** 2
+                                             for t, c in tf.items())) or 1.0
+                    self._norms[key] = doc_norm
+                dot = sum(w * (1 + math.log(tf[t])) * self._idf(t, total) for t, w in weights.items() if t in tf)
+                score = dot / (query_norm * doc_norm)
+                if score >= min_score:
+                    scored.append((score, key))
+
+            scored.sort(key=lambda item: (-item[0], item[1]))
+            return [
+                {"key": key, "summary": self._docs[key]["summary"], "status": self._docs[key]["status"],
+                 "score": round(score, 3)}
+                for score, key in scored[:k]
+            ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"tickets": len(self._docs), "terms": len(self._postings),
+                    "loading": bool(self._loader and self._loader.is_alive()),
+                    "age_seconds": round(time.monotonic() - self._loaded_at, 1) if self._loaded_at else None}
+
+
+# Shared by JiraTools (find_similar_tickets, propose_ticket) and the mirror's change feed
+ticket_similarity = TicketSimilarityIndex()
+jira_mirror.subscribe(ticket_similarity.on_mirror_change)
@@ -0,0 +1,81 @@
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config.settings import settings
+from logging_config.logger import logger
+
+# Names agents use interchangeably for the same move; matched against transition and target status names
+SYNONYMS = [
+    {"in progress", "start progress", "start", "doing", "in development", "begin"},
+    {"done", "complete", "completed", "close", "closed", "resolve", "resolved", "finish"},
+    {"to do", "todo", "open", "reopen", "reopened", "backlog", "stop progress"},
+    {"in review", "review", "code review", "ready for review"},
+]
+
+
+def find_transition(transitions: List[dict], name: str) -> Optional[dict]:
+    """Matches `name` case-insensitively against transition names, then target statuses, then synonyms."""
+    wanted = name.strip().lower()
+    candidates = [wanted] + sorted(next((group - {wanted} for group in SYNONYMS if wanted in group), set()))
+    for candidate in candidates:
+        for t in transitions:
+            if t["name"].lower() == candidate or t.get("to", {}).get("name", "").lower() == candidate:
+                return t
+    return None
+
+
+class TransitionCache:
+    """
+    Workflow transitions per (project, current status). Workflows rarely change, so
+    update_ticket_status can usually go straight to the transition POST; JiraTools
+    refreshes an entry when a cached id is rejected.
+    """
+
+    def __init__(self, ttl: float = 3600.0):
+        self.ttl = ttl
+        self._maps: Dict[Tuple[str, str], Tuple[List[dict], float]] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "refreshes": 0}
+
+    @staticmethod
+    def _key(project: str, status: str) -> Tuple[str, str]:
+        return project.upper(), status.lower()
+
+    def get(self, project: str, status: str, loader: Callable[[], List[dict]]) -> List[dict]:
+        key = self._key(project, status)
+        with self._lock:
+            entry = self._maps.get(key)
+            if entry and time.monotonic() - entry[1] < self.ttl:
+                self._stats["hits"] += 1
+                return entry[0]
+            self._stats["misses"] += 1
+        return self.put(project, status, loader())
+
+    def put(self, project: str, status: str, transitions: List[dict]) -> List[dict]:
+        slim = [{"id": t["id"], "name": t["name"], "to": {"name": t.get("to", {}).get("name", "")}} for t in transitions]
+        with self._lock:
+            self._maps[self._key(project, status)] = (slim, time.monotonic())
+        return slim
+
+    def refresh(self, project: str, status: str, loader: Callable[[], List[dict]]) -> List[dict]:
+        with self._lock:
+            self._stats["refreshes"] += 1
+        logger.info(f"Refreshing transitions for {project.upper()} / {status}")
+        return self.put(project, status, loader())
+
+    def invalidate(self, project: Optional[str] = None):
+        with self._lock:
+            if project is None:
+                self._maps.clear()
+            else:
+                for key in [k for k in self._maps if k[0] == project.upper()]:
+                    del self._maps[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "entries": len(self._maps)}
+
+
+# Shared across agents and routes
+transition_cache = TransitionCache(ttl=settings.JIRA_TRANSITION_CACHE_TTL)